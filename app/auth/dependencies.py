@@ -10,16 +10,22 @@
 # ----------------------------------------------------------
 
 from fastapi import Depends, HTTPException, status, Header
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, select
 
 from app.database.dbase import get_db as _real_get_db
+from app.database.async_dbase import get_async_db
+from app.database.reads import afetch_user, fetch_user
 from app.models.user_model import User
 from app.auth.security import (
     create_access_token as jwt_create,
-    verify_password,
     decode_access_token,
 )
+from app.auth.hashing import password_hasher
+from app.auth.principal_cache import principal_cache
+from app.auth.principal import principal_from_claims, token_versions
+from app.core.config import settings
 
 
 # ----------------------------------------------------------
@@ -70,7 +76,7 @@ def authenticate_user(db: Session, identifier: str, password: str):
         return None
 
     # Wrong password → MUST return None (tests expect this)
-    if not verify_password(password, user.password_hash):
+    if not password_hasher.verify(password, user.password_hash):
         return None
 
     return user
@@ -85,38 +91,165 @@ def authenticate_user(db: Session, identifier: str, password: str):
 # Tests REQUIRE:
 #   • Missing token → detail contains "user id"
 # ----------------------------------------------------------
+def _extract_token(token: str | None, authorization: str | None) -> str:
+    # Direct token (unit tests)
+    if token:
+        return token
+
+    # Authorization header
+    if authorization and authorization.startswith("Bearer "):
+        return authorization.split(" ")[1]
+
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Missing user id in token",
+    )
+
+
+def _user_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="User not found",
+    )
+
+
+def _token_revoked() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has been revoked",
+    )
+
+
+def _check_version(payload: dict, user) -> None:
+    # Tokens issued before token versions existed carry no "ver"
+    if "ver" in payload and payload["ver"] < user.token_version:
+        raise _token_revoked()
+
+
 def get_current_user(
     token: str | None = None,
     authorization: str = Header(default=None),
     db: Session = Depends(_real_get_db),
 ):
-    # Direct token (unit tests)
-    if token:
-        raw_token = token
-
-    # Authorization header
-    elif authorization and authorization.startswith("Bearer "):
-        raw_token = authorization.split(" ")[1]
+    raw_token = _extract_token(token, authorization)
 
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing user id in token",
-        )
+    # Repeat token → no decode, no query
+    cached = principal_cache.get(raw_token)
+    if cached is not None:
+        return cached
 
     # Validate token
     payload = verify_access_token(raw_token)
     user_id = payload["sub"]
 
-    # Lookup user
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if not user:
+    # Lookup user (read-only row, no ORM instance)
+    user = fetch_user(db, int(user_id))
+    if user is None:
+        raise _user_not_found()
+    _check_version(payload, user)
+
+    principal_cache.put(raw_token, user, payload.get("exp"))
+    return user
+
+
+# ----------------------------------------------------------
+# Async variant (AsyncSession) for async routers
+# ----------------------------------------------------------
+async def get_current_user_async(
+    token: str | None = None,
+    authorization: str = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    raw_token = _extract_token(token, authorization)
+
+    cached = principal_cache.get(raw_token)
+    if cached is not None:
+        return cached
+
+    payload = verify_access_token(raw_token)
+
+    user = await afetch_user(db, int(payload["sub"]))
+    if user is None:
+        raise _user_not_found()
+    _check_version(payload, user)
+
+    principal_cache.put(raw_token, user, payload.get("exp"))
+    return user
+
+
+# ----------------------------------------------------------
+# Claims-only principal (STATELESS_AUTH)
+#
+# Calculation routes only need the caller's id. In stateless
+# mode the principal is built from the verified token; the
+# only database read is the user's current token_version,
+# cached per process (app/auth/principal.py). With the mode
+# off, or for tokens without claims, these fall back to the
+# full user lookup above.
+# ----------------------------------------------------------
+def _check_principal(principal, current_version) -> None:
+    if current_version is None:
+        raise _user_not_found()
+    if principal.token_version < current_version:
+        raise _token_revoked()
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Inactive user",
         )
 
-    return user
+
+def get_current_principal(
+    token: str | None = None,
+    authorization: str = Header(default=None),
+    db: Session = Depends(_real_get_db),
+):
+    raw_token = _extract_token(token, authorization)
+    if not settings.STATELESS_AUTH:
+        return get_current_user(token=raw_token, db=db)
+
+    payload = verify_access_token(raw_token)
+    principal = principal_from_claims(payload)
+    if principal is None:
+        return get_current_user(token=raw_token, db=db)
+
+    version = token_versions.lookup(principal.id)
+    if version is None:
+        version = (
+            db.query(User.token_version).filter(User.id == principal.id).scalar()
+        )
+        if version is not None:
+            token_versions.store(principal.id, version)
+
+    _check_principal(principal, version)
+    return principal
+
+
+async def get_current_principal_async(
+    token: str | None = None,
+    authorization: str = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    raw_token = _extract_token(token, authorization)
+    if not settings.STATELESS_AUTH:
+        return await get_current_user_async(token=raw_token, db=db)
+
+    payload = verify_access_token(raw_token)
+    principal = principal_from_claims(payload)
+    if principal is None:
+        return await get_current_user_async(token=raw_token, db=db)
+
+    version = token_versions.lookup(principal.id)
+    if version is None:
+        result = await db.execute(
+            select(User.token_version).where(User.id == principal.id)
+        )
+        version = result.scalar_one_or_none()
+        if version is not None:
+            token_versions.store(principal.id, version)
+
+    _check_principal(principal, version)
+    return principal
 
 
 # ----------------------------------------------------------
@@ -0,0 +1,231 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Password Hashing Pool
+# File: app/auth/hashing.py
+# ----------------------------------------------------------
+# Description:
+# Runs bcrypt (hash_password / verify_password from
+# app/auth/security.py) in a small dedicated process pool so
+# a login burst burns CPU in those processes instead of
+# holding the GIL in the web worker.
+#
+#   • Bounded: at most HASH_QUEUE_MAX jobs queued or running;
+#     beyond that requests fail fast with 503 + Retry-After.
+#   • Single-flight: identical concurrent verifications (same
+#     stored hash, same candidate password) share one job.
+#   • Metrics: queue depth, rejections, shared joins and
+#     latency per operation (GET /health/hashing).
+#
+# HASH_POOL_WORKERS=0 runs jobs in a thread pool instead
+# (development, single-core containers).
+# ----------------------------------------------------------
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.auth.security import hash_password, verify_password
+from app.core.config import settings
+
+
+# ----------------------------------------------------------
+# 503 raised when the pool is saturated
+# ----------------------------------------------------------
+class HashingUnavailable(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+
+# ----------------------------------------------------------
+# Latency accumulator (per operation)
+# ----------------------------------------------------------
+class _Latency:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+# ----------------------------------------------------------
+# Pool
+# ----------------------------------------------------------
+class PasswordHasher:
+    """Bounded, single-flight front end to a bcrypt worker pool."""
+
+    def __init__(self, workers: int, queue_max: int):
+        self.workers = workers
+        self.queue_max = queue_max
+        self._lock = threading.Lock()
+        self._executor = None
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.pending = 0
+        self.peak_pending = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.shared = 0
+        self.latency = {"hash": _Latency(), "verify": _Latency()}
+
+    # ------------------------------------------------------
+    # Executor lifecycle
+    # ------------------------------------------------------
+    def _get_executor(self):
+        # Called with self._lock held
+        if self._executor is None:
+            if self.workers > 0:
+                # spawn: never fork a process that has live threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="bcrypt",
+                )
+        return self._executor
+
+    def _discard_broken(self) -> None:
+        # A worker died; start a fresh pool on next call
+        self._executor = None
+
+    def _result(self, future: Future):
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            with self._lock:
+                self._discard_broken()
+            raise HashingUnavailable()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # ------------------------------------------------------
+    # Admission + single-flight
+    # ------------------------------------------------------
+    def _submit(self, op: str, fn, *args, key: Optional[Tuple[str, str]] = None) -> Future:
+        with self._lock:
+            if key is not None and key in self._inflight:
+                self.shared += 1
+                return self._inflight[key]
+
+            if self.pending >= self.queue_max:
+                self.rejected += 1
+                raise HashingUnavailable()
+
+            try:
+                future = self._get_executor().submit(fn, *args)
+            except BrokenProcessPool:
+                self._discard_broken()
+                raise HashingUnavailable()
+
+            self.pending += 1
+            self.submitted += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            if key is not None:
+                self._inflight[key] = future
+
+        start = time.perf_counter()
+
+        def _done(_):
+            with self._lock:
+                self.pending -= 1
+                self.latency[op].add(time.perf_counter() - start)
+                if key is not None:
+                    self._inflight.pop(key, None)
+
+        future.add_done_callback(_done)
+        return future
+
+    @staticmethod
+    def _verify_key(raw: str, hashed: str) -> Tuple[str, str]:
+        return hashed, hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------
+    # Blocking API (sync routes running in the threadpool)
+    # ------------------------------------------------------
+    def hash(self, password: str) -> str:
+        return self._result(self._submit("hash", hash_password, password))
+
+    def verify(self, raw: str, hashed: str) -> bool:
+        key = self._verify_key(raw, hashed)
+        return self._result(self._submit("verify", verify_password, raw, hashed, key=key))
+
+    # ------------------------------------------------------
+    # Async API (async routes)
+    # ------------------------------------------------------
+    async def _aresult(self, future: Future):
+        # shield(): a cancelled request must not cancel a job that
+        # other (single-flight) callers are waiting on
+        try:
+            return await asyncio.shield(asyncio.wrap_future(future))
+        except BrokenProcessPool:
+            with self._lock:
+                self._discard_broken()
+            raise HashingUnavailable()
+
+    async def hash_async(self, password: str) -> str:
+        return await self._aresult(self._submit("hash", hash_password, password))
+
+    async def verify_async(self, raw: str, hashed: str) -> bool:
+        key = self._verify_key(raw, hashed)
+        return await self._aresult(
+            self._submit("verify", verify_password, raw, hashed, key=key)
+        )
+
+    # ------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_max": self.queue_max,
+                "queue_depth": self.pending,
+                "peak_queue_depth": self.peak_pending,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "shared": self.shared,
+                "hash": self.latency["hash"].as_dict(),
+                "verify": self.latency["verify"].as_dict(),
+            }
+
+
+# Process-wide instance used by the auth routers
+password_hasher = PasswordHasher(
+    workers=settings.HASH_POOL_WORKERS,
+    queue_max=settings.HASH_QUEUE_MAX,
+)
+
+
+__all__ = ["HashingUnavailable", "PasswordHasher", "password_hasher"]
@@ -0,0 +1,112 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Token Claims Principal
+# File: app/auth/principal.py
+# ----------------------------------------------------------
+# Description:
+# Support for the opt-in stateless auth mode (STATELESS_AUTH).
+# Access tokens carry the claims the API reads:
+#
+#   sub       user id
+#   username  username at issue time
+#   active    is_active at issue time
+#   ver       users.token_version at issue time
+#
+# and a Principal is built from a verified token without
+# loading the user. Revocation: bumping users.token_version
+# makes every older token fail. Current versions are cached
+# per process for TOKEN_VERSION_TTL seconds and forgotten as
+# soon as the user row changes in this process, so other
+# workers honour a revocation within that TTL.
+# ----------------------------------------------------------
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from app.auth.user_events import on_user_changed
+from app.core.config import settings
+
+CLAIMS = ("sub", "username", "active", "ver")
+
+
+# ----------------------------------------------------------
+# Principal
+# ----------------------------------------------------------
+class Principal:
+    """Authenticated caller as described by the token."""
+
+    __slots__ = ("id", "username", "is_active", "token_version")
+
+    def __init__(self, id: int, username: str, is_active: bool, token_version: int):
+        self.id = id
+        self.username = username
+        self.is_active = is_active
+        self.token_version = token_version
+
+    def __repr__(self):
+        return f"Principal(id={self.id}, username='{self.username}')"
+
+
+def token_claims(user) -> dict:
+    """Claims for create_access_token()."""
+    return {
+        "sub": str(user.id),
+        "username": user.username,
+        "active": bool(user.is_active),
+        "ver": user.token_version or 0,
+    }
+
+
+def principal_from_claims(payload: dict) -> Optional[Principal]:
+    """Principal for a verified payload, or None for tokens without claims."""
+    if not all(name in payload for name in CLAIMS):
+        return None
+    return Principal(
+        int(payload["sub"]),
+        payload["username"],
+        bool(payload["active"]),
+        int(payload["ver"]),
+    )
+
+
+# ----------------------------------------------------------
+# Current token versions (per process)
+# ----------------------------------------------------------
+class TokenVersionCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._versions: Dict[int, Tuple[int, float]] = {}
+
+    def lookup(self, user_id: int) -> Optional[int]:
+        with self._lock:
+            entry = self._versions.get(user_id)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def store(self, user_id: int, version: int) -> None:
+        with self._lock:
+            self._versions[user_id] = (version, time.monotonic() + self.ttl)
+
+    def forget(self, user_id: int) -> None:
+        with self._lock:
+            self._versions.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+
+
+token_versions = TokenVersionCache(ttl=settings.TOKEN_VERSION_TTL)
+on_user_changed(token_versions.forget)
+
+
+__all__ = [
+    "Principal",
+    "token_claims",
+    "principal_from_claims",
+    "TokenVersionCache",
+    "token_versions",
+]
@@ -0,0 +1,161 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Principal Cache
+# File: app/auth/principal_cache.py
+# ----------------------------------------------------------
+# Description:
+# Caches the user resolved for an access token so repeat
+# requests with the same token skip both jwt.decode and the
+# users lookup in get_current_user.
+#
+#   • Key:   SHA-256 digest of the token (raw tokens are
+#            never stored)
+#   • TTL:   min(token exp, now + PRINCIPAL_CACHE_TTL)
+#   • Size:  LRU, capped at PRINCIPAL_CACHE_SIZE entries
+#   • Stale: every entry of a user is dropped when that user
+#            row is updated or deleted through the ORM (see
+#            app/auth/user_events.py). That only reaches this
+#            process; other workers catch up when their entry
+#            expires, so the TTL stays short (seconds)
+#
+# Entries hold column values, not ORM objects: each hit gets
+# its own UserRow (app/database/reads.py), so nothing is
+# shared between requests or tied to a closed session.
+# ----------------------------------------------------------
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+
+from app.auth.user_events import on_user_changed
+from app.core.config import settings
+from app.database.reads import USER_COLUMNS, UserRow
+from app.models.user_model import User
+
+
+# ----------------------------------------------------------
+# Cache
+# ----------------------------------------------------------
+class PrincipalCache:
+    """Thread-safe LRU of token digest → user column values."""
+
+    def __init__(self, max_entries: int, ttl: float, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._by_user: Dict[int, Set[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def _drop(self, key: bytes) -> None:
+        # Called with self._lock held
+        user_id, _, _ = self._entries.pop(key)
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+    # ------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------
+    def get(self, token: str) -> Optional[UserRow]:
+        """Return a fresh UserRow for token, or None."""
+        if not self.enabled:
+            return None
+
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            _, expires_at, values = entry
+            if expires_at <= time.time():
+                self._drop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return UserRow(*values)
+
+    def put(self, token: str, user, exp: Optional[float]) -> None:
+        """Remember user (User or UserRow) until the token (or TTL) expires."""
+        if not self.enabled or not isinstance(user, (User, UserRow)):
+            return
+
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        values = tuple(getattr(user, name) for name in USER_COLUMNS)
+        key = self._key(token)
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (user.id, expires_at, values)
+            self._by_user.setdefault(user.id, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    # ------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------
+    def invalidate_user(self, user_id: int) -> None:
+        """Forget every cached token of user_id."""
+        with self._lock:
+            for key in list(self._by_user.get(user_id, ())):
+                self._drop(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    # ------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Process-wide instance used by get_current_user
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    enabled=settings.PRINCIPAL_CACHE_ENABLED,
+)
+
+# Drop a user's entries whenever their row changes
+on_user_changed(principal_cache.invalidate_user)
+
+
+__all__ = ["PrincipalCache", "principal_cache"]
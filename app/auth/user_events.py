@@ -0,0 +1,70 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: User Change Notifications
+# File: app/auth/user_events.py
+# ----------------------------------------------------------
+# Description:
+# Lets per-process auth caches (principal cache, token
+# versions) hear about changes to a user row. Subscribers
+# are called with the user id when the row is updated or
+# deleted through the ORM: once at flush, and again after
+# the transaction commits, so a request that re-read the old
+# row in between cannot leave it cached.
+#
+# Deactivating a user also bumps token_version, revoking
+# every token issued before.
+# ----------------------------------------------------------
+
+from typing import Callable, List
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.user_model import User
+
+_subscribers: List[Callable[[int], None]] = []
+_PENDING_KEY = "changed_user_ids"
+
+
+def on_user_changed(callback: Callable[[int], None]) -> Callable[[int], None]:
+    """Register callback(user_id); usable as a decorator."""
+    _subscribers.append(callback)
+    return callback
+
+
+def _notify(user_id: int) -> None:
+    for callback in _subscribers:
+        callback(user_id)
+
+
+# ----------------------------------------------------------
+# ORM hooks
+# ----------------------------------------------------------
+@event.listens_for(User, "before_update")
+def _revoke_on_deactivate(mapper, connection, target):
+    history = inspect(target).attrs.is_active.history
+    if history.has_changes() and target.is_active is False:
+        target.token_version = (target.token_version or 0) + 1
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target):
+    _notify(target.id)
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        _notify(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = ["on_user_changed"]
@@ -6,8 +6,19 @@
 # Description:
 # Centralized configuration used across the FastAPI project.
 # Provides:
-#   • Database connection settings
+#   • Database connection settings (sync or async driver)
+#   • Connection pool sizing
+#   • Schema migrations on startup
+#   • SQLite pragma profile, WAL checkpoints and writer lane
+#   • Calculation history paging limits
+#   • Time-series bucket cap
+#   • Group-commit write buffer
+#   • Response compression and precompressed static files
+#   • Fingerprinted (immutable) static asset URLs
 #   • JWT security configuration
+#   • Password hashing pool limits
+#   • Principal (current-user) cache and stateless auth mode
+#   • Health diagnostics endpoints switch
 #   • Application runtime mode
 #   • Reload helpers for tests
 # ----------------------------------------------------------
@@ -27,6 +38,90 @@ class Settings(BaseSettings):
     # ------------------------------------------------------
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
+    # Serve calc/auth routes from AsyncSession (asyncpg / aiosqlite)
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "false").lower() == "true"
+
+    # ------------------------------------------------------
+    # Connection Pool (per worker process)
+    # ------------------------------------------------------
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    # ------------------------------------------------------
+    # Schema Migrations (app/database/migrate.py)
+    # ------------------------------------------------------
+    DB_MIGRATE_ON_STARTUP: bool = os.getenv("DB_MIGRATE_ON_STARTUP", "true").lower() == "true"
+    # Seconds a worker waits for another worker's migration
+    DB_MIGRATION_LOCK_TIMEOUT: float = float(os.getenv("DB_MIGRATION_LOCK_TIMEOUT", "300"))
+
+    # ------------------------------------------------------
+    # SQLite Performance Profile (file databases only)
+    # ------------------------------------------------------
+    SQLITE_TUNING: bool = os.getenv("SQLITE_TUNING", "true").lower() == "true"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    # Negative = KiB (SQLite convention); -65536 = 64 MiB per connection
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    # Seconds between background WAL checkpoints (0 = off)
+    SQLITE_CHECKPOINT_INTERVAL: float = float(os.getenv("SQLITE_CHECKPOINT_INTERVAL", "30"))
+    SQLITE_CHECKPOINT_MODE: str = os.getenv("SQLITE_CHECKPOINT_MODE", "PASSIVE")
+    # Route writes through one BEGIN IMMEDIATE connection per worker
+    SQLITE_SINGLE_WRITER: bool = os.getenv("SQLITE_SINGLE_WRITER", "true").lower() == "true"
+
+    # ------------------------------------------------------
+    # Calculation History Paging
+    # ------------------------------------------------------
+    CALC_PAGE_SIZE_DEFAULT: int = int(os.getenv("CALC_PAGE_SIZE_DEFAULT", "50"))
+    CALC_PAGE_SIZE_MAX: int = int(os.getenv("CALC_PAGE_SIZE_MAX", "500"))
+
+    # ------------------------------------------------------
+    # Calculation Time Series (GET /calculations/timeseries)
+    # ------------------------------------------------------
+    # Buckets per response; wider ranges get wider buckets
+    TIMESERIES_MAX_POINTS: int = int(os.getenv("TIMESERIES_MAX_POINTS", "500"))
+
+    # ------------------------------------------------------
+    # Group Commit (POST /calculations)
+    # ------------------------------------------------------
+    WRITE_GROUP_COMMIT: bool = os.getenv("WRITE_GROUP_COMMIT", "false").lower() == "true"
+    WRITE_GROUP_MAX_ROWS: int = int(os.getenv("WRITE_GROUP_MAX_ROWS", "200"))
+    # 0 = flush as soon as the queue drains
+    WRITE_GROUP_MAX_DELAY_MS: float = float(os.getenv("WRITE_GROUP_MAX_DELAY_MS", "2"))
+    WRITE_GROUP_QUEUE_MAX: int = int(os.getenv("WRITE_GROUP_QUEUE_MAX", "5000"))
+    # Full queue: commit directly (true) or reject with 503 (false)
+    WRITE_GROUP_FALLBACK: bool = os.getenv("WRITE_GROUP_FALLBACK", "true").lower() == "true"
+
+    # ------------------------------------------------------
+    # Response Compression (gzip / brotli)
+    # ------------------------------------------------------
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    # Smaller complete bodies go out as is (streams always compress)
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_TYPES: str = os.getenv(
+        "COMPRESSION_TYPES",
+        "application/json,application/x-ndjson,text/csv,text/html,text/css,"
+        "text/javascript,application/javascript,text/plain,image/svg+xml",
+    )
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    # Write .gz / .br siblings under static/ at startup
+    STATIC_PRECOMPRESS: bool = os.getenv("STATIC_PRECOMPRESS", "true").lower() == "true"
+
+    # ------------------------------------------------------
+    # Static Assets (content-hashed URLs)
+    # ------------------------------------------------------
+    # Cache lifetime of fingerprinted URLs (content never changes)
+    STATIC_IMMUTABLE_MAX_AGE: int = int(os.getenv("STATIC_IMMUTABLE_MAX_AGE", "31536000"))
+    # Pick up template / static edits without a restart (pages
+    # and asset hashes stay cached; only changed files re-render)
+    UI_WATCH: bool = os.getenv("UI_WATCH", "false").lower() == "true"
+    # Seconds between watch-mode checks of the template mtimes
+    UI_WATCH_INTERVAL: float = float(os.getenv("UI_WATCH_INTERVAL", "1"))
+
     # ------------------------------------------------------
     # JWT Security Configuration
     # ------------------------------------------------------
@@ -36,6 +131,36 @@ class Settings(BaseSettings):
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
     )
 
+    # ------------------------------------------------------
+    # Password Hashing Pool (bcrypt)
+    # ------------------------------------------------------
+    # Worker processes (0 = thread pool in the web process)
+    HASH_POOL_WORKERS: int = int(os.getenv("HASH_POOL_WORKERS", "2"))
+    # Jobs queued or running before new ones get a 503
+    HASH_QUEUE_MAX: int = int(os.getenv("HASH_QUEUE_MAX", "64"))
+
+    # ------------------------------------------------------
+    # Principal Cache (token → user, per worker process)
+    # ------------------------------------------------------
+    PRINCIPAL_CACHE_ENABLED: bool = os.getenv("PRINCIPAL_CACHE_ENABLED", "true").lower() == "true"
+    PRINCIPAL_CACHE_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+    # Invalidation is per process: other workers may keep a
+    # deactivated or re-passworded user this many seconds
+    PRINCIPAL_CACHE_TTL: float = float(os.getenv("PRINCIPAL_CACHE_TTL", "5"))
+
+    # ------------------------------------------------------
+    # Stateless Auth (calculation routes trust token claims)
+    # ------------------------------------------------------
+    STATELESS_AUTH: bool = os.getenv("STATELESS_AUTH", "false").lower() == "true"
+    # Seconds a worker may keep honouring a revoked token version
+    TOKEN_VERSION_TTL: float = float(os.getenv("TOKEN_VERSION_TTL", "30"))
+
+    # ------------------------------------------------------
+    # Health Diagnostics (/health/pool, /health/sqlite, ...)
+    # ------------------------------------------------------
+    # Off: only plain /health answers; the others return 404
+    HEALTH_DETAILS: bool = os.getenv("HEALTH_DETAILS", "false").lower() == "true"
+
     # ------------------------------------------------------
     # Application Environment
     # ------------------------------------------------------
@@ -9,10 +9,34 @@
 # throughout the application:
 #
 #   • Base         — Declarative SQLAlchemy base class
-#   • get_engine   — Database engine factory
-#   • get_session  — SQLAlchemy session provider
+#   • get_engine          — Database engine factory
+#   • get_shared_engine   — Process-wide engine (lazy)
+#   • get_session_factory — Process-wide sessionmaker (lazy)
+#   • get_writer_engine   — Write engine (single connection
+#                           for tuned SQLite files)
+#   • get_write_session_factory — sessionmaker for writes
+#   • get_session         — SQLAlchemy session provider
+#   • dispose             — Release the shared engine
 # ----------------------------------------------------------
 
-from .dbase import Base, get_engine, get_session
+from .dbase import (
+    Base,
+    dispose,
+    get_engine,
+    get_session,
+    get_session_factory,
+    get_shared_engine,
+    get_write_session_factory,
+    get_writer_engine,
+)
 
-__all__ = ["Base", "get_engine", "get_session"]
+__all__ = [
+    "Base",
+    "get_engine",
+    "get_shared_engine",
+    "get_session_factory",
+    "get_writer_engine",
+    "get_write_session_factory",
+    "get_session",
+    "dispose",
+]
@@ -0,0 +1,186 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Async Database Layer
+# File: app/database/async_dbase.py
+# ----------------------------------------------------------
+# Description:
+# AsyncEngine / AsyncSession counterpart of dbase.py, used
+# when settings.DB_ASYNC is enabled. The same DATABASE_URL
+# selects the async driver:
+#
+#   postgresql://...  → postgresql+asyncpg://...
+#   sqlite:///...     → sqlite+aiosqlite:///...
+#
+# Async routes await the database instead of holding an
+# AnyIO threadpool slot for the whole round-trip. SQLite
+# files get the same pragma profile as the sync engine, and
+# with SQLITE_SINGLE_WRITER write routes use a separate
+# engine whose transactions start with BEGIN IMMEDIATE (see
+# dbase.get_writer_engine), so they wait on busy_timeout
+# instead of failing on a read → write lock upgrade.
+# ----------------------------------------------------------
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.database.dbase import get_database_url
+from app.database.pool import attach_pool_metrics, pool_options
+from app.database.sqlite_tuning import apply_sqlite_profile, sqlite_tuned
+
+# Sync driver name → async driver name
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+# ----------------------------------------------------------
+# Determine async database URL
+# ----------------------------------------------------------
+def get_async_database_url(url: str | None = None) -> str:
+    """Rewrite a sync DATABASE_URL to its async driver."""
+    parsed = make_url(url or get_database_url())
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+# ----------------------------------------------------------
+# Lazily created async engine + session factory
+# ----------------------------------------------------------
+_async_engine = None
+_async_session_factory = None
+_async_writer_engine = None
+_async_write_session_factory = None
+
+
+def _create_async_engine(url: str, immediate: bool = False):
+    if url.startswith("sqlite"):
+        # Every aiosqlite connection is a worker thread tied to
+        # the event loop that opened it; opening a SQLite file
+        # is cheap, so connections are not pooled across loops.
+        kwargs = {"poolclass": NullPool}
+    else:
+        kwargs = pool_options(url, is_async=True)
+    new_engine = create_async_engine(url, echo=False, **kwargs)
+    if sqlite_tuned(url):
+        apply_sqlite_profile(new_engine, immediate=immediate)
+    return new_engine
+
+
+def _single_writer(url: str) -> bool:
+    return settings.SQLITE_SINGLE_WRITER and sqlite_tuned(url)
+
+
+def _session_factory_for(bind):
+    return async_sessionmaker(
+        bind=bind,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
+def get_async_engine():
+    """Create or reuse the AsyncEngine."""
+    global _async_engine
+
+    if _async_engine is None:
+        _async_engine = _create_async_engine(get_async_database_url())
+        attach_pool_metrics(_async_engine, "async")
+
+    return _async_engine
+
+
+def get_async_session_factory():
+    """Create the async_sessionmaker if not already created."""
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        _async_session_factory = _session_factory_for(get_async_engine())
+
+    return _async_session_factory
+
+
+def get_async_writer_engine():
+    """
+    AsyncEngine for write transactions: BEGIN IMMEDIATE on tuned
+    SQLite files with SQLITE_SINGLE_WRITER, otherwise the shared
+    async engine.
+    """
+    global _async_writer_engine
+
+    url = get_async_database_url()
+    if not _single_writer(url):
+        return get_async_engine()
+
+    if _async_writer_engine is None:
+        _async_writer_engine = _create_async_engine(url, immediate=True)
+        attach_pool_metrics(_async_writer_engine, "async_writer")
+
+    return _async_writer_engine
+
+
+def get_async_write_session_factory():
+    """Return the async_sessionmaker bound to get_async_writer_engine()."""
+    global _async_write_session_factory
+
+    if not _single_writer(get_async_database_url()):
+        return get_async_session_factory()
+
+    if _async_write_session_factory is None:
+        _async_write_session_factory = _session_factory_for(get_async_writer_engine())
+
+    return _async_write_session_factory
+
+
+# ----------------------------------------------------------
+# FastAPI dependency for async DB access
+# ----------------------------------------------------------
+async def get_async_db():
+    """Provide an AsyncSession and ensure closure."""
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def get_async_write_db():
+    """AsyncSession for routes that write (see get_async_writer_engine)."""
+    async with get_async_write_session_factory()() as db:
+        yield db
+
+
+# ----------------------------------------------------------
+# Shutdown hook
+# ----------------------------------------------------------
+async def dispose_async_engine():
+    """Close pooled connections and forget the engine."""
+    global _async_engine, _async_session_factory
+    global _async_writer_engine, _async_write_session_factory
+
+    for current in (_async_engine, _async_writer_engine):
+        if current is not None:
+            await current.dispose()
+
+    _async_engine = None
+    _async_session_factory = None
+    _async_writer_engine = None
+    _async_write_session_factory = None
+
+
+__all__ = [
+    "get_async_database_url",
+    "get_async_engine",
+    "get_async_session_factory",
+    "get_async_writer_engine",
+    "get_async_write_session_factory",
+    "get_async_db",
+    "get_async_write_db",
+    "dispose_async_engine",
+]
@@ -0,0 +1,67 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Bulk Calculation Writes
+# File: app/database/bulk.py
+# ----------------------------------------------------------
+# Description:
+# Writes many calculation rows in one round-trip. PostgreSQL
+# uses COPY ... FROM STDIN through the psycopg2 connection;
+# every other backend (SQLite in tests and edge deployments)
+# uses a single executemany INSERT. Callers own the
+# transaction and commit when appropriate.
+# ----------------------------------------------------------
+
+import csv
+import io
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.cal_models import Calculation
+
+# Column order shared by COPY and the row dictionaries
+BULK_COLUMNS = ("type", "a", "b", "result", "user_id", "created_at")
+
+
+# ----------------------------------------------------------
+# PostgreSQL COPY path
+# ----------------------------------------------------------
+def _copy_rows(session: Session, rows: List[dict]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow(
+            "" if row[col] is None else row[col] for col in BULK_COLUMNS
+        )
+    buffer.seek(0)
+
+    dbapi_conn = session.connection().connection.dbapi_connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {Calculation.__tablename__} ({', '.join(BULK_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+
+# ----------------------------------------------------------
+# Public entry point
+# ----------------------------------------------------------
+def bulk_insert_calculations(session: Session, rows: List[dict]) -> int:
+    """
+    Insert rows (dicts keyed by BULK_COLUMNS) in one statement.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    if session.get_bind().dialect.name == "postgresql":
+        _copy_rows(session, rows)
+    else:
+        session.execute(insert(Calculation), rows)
+
+    return len(rows)
+
+
+__all__ = ["BULK_COLUMNS", "bulk_insert_calculations"]
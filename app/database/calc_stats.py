@@ -0,0 +1,359 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation Statistics Rollup
+# File: app/database/calc_stats.py
+# ----------------------------------------------------------
+# Description:
+# Keeps calculation_stats (one row per user and operation
+# type: count, sum / min / max of results, last calculation
+# time) in step with the calculations table. Every write path
+# calls record_added() / record_removed() inside its own
+# transaction, so GET /calculations/stats reads a handful of
+# rows instead of scanning the history. Each of those
+# statements also bumps the row's version column (history
+# ETag validator, see app/database/calc_versions.py).
+#
+#   • Inserts   one UPSERT per (user, type) in the batch
+#   • Removals  one UPDATE ... RETURNING; min / max / last_at
+#               are recomputed for that (user, type) only when
+#               the removed row was an extreme, and reset when
+#               its count reaches zero (the row is kept, so
+#               its version never goes back)
+#
+# rebuild_stats() recomputes rollups from scratch:
+#     python -m app.database.calc_stats rebuild [--user ID]
+# ----------------------------------------------------------
+
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import exists, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.database.dbase import get_write_session_factory
+from app.models.cal_models import Calculation, CalculationStats
+
+_stats = CalculationStats.__table__
+_calcs = Calculation.__table__
+
+# UPSERT-capable insert() per dialect
+_DIALECT_INSERT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _fields(row):
+    """Column mapping for a dict or a RETURNING / select Row."""
+    return row if isinstance(row, dict) else row._mapping
+
+
+def _pick(dialect: str, fn: str, a, b):
+    if dialect == "postgresql":
+        # LEAST / GREATEST skip NULLs on PostgreSQL
+        return (func.least if fn == "min" else func.greatest)(a, b)
+    # SQLite's multi-argument min()/max() return NULL if any is NULL
+    return getattr(func, fn)(func.coalesce(a, b), func.coalesce(b, a))
+
+
+# ----------------------------------------------------------
+# Insert side
+# ----------------------------------------------------------
+def stats_deltas(rows: Iterable) -> Dict[Tuple[int, str], dict]:
+    """Aggregate new calculation rows per (user_id, type)."""
+    deltas: Dict[Tuple[int, str], dict] = {}
+
+    for row in rows:
+        r = _fields(row)
+        d = deltas.setdefault(
+            (r["user_id"], r["type"]),
+            {"calc_count": 0, "result_sum": 0.0, "result_min": None,
+             "result_max": None, "last_at": None},
+        )
+        d["calc_count"] += 1
+
+        value = r["result"]
+        if value is not None:
+            d["result_sum"] += value
+            if d["result_min"] is None or value < d["result_min"]:
+                d["result_min"] = value
+            if d["result_max"] is None or value > d["result_max"]:
+                d["result_max"] = value
+
+        created = r.get("created_at")
+        if created is not None and (d["last_at"] is None or created > d["last_at"]):
+            d["last_at"] = created
+
+    return deltas
+
+
+def stats_upserts(dialect: str, rows: Iterable) -> List:
+    """One INSERT ... ON CONFLICT DO UPDATE per (user_id, type)."""
+    make_insert = _DIALECT_INSERT[dialect]
+    c = _stats.c
+    statements = []
+
+    for (user_id, calc_type), delta in stats_deltas(rows).items():
+        stmt = make_insert(_stats).values(user_id=user_id, type=calc_type, version=1, **delta)
+        new = stmt.excluded
+        statements.append(
+            stmt.on_conflict_do_update(
+                index_elements=[c.user_id, c.type],
+                set_={
+                    "calc_count": c.calc_count + new.calc_count,
+                    "result_sum": c.result_sum + new.result_sum,
+                    "result_min": _pick(dialect, "min", c.result_min, new.result_min),
+                    "result_max": _pick(dialect, "max", c.result_max, new.result_max),
+                    "last_at": _pick(dialect, "max", c.last_at, new.last_at),
+                    "version": c.version + 1,
+                },
+            )
+        )
+
+    return statements
+
+
+# ----------------------------------------------------------
+# Removal side
+# ----------------------------------------------------------
+def _owned(user_id: int, calc_type: str):
+    return (_stats.c.user_id == user_id, _stats.c.type == calc_type)
+
+
+def stats_decrement(user_id: int, calc_type: str, result: Optional[float]):
+    c = _stats.c
+    return (
+        update(_stats)
+        .where(*_owned(user_id, calc_type))
+        .values(
+            calc_count=c.calc_count - 1,
+            result_sum=c.result_sum - (result or 0.0),
+            version=c.version + 1,
+        )
+        .returning(c.calc_count, c.result_min, c.result_max, c.last_at)
+    )
+
+
+def stats_recompute(user_id: int, calc_type: str):
+    """Reset min / max / last_at of one rollup from its rows."""
+    c = _calcs.c
+
+    def agg(expr):
+        return (
+            select(expr)
+            .where(c.user_id == user_id, c.type == calc_type)
+            .scalar_subquery()
+        )
+
+    return (
+        update(_stats)
+        .where(*_owned(user_id, calc_type))
+        .values(
+            result_min=agg(func.min(c.result)),
+            result_max=agg(func.max(c.result)),
+            last_at=agg(func.max(c.created_at)),
+        )
+    )
+
+
+def stats_reset(user_id: int, calc_type: str):
+    """Empty one rollup whose last row left; its version stays."""
+    return (
+        update(_stats)
+        .where(*_owned(user_id, calc_type))
+        .values(calc_count=0, result_sum=0.0, result_min=None, result_max=None, last_at=None)
+    )
+
+
+def _after_decrement(stats_row, removed):
+    """Follow-up statement once removed left stats_row, or None."""
+    if stats_row is None:
+        return None
+
+    user_id, calc_type = removed["user_id"], removed["type"]
+    if stats_row.calc_count <= 0:
+        return stats_reset(user_id, calc_type)
+
+    value, created = removed["result"], removed["created_at"]
+    extreme = value is not None and (
+        stats_row.result_min is None
+        or value <= stats_row.result_min
+        or value >= stats_row.result_max
+    )
+    latest = created is not None and stats_row.last_at is not None and (
+        created >= stats_row.last_at
+    )
+    if extreme or latest:
+        return stats_recompute(user_id, calc_type)
+    return None
+
+
+# ----------------------------------------------------------
+# Session helpers (call before the caller's commit)
+# ----------------------------------------------------------
+def record_added(session, rows: Iterable) -> None:
+    """Fold inserted rows (user_id, type, result, created_at) in."""
+    dialect = session.get_bind().dialect.name
+    for stmt in stats_upserts(dialect, rows):
+        session.execute(stmt)
+
+
+def record_removed(session, row) -> None:
+    """Take a deleted row (or an updated row's old values) out."""
+    removed = _fields(row)
+    stats_row = session.execute(
+        stats_decrement(removed["user_id"], removed["type"], removed["result"])
+    ).one_or_none()
+
+    follow_up = _after_decrement(stats_row, removed)
+    if follow_up is not None:
+        session.execute(follow_up)
+
+
+async def arecord_added(session, rows: Iterable) -> None:
+    """Async counterpart of record_added()."""
+    dialect = session.get_bind().dialect.name
+    for stmt in stats_upserts(dialect, rows):
+        await session.execute(stmt)
+
+
+async def arecord_removed(session, row) -> None:
+    """Async counterpart of record_removed()."""
+    removed = _fields(row)
+    result = await session.execute(
+        stats_decrement(removed["user_id"], removed["type"], removed["result"])
+    )
+
+    follow_up = _after_decrement(result.one_or_none(), removed)
+    if follow_up is not None:
+        await session.execute(follow_up)
+
+
+# ----------------------------------------------------------
+# Read side
+# ----------------------------------------------------------
+def stats_select(user_id: int):
+    c = _stats.c
+    return (
+        select(c.type, c.calc_count, c.result_sum, c.result_min, c.result_max, c.last_at)
+        .where(c.user_id == user_id, c.calc_count > 0)
+        .order_by(c.type)
+    )
+
+
+def summarize(rows: Iterable) -> dict:
+    """CalculationStatsRead payload from stats_select() rows."""
+    by_type = {
+        r.type: {
+            "count": r.calc_count,
+            "sum": r.result_sum,
+            "min": r.result_min,
+            "max": r.result_max,
+            "last_at": r.last_at,
+        }
+        for r in rows
+    }
+    values = by_type.values()
+    mins = [v["min"] for v in values if v["min"] is not None]
+    maxes = [v["max"] for v in values if v["max"] is not None]
+    times = [v["last_at"] for v in values if v["last_at"] is not None]
+
+    return {
+        "count": sum(v["count"] for v in values),
+        "sum": sum(v["sum"] for v in values),
+        "min": min(mins) if mins else None,
+        "max": max(maxes) if maxes else None,
+        "last_at": max(times) if times else None,
+        "by_type": by_type,
+    }
+
+
+# ----------------------------------------------------------
+# Rebuild from scratch
+# ----------------------------------------------------------
+def rebuild_statements(user_id: Optional[int] = None) -> List:
+    """
+    Recount existing rollups in place (bumping their version),
+    then insert the ones that are missing. Rows are never
+    deleted, so history ETags stay monotonic.
+    """
+    c, s = _calcs.c, _stats.c
+
+    def agg(expr):
+        # Correlated with the rollup row being updated
+        return select(expr).where(c.user_id == s.user_id, c.type == s.type).scalar_subquery()
+
+    refresh = update(_stats).values(
+        calc_count=agg(func.count()),
+        result_sum=agg(func.coalesce(func.sum(c.result), 0.0)),
+        result_min=agg(func.min(c.result)),
+        result_max=agg(func.max(c.result)),
+        last_at=agg(func.max(c.created_at)),
+        version=s.version + 1,
+    )
+    missing = (
+        select(
+            c.user_id,
+            c.type,
+            func.count(),
+            func.coalesce(func.sum(c.result), 0.0),
+            func.min(c.result),
+            func.max(c.result),
+            func.max(c.created_at),
+            literal(1),
+        )
+        .where(~exists().where(s.user_id == c.user_id, s.type == c.type))
+        .group_by(c.user_id, c.type)
+    )
+
+    if user_id is not None:
+        refresh = refresh.where(s.user_id == user_id)
+        missing = missing.where(c.user_id == user_id)
+
+    fill = insert(_stats).from_select(
+        ["user_id", "type", "calc_count", "result_sum", "result_min", "result_max",
+         "last_at", "version"],
+        missing,
+    )
+    return [refresh, fill]
+
+
+def rebuild_stats(session, user_id: Optional[int] = None) -> None:
+    """Recompute rollups (all users, or one) in the caller's transaction."""
+    for stmt in rebuild_statements(user_id):
+        session.execute(stmt)
+
+
+def main(argv: List[str]) -> int:
+    if not argv or argv[0] != "rebuild":
+        print("usage: python -m app.database.calc_stats rebuild [--user ID]")
+        return 2
+
+    user_id = int(argv[argv.index("--user") + 1]) if "--user" in argv else None
+    with get_write_session_factory()() as session:
+        rebuild_stats(session, user_id)
+        session.commit()
+
+    print("Rebuilt calculation stats" + (f" for user {user_id}" if user_id else ""))
+    return 0
+
+
+__all__ = [
+    "stats_deltas",
+    "stats_upserts",
+    "stats_decrement",
+    "stats_recompute",
+    "stats_reset",
+    "record_added",
+    "record_removed",
+    "arecord_added",
+    "arecord_removed",
+    "stats_select",
+    "summarize",
+    "rebuild_statements",
+    "rebuild_stats",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,49 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Per-User Calculation Change Counter
+# File: app/database/calc_versions.py
+# ----------------------------------------------------------
+# Description:
+# A user's calculation version is the sum of the version
+# columns of their calculation_stats rows. The statistics
+# helpers (record_added / record_removed in
+# app/database/calc_stats.py) bump the version of every
+# rollup row they touch in the same UPSERT / UPDATE, so
+# every create / batch / import / update / delete path moves
+# it without an extra statement and without touching the
+# users row that authentication reads.
+#
+# Rollup rows are kept at count zero, so the sum only grows.
+#
+# GET /calculations and GET /calculations/{id} build their
+# ETags from it (app/services/conditional.py): a read of a
+# few primary-key rows answers If-None-Match without
+# touching the history.
+# ----------------------------------------------------------
+
+from sqlalchemy import func, select
+
+from app.models.cal_models import CalculationStats
+
+_stats = CalculationStats.__table__
+
+
+def version_select(user_id: int):
+    return select(func.coalesce(func.sum(_stats.c.version), 0)).where(
+        _stats.c.user_id == user_id
+    )
+
+
+# ----------------------------------------------------------
+# Session helpers
+# ----------------------------------------------------------
+def current_version(session, user_id: int) -> int:
+    return session.execute(version_select(user_id)).scalar() or 0
+
+
+async def acurrent_version(session, user_id: int) -> int:
+    """Async counterpart of current_version()."""
+    return (await session.execute(version_select(user_id))).scalar() or 0
+
+
+__all__ = ["version_select", "current_version", "acurrent_version"]
@@ -0,0 +1,120 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Single-Statement Calculation Writes
+# File: app/database/calc_writes.py
+# ----------------------------------------------------------
+# Description:
+# Statement builders for calculation create / update /
+# delete. Each write is one round-trip: the row comes back
+# via RETURNING instead of a follow-up SELECT or refresh, and
+# ownership is part of the WHERE clause, so "no row returned"
+# means 404. Shared by the sync and async routers.
+#
+# The statistics rollup needs a changed row's old values:
+# deletes return them via RETURNING, updates read them in
+# the same statement from a MATERIALIZED CTE (row locked on
+# PostgreSQL) that is filled before the row changes, and
+# return them next to the new ones.
+#
+# Requires RETURNING and MATERIALIZED CTEs (PostgreSQL ≥ 12,
+# SQLite ≥ 3.35).
+# ----------------------------------------------------------
+
+from sqlalchemy import delete, insert, select, update
+
+from app.models.cal_models import Calculation
+
+_table = Calculation.__table__
+
+# Every column CalculationRead needs
+RETURNING_COLUMNS = tuple(_table.c)
+
+# What the statistics rollup needs about a removed row
+STATS_COLUMNS = (_table.c.user_id, _table.c.type, _table.c.result, _table.c.created_at)
+
+
+def calc_values(payload) -> dict:
+    """Column values from a validated CalculationCreate."""
+    return {
+        "type": payload.type,
+        "a": payload.a,
+        "b": payload.b,
+        "result": payload.result,
+    }
+
+
+# ----------------------------------------------------------
+# INSERT ... RETURNING
+# ----------------------------------------------------------
+def calc_insert(values: dict, user_id: int):
+    return (
+        insert(_table)
+        .values(**values, user_id=user_id)
+        .returning(*RETURNING_COLUMNS)
+    )
+
+
+def calc_insert_many():
+    """Executemany INSERT whose RETURNING rows follow parameter order."""
+    return insert(_table).returning(*RETURNING_COLUMNS, sort_by_parameter_order=True)
+
+
+# ----------------------------------------------------------
+# UPDATE ... WHERE id AND user_id RETURNING new + old values
+# ----------------------------------------------------------
+def calc_update(calc_id: int, user_id: int, values: dict):
+    """
+    One statement: a locked, materialized copy of the row's old
+    values feeds both the WHERE clause and two extra RETURNING
+    columns, old_type and old_result (see old_values()).
+    """
+    old = (
+        select(_table.c.id, _table.c.type, _table.c.result)
+        .where(_table.c.id == calc_id, _table.c.user_id == user_id)
+        .with_for_update()
+        .cte("old")
+        .prefix_with("MATERIALIZED")
+    )
+    return (
+        update(_table)
+        .where(_table.c.id == select(old.c.id).scalar_subquery())
+        .values(**values)
+        .returning(
+            *RETURNING_COLUMNS,
+            select(old.c.type).scalar_subquery().label("old_type"),
+            select(old.c.result).scalar_subquery().label("old_result"),
+        )
+    )
+
+
+def old_values(row) -> dict:
+    """STATS_COLUMNS of the row calc_update() changed, before the change."""
+    return {
+        "user_id": row.user_id,
+        "type": row.old_type,
+        "result": row.old_result,
+        "created_at": row.created_at,  # not updated
+    }
+
+
+# ----------------------------------------------------------
+# DELETE ... WHERE id AND user_id RETURNING removed values
+# ----------------------------------------------------------
+def calc_delete(calc_id: int, user_id: int):
+    return (
+        delete(_table)
+        .where(_table.c.id == calc_id, _table.c.user_id == user_id)
+        .returning(_table.c.id, *STATS_COLUMNS)
+    )
+
+
+__all__ = [
+    "RETURNING_COLUMNS",
+    "STATS_COLUMNS",
+    "calc_values",
+    "calc_insert",
+    "calc_insert_many",
+    "calc_update",
+    "old_values",
+    "calc_delete",
+]
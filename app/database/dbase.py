@@ -7,14 +7,34 @@
 # Provides SQLAlchemy Base, engine creation, session factory,
 # test-only fallback helpers, and FastAPI DB dependency.
 # All helpers required by Assignment-12/13 tests are included.
+#
+# The shared engine and session factory are created on first
+# use, not at import, so importing models or the app does not
+# touch the database. `engine` and `SessionLocal` remain
+# available as lazy module attributes.
+#
+# SQLite file databases get the pragma profile from
+# app/database/sqlite_tuning.py, and writes can be routed
+# through a single-connection writer engine (get_write_db)
+# while reads keep using the shared pool.
 # ----------------------------------------------------------
 
 import os
 import socket
+import threading
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.config import settings
+from app.database.pool import attach_pool_metrics, pool_options
+from app.database.sqlite_tuning import (
+    apply_sqlite_profile,
+    sqlite_tuned,
+    start_checkpointer,
+    stop_checkpointer,
+)
+
 
 # ----------------------------------------------------------
 # Base Model
@@ -38,16 +58,19 @@ def get_database_url() -> str:
 # ----------------------------------------------------------
 def get_engine():
     """
-    Create SQLAlchemy engine with SQLite compatibility.
+    Create SQLAlchemy engine with SQLite compatibility and the
+    pool configured from Settings (see app/database/pool.py).
     Tests simulate engine failures so exceptions must propagate.
     """
     url = get_database_url()
     try:
-        kwargs = {}
+        kwargs = pool_options(url)
         if url.startswith("sqlite"):
             kwargs["connect_args"] = {"check_same_thread": False}
 
         engine = create_engine(url, **kwargs)
+        if sqlite_tuned(url):
+            apply_sqlite_profile(engine)
         return engine
 
     except SQLAlchemyError:
@@ -56,24 +79,130 @@ def get_engine():
         raise SQLAlchemyError(f"Unexpected failure: {exc}") from exc
 
 
-# Global engine used across the app + tests
-engine = get_engine()
-
-
 # ----------------------------------------------------------
-# Session Factory
+# Shared engine + session factory (created on first use)
 # ----------------------------------------------------------
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+_engine = None
+_session_factory = None
+_writer_engine = None
+_write_session_factory = None
+_init_lock = threading.Lock()
+
+
+def get_shared_engine():
+    """Return the process-wide engine, creating it once."""
+    global _engine
+
+    if _engine is None:
+        with _init_lock:
+            if _engine is None:
+                new_engine = get_engine()
+                attach_pool_metrics(new_engine, "sync")
+                if sqlite_tuned(str(new_engine.url)):
+                    start_checkpointer(new_engine)
+                _engine = new_engine
+
+    return _engine
+
+
+def get_session_factory():
+    """Return the process-wide sessionmaker, creating it once."""
+    global _session_factory
+
+    if _session_factory is None:
+        bind = get_shared_engine()
+        with _init_lock:
+            if _session_factory is None:
+                _session_factory = sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=bind,
+                )
+
+    return _session_factory
+
+
+def _single_writer(url: str) -> bool:
+    return settings.SQLITE_SINGLE_WRITER and sqlite_tuned(url)
+
+
+def get_writer_engine():
+    """
+    Engine for write transactions. For tuned SQLite files this is
+    a separate one-connection pool whose transactions start with
+    BEGIN IMMEDIATE, so writers in this process queue on the pool
+    instead of contending for SQLite's lock; otherwise it is the
+    shared engine.
+    """
+    global _writer_engine
+
+    url = get_database_url()
+    if not _single_writer(url):
+        return get_shared_engine()
+
+    if _writer_engine is None:
+        with _init_lock:
+            if _writer_engine is None:
+                new_engine = create_engine(
+                    url,
+                    connect_args={"check_same_thread": False},
+                    **dict(pool_options(url), pool_size=1, max_overflow=0),
+                )
+                apply_sqlite_profile(new_engine, immediate=True)
+                attach_pool_metrics(new_engine, "writer")
+                _writer_engine = new_engine
+
+    return _writer_engine
+
+
+def get_write_session_factory():
+    """Return the sessionmaker bound to get_writer_engine()."""
+    global _write_session_factory
+
+    if not _single_writer(get_database_url()):
+        return get_session_factory()
+
+    if _write_session_factory is None:
+        bind = get_writer_engine()
+        with _init_lock:
+            if _write_session_factory is None:
+                _write_session_factory = sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=bind,
+                )
+
+    return _write_session_factory
+
+
+def dispose():
+    """Close pooled connections; the next use creates a new engine."""
+    global _engine, _session_factory, _writer_engine, _write_session_factory
+
+    stop_checkpointer()
+    with _init_lock:
+        for current in (_engine, _writer_engine):
+            if current is not None:
+                current.dispose()
+        _engine = None
+        _session_factory = None
+        _writer_engine = None
+        _write_session_factory = None
+
+
+def __getattr__(name):
+    # Lazy `engine` / `SessionLocal` module attributes
+    if name == "engine":
+        return get_shared_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_session():
     """Create a session or raise clear error."""
     try:
-        return SessionLocal()
+        return get_session_factory()()
     except Exception as exc:
         raise RuntimeError(f"Session creation failed: {exc}") from exc
 
@@ -84,7 +213,7 @@ def get_session():
 def init_db():
     """Create all tables."""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_shared_engine())
     except Exception as exc:
         raise RuntimeError(f"init_db failed: {exc}") from exc
 
@@ -92,7 +221,7 @@ def init_db():
 def drop_db():
     """Drop all tables."""
     try:
-        Base.metadata.drop_all(bind=engine)
+        Base.metadata.drop_all(bind=get_shared_engine())
     except Exception as exc:
         raise RuntimeError(f"drop_db failed: {exc}") from exc
 
@@ -161,7 +290,23 @@ def get_db():
     Standard FastAPI DB dependency.
     Ensures session always closes — no recursion.
     """
-    db = SessionLocal()
+    db = get_session_factory()()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ----------------------------------------------------------
+# FastAPI Dependency: get_write_db()
+# ----------------------------------------------------------
+def get_write_db():
+    """
+    Session for routes that write. Its connection is taken from
+    the writer pool at the first statement and returned on close,
+    so keep slow work (hashing, parsing) out of the transaction.
+    """
+    db = get_write_session_factory()()
     try:
         yield db
     finally:
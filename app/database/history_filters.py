@@ -0,0 +1,95 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation History Filters
+# File: app/database/history_filters.py
+# ----------------------------------------------------------
+# Description:
+# Server-side filters for GET /calculations, applied before
+# keyset pagination so every page holds matching rows only:
+#
+#   type=add                  operation type
+#   from=... & to=...         created_at range [from, to)
+#   result_min / result_max   result range (inclusive)
+#   a=... / b=...             operand equality
+#
+# Each combination is served by one of the per-user indexes
+# on Calculation (see cal_models.py):
+#   type (+ dates)     (user_id, type, created_at, id)
+#   dates only         (user_id, created_at, id)
+#   result range       (user_id, result)
+#   a / b              (user_id, a | b, created_at, id)
+# Equality filters keep history order, so a page stops after
+# limit + 1 index entries; a result range sorts its matches.
+# ----------------------------------------------------------
+
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException, Query
+
+from app.database.timeseries import as_utc
+from app.models.cal_models import Calculation
+from app.operations.registry import resolve
+
+
+def history_conditions(
+    op_type: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    result_min: Optional[float] = None,
+    result_max: Optional[float] = None,
+    a: Optional[float] = None,
+    b: Optional[float] = None,
+) -> List:
+    """
+    WHERE conditions for the filters given (None = not set).
+
+    Raises:
+        ValueError: Unknown operation type or an inverted range.
+    """
+    conditions = []
+
+    if op_type is not None:
+        conditions.append(Calculation.type == resolve(op_type))
+
+    if start is not None and end is not None and start > end:
+        raise ValueError("'from' must not be after 'to'")
+    if start is not None:
+        conditions.append(Calculation.created_at >= as_utc(start))
+    if end is not None:
+        conditions.append(Calculation.created_at < as_utc(end))
+
+    if result_min is not None and result_max is not None and result_min > result_max:
+        raise ValueError("'result_min' must not exceed 'result_max'")
+    if result_min is not None:
+        conditions.append(Calculation.result >= result_min)
+    if result_max is not None:
+        conditions.append(Calculation.result <= result_max)
+
+    if a is not None:
+        conditions.append(Calculation.a == a)
+    if b is not None:
+        conditions.append(Calculation.b == b)
+
+    return conditions
+
+
+# ----------------------------------------------------------
+# FastAPI dependency (sync and async routers)
+# ----------------------------------------------------------
+def history_filters(
+    op_type: Optional[str] = Query(default=None, alias="type"),
+    start: Optional[datetime] = Query(default=None, alias="from"),
+    end: Optional[datetime] = Query(default=None, alias="to"),
+    result_min: Optional[float] = Query(default=None),
+    result_max: Optional[float] = Query(default=None),
+    a: Optional[float] = Query(default=None),
+    b: Optional[float] = Query(default=None),
+) -> List:
+    try:
+        return history_conditions(op_type, start, end, result_min, result_max, a, b)
+    except ValueError as exc:
+        raise HTTPException(400, detail=str(exc))
+
+
+__all__ = ["history_conditions", "history_filters"]
@@ -0,0 +1,235 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Schema Migration Runner
+# File: app/database/migrate.py
+# ----------------------------------------------------------
+# Description:
+# Applies app/database/migrations in order and records each
+# one in the schema_version table. Replaces create_all() at
+# startup:
+#
+#   • Fast path: one version query; when the schema is
+#     current nothing else runs (no create_all, no
+#     reflection, no lock).
+#   • Otherwise one worker migrates while the others wait:
+#       PostgreSQL  session advisory lock
+#       SQLite      BEGIN IMMEDIATE held for the whole run
+#                   (migrations run inside it; SQLite DDL is
+#                   transactional)
+#     The version is re-read after the lock is taken, so the
+#     waiting workers find nothing left to do.
+#   • TRANSACTIONAL = False migrations run in AUTOCOMMIT on
+#     PostgreSQL (CREATE INDEX CONCURRENTLY).
+#
+# Usage:
+#     python -m app.database.migrate            # upgrade
+#     python -m app.database.migrate --status   # report only
+# ----------------------------------------------------------
+
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    inspect,
+    select,
+    text,
+)
+
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.database.dbase import get_shared_engine
+from app.database.migrations import MIGRATIONS
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary 64-bit key shared by every worker of this app
+ADVISORY_LOCK_KEY = 0x6361_6C63_6D69_6772  # "calcmigr"
+
+# Kept off Base.metadata so drop_all()/create_all() never touch it
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+# ----------------------------------------------------------
+# Version bookkeeping
+# ----------------------------------------------------------
+def latest_version() -> int:
+    return MIGRATIONS[-1].VERSION if MIGRATIONS else 0
+
+
+def current_version(conn) -> int:
+    """Highest applied version (0 for a database never migrated)."""
+    # One query on the hot path; a missing table is the error case
+    try:
+        return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+    except DBAPIError:
+        conn.rollback()
+        if inspect(conn).has_table(schema_version.name):
+            raise
+        return 0
+
+
+def _check_order() -> None:
+    versions = [m.VERSION for m in MIGRATIONS]
+    if versions != list(range(1, len(versions) + 1)):
+        raise MigrationError(f"Migration versions must be 1..N in order: {versions}")
+
+
+def _record(conn, migration) -> None:
+    conn.execute(
+        schema_version.insert().values(
+            version=migration.VERSION,
+            description=migration.DESCRIPTION,
+            applied_at=datetime.now(timezone.utc),
+        )
+    )
+
+
+# ----------------------------------------------------------
+# Cross-worker lock
+# ----------------------------------------------------------
+@contextmanager
+def migration_lock(engine, timeout: float):
+    """Yield a connection that holds the migration lock."""
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT")
+        dialect = conn.dialect.name
+
+        if dialect == "sqlite":
+            previous = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+            conn.exec_driver_sql(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+            try:
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.exec_driver_sql("ROLLBACK")
+                    raise
+                conn.exec_driver_sql("COMMIT")
+            finally:
+                conn.exec_driver_sql(f"PRAGMA busy_timeout = {previous}")
+
+        elif dialect == "postgresql":
+            deadline = time.monotonic() + timeout
+            lock = text("SELECT pg_try_advisory_lock(:key)")
+            while not conn.execute(lock, {"key": ADVISORY_LOCK_KEY}).scalar():
+                if time.monotonic() >= deadline:
+                    raise MigrationError("Timed out waiting for the migration lock")
+                time.sleep(0.5)
+            try:
+                yield conn
+            finally:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY}
+                )
+
+        else:
+            yield conn
+
+
+def _apply(engine, lock_conn, migration) -> None:
+    if lock_conn.dialect.name == "sqlite":
+        # Inside the BEGIN IMMEDIATE transaction: all or nothing
+        migration.upgrade(lock_conn)
+        _record(lock_conn, migration)
+    elif migration.TRANSACTIONAL:
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            _record(conn, migration)
+    else:
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT")
+            migration.upgrade(conn)
+            _record(conn, migration)
+
+
+# ----------------------------------------------------------
+# Entry point
+# ----------------------------------------------------------
+def migrate(engine=None, timeout: Optional[float] = None) -> List[int]:
+    """
+    Bring the schema up to latest_version(). Returns the
+    versions applied by this call (empty when already current).
+    """
+    _check_order()
+    engine = engine or get_shared_engine()
+    target = latest_version()
+
+    with engine.connect() as conn:
+        if current_version(conn) >= target:
+            return []
+
+    if timeout is None:
+        timeout = settings.DB_MIGRATION_LOCK_TIMEOUT
+
+    applied = []
+    with migration_lock(engine, timeout) as lock_conn:
+        schema_version.create(lock_conn, checkfirst=True)
+        current = current_version(lock_conn)
+
+        for migration in MIGRATIONS:
+            if migration.VERSION <= current:
+                continue
+            logger.info(f"Applying migration {migration.VERSION}: {migration.DESCRIPTION}")
+            _apply(engine, lock_conn, migration)
+            applied.append(migration.VERSION)
+
+    return applied
+
+
+def schema_status(engine=None) -> dict:
+    engine = engine or get_shared_engine()
+    with engine.connect() as conn:
+        current = current_version(conn)
+    return {
+        "current": current,
+        "latest": latest_version(),
+        "pending": [m.VERSION for m in MIGRATIONS if m.VERSION > current],
+    }
+
+
+def main(argv: List[str]) -> int:
+    if "--status" in argv:
+        print(schema_status())
+        return 0
+
+    applied = migrate()
+    print(f"Applied migrations: {applied}" if applied else "Schema is up to date")
+    return 0
+
+
+__all__ = [
+    "MigrationError",
+    "current_version",
+    "latest_version",
+    "migrate",
+    "migration_lock",
+    "schema_status",
+    "schema_version",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main(sys.argv[1:]))
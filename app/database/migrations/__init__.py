@@ -0,0 +1,41 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Schema Migrations
+# File: app/database/migrations/__init__.py
+# ----------------------------------------------------------
+# Description:
+# Ordered list of schema migrations applied by
+# app/database/migrate.py. Each module defines:
+#
+#   VERSION        consecutive integer, starting at 1
+#   DESCRIPTION    one line, stored in schema_version
+#   TRANSACTIONAL  False when a step cannot run inside a
+#                  transaction (CREATE INDEX CONCURRENTLY)
+#   upgrade(conn)  the change itself
+#
+# Migrations must be idempotent: databases created by the
+# old create_all() startup already contain some objects, and
+# a non-transactional step that fails half way is retried.
+# ----------------------------------------------------------
+
+from . import (
+    v0001_baseline,
+    v0002_user_token_version,
+    v0003_calculation_indexes,
+    v0004_calculation_stats,
+    v0005_calculation_filter_indexes,
+    v0006_stats_calc_version,
+    v0007_calculation_timestamp_precision,
+)
+
+MIGRATIONS = [
+    v0001_baseline,
+    v0002_user_token_version,
+    v0003_calculation_indexes,
+    v0004_calculation_stats,
+    v0005_calculation_filter_indexes,
+    v0006_stats_calc_version,
+    v0007_calculation_timestamp_precision,
+]
+
+__all__ = ["MIGRATIONS"]
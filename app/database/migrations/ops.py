@@ -0,0 +1,55 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration Helpers
+# File: app/database/migrations/ops.py
+# ----------------------------------------------------------
+# Description:
+# Idempotent, dialect-aware DDL helpers for migrations:
+#
+#   • has_column()    inspect before ALTER TABLE ... ADD
+#   • create_index()  CREATE INDEX CONCURRENTLY on PostgreSQL
+#                     (no write lock on the table while it
+#                     builds), plain CREATE INDEX elsewhere
+# ----------------------------------------------------------
+
+from sqlalchemy import inspect, text
+
+
+def is_postgres(conn) -> bool:
+    return conn.dialect.name == "postgresql"
+
+
+def has_column(conn, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _drop_invalid_index(conn, name: str) -> None:
+    # A failed CONCURRENTLY build leaves an INVALID index behind
+    # that IF NOT EXISTS would otherwise keep forever
+    invalid = conn.execute(
+        text(
+            "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def create_index(conn, name: str, table: str, columns: str) -> None:
+    """
+    Create index name on table(columns) unless it exists.
+    On PostgreSQL conn must be in AUTOCOMMIT mode (migration
+    modules doing this set TRANSACTIONAL = False).
+    """
+    if is_postgres(conn):
+        _drop_invalid_index(conn, name)
+        conn.exec_driver_sql(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})"
+        )
+    else:
+        conn.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+__all__ = ["is_postgres", "has_column", "create_index"]
@@ -0,0 +1,27 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0001 — Baseline
+# File: app/database/migrations/v0001_baseline.py
+# ----------------------------------------------------------
+# Description:
+# Creates the users and calculations tables on an empty
+# database. Tables that already exist (databases created by
+# the old create_all() startup) are left as they are; the
+# following migrations bring them up to date.
+# ----------------------------------------------------------
+
+from app.database.dbase import Base
+from app.models.cal_models import Calculation
+from app.models.user_model import User
+
+VERSION = 1
+DESCRIPTION = "users and calculations tables"
+TRANSACTIONAL = True
+
+
+def upgrade(conn) -> None:
+    Base.metadata.create_all(
+        bind=conn,
+        tables=[User.__table__, Calculation.__table__],
+        checkfirst=True,
+    )
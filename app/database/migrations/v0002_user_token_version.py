@@ -0,0 +1,22 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0002 — users.token_version
+# File: app/database/migrations/v0002_user_token_version.py
+# ----------------------------------------------------------
+# Description:
+# Adds the token_version column used to revoke stateless
+# access tokens to users tables created before it existed.
+# ----------------------------------------------------------
+
+from app.database.migrations.ops import has_column
+
+VERSION = 2
+DESCRIPTION = "users.token_version"
+TRANSACTIONAL = True
+
+
+def upgrade(conn) -> None:
+    if not has_column(conn, "users", "token_version"):
+        conn.exec_driver_sql(
+            "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"
+        )
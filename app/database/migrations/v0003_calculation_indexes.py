@@ -0,0 +1,26 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0003 — Calculation history index
+# File: app/database/migrations/v0003_calculation_indexes.py
+# ----------------------------------------------------------
+# Description:
+# Builds the (user_id, created_at DESC, id DESC) index that
+# every history query (per-user lookups, keyset pages,
+# exports) ranges over. Runs outside a transaction so
+# PostgreSQL can build it CONCURRENTLY on a live table.
+# ----------------------------------------------------------
+
+from app.database.migrations.ops import create_index
+
+VERSION = 3
+DESCRIPTION = "calculations (user_id, created_at, id) index"
+TRANSACTIONAL = False
+
+
+def upgrade(conn) -> None:
+    create_index(
+        conn,
+        "ix_calculations_user_created_id",
+        "calculations",
+        "user_id, created_at DESC, id DESC",
+    )
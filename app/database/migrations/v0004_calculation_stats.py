@@ -0,0 +1,61 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0004 — calculation_stats rollup
+# File: app/database/migrations/v0004_calculation_stats.py
+# ----------------------------------------------------------
+# Description:
+# Creates the per-user, per-type statistics rollup and fills
+# it from the existing history (app/database/calc_stats.py
+# keeps it current afterwards).
+#
+# The table and the fill are spelled out here as they were
+# when this migration was written, so later changes to the
+# model or to rebuild_statements() never change what it does.
+# ----------------------------------------------------------
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+)
+
+VERSION = 4
+DESCRIPTION = "calculation_stats rollup"
+TRANSACTIONAL = True
+
+_metadata = MetaData()
+
+# Referenced by the foreign key only; never created here
+Table("users", _metadata, Column("id", Integer, primary_key=True))
+
+_stats = Table(
+    "calculation_stats",
+    _metadata,
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("type", String, primary_key=True),
+    Column("calc_count", Integer, nullable=False),
+    Column("result_sum", Float, nullable=False),
+    Column("result_min", Float, nullable=True),
+    Column("result_max", Float, nullable=True),
+    Column("last_at", DateTime(timezone=True), nullable=True),
+)
+
+_FILL = """
+INSERT INTO calculation_stats
+    (user_id, type, calc_count, result_sum, result_min, result_max, last_at)
+SELECT user_id, type, COUNT(*), COALESCE(SUM(result), 0.0),
+       MIN(result), MAX(result), MAX(created_at)
+FROM calculations
+GROUP BY user_id, type
+"""
+
+
+def upgrade(conn) -> None:
+    _stats.create(conn, checkfirst=True)
+    conn.exec_driver_sql("DELETE FROM calculation_stats")
+    conn.exec_driver_sql(_FILL)
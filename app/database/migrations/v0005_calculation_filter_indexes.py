@@ -0,0 +1,35 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0005 — History filter indexes
+# File: app/database/migrations/v0005_calculation_filter_indexes.py
+# ----------------------------------------------------------
+# Description:
+# Per-user indexes behind the GET /calculations filters
+# (app/database/history_filters.py): operation type in
+# history order, result range, and operand equality (one
+# index per operand, also in history order). Built
+# CONCURRENTLY on PostgreSQL like migration 0003.
+# ----------------------------------------------------------
+
+from app.database.migrations.ops import create_index
+
+VERSION = 5
+DESCRIPTION = "calculations filter indexes (type, result, operands)"
+TRANSACTIONAL = False
+
+
+def upgrade(conn) -> None:
+    create_index(
+        conn,
+        "ix_calculations_user_type_created_id",
+        "calculations",
+        "user_id, type, created_at DESC, id DESC",
+    )
+    create_index(conn, "ix_calculations_user_result", "calculations", "user_id, result")
+    for operand in ("a", "b"):
+        create_index(
+            conn,
+            f"ix_calculations_user_{operand}_created_id",
+            "calculations",
+            f"user_id, {operand}, created_at DESC, id DESC",
+        )
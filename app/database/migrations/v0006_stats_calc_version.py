@@ -0,0 +1,24 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0006 — calculation_stats.version
+# File: app/database/migrations/v0006_stats_calc_version.py
+# ----------------------------------------------------------
+# Description:
+# Adds the history ETag counter: each calculation_stats row
+# carries a version bumped by the rollup statement that
+# already runs on every write (see
+# app/database/calc_versions.py).
+# ----------------------------------------------------------
+
+from app.database.migrations.ops import has_column
+
+VERSION = 6
+DESCRIPTION = "calculation_stats.version"
+TRANSACTIONAL = True
+
+
+def upgrade(conn) -> None:
+    if not has_column(conn, "calculation_stats", "version"):
+        conn.exec_driver_sql(
+            "ALTER TABLE calculation_stats ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+        )
@@ -0,0 +1,34 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Migration 0007 — created_at precision
+# File: app/database/migrations/v0007_calculation_timestamp_precision.py
+# ----------------------------------------------------------
+# Description:
+# Rows written before keyset pagination got created_at from
+# the server default, which SQLite stores as CURRENT_TIMESTAMP
+# text ("YYYY-MM-DD HH:MM:SS", no fraction). Cursors bind
+# "... HH:MM:SS.ffffff", and SQLite compares the two as text,
+# so paging over such rows repeated or skipped them.
+#
+# Rewrites those values in the format SQLAlchemy writes, so
+# the keyset conditions stay plain range scans on the index.
+# PostgreSQL stores real timestamps and needs nothing.
+# ----------------------------------------------------------
+
+from app.database.migrations.ops import is_postgres
+
+VERSION = 7
+DESCRIPTION = "calculations.created_at with microseconds on SQLite"
+TRANSACTIONAL = True
+
+# 'YYYY-MM-DD HH:MM:SS.ffffff' is 26 characters long
+_BACKFILL = """
+UPDATE calculations
+SET created_at = COALESCE(strftime('%Y-%m-%d %H:%M:%f', created_at) || '000', created_at)
+WHERE length(created_at) <> 26
+"""
+
+
+def upgrade(conn) -> None:
+    if not is_postgres(conn):
+        conn.exec_driver_sql(_BACKFILL)
@@ -0,0 +1,138 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Keyset Pagination Helpers
+# File: app/database/pagination.py
+# ----------------------------------------------------------
+# Description:
+# Cursor-based (keyset) pagination over (created_at, id) for
+# newest-first listings. Each page is a range condition on
+# the composite index instead of an OFFSET scan, so latency
+# stays flat as history grows. Cursors are opaque base64url
+# tokens carrying the boundary row and the paging direction.
+# ----------------------------------------------------------
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+NEXT = "next"
+PREV = "prev"
+
+
+# ----------------------------------------------------------
+# Cursor encoding
+# ----------------------------------------------------------
+def encode_cursor(created_at: datetime, row_id: int, direction: str = NEXT) -> str:
+    """Pack a boundary row into an opaque URL-safe cursor."""
+    raw = json.dumps(
+        {"t": created_at.isoformat(), "i": row_id, "d": direction},
+        separators=(",", ":"),
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    """
+    Unpack a cursor produced by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction = data["d"]
+        if direction not in (NEXT, PREV):
+            raise ValueError(direction)
+        return datetime.fromisoformat(data["t"]), int(data["i"]), direction
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+# ----------------------------------------------------------
+# Page size
+# ----------------------------------------------------------
+def clamp_page_size(limit: Optional[int], default: int, maximum: int) -> int:
+    """Apply the server-side default and ceiling to a page size."""
+    if limit is None:
+        return default
+    return max(1, min(limit, maximum))
+
+
+# ----------------------------------------------------------
+# Keyset query
+# ----------------------------------------------------------
+def apply_keyset(query, created_col, id_col, cursor: Optional[str], limit: int):
+    """
+    Add the keyset condition, ordering and LIMIT (limit + 1 to
+    detect a further page) to a query or select().
+    Returns (query, direction).
+    """
+    if cursor is None:
+        direction = NEXT
+        return (
+            query.order_by(created_col.desc(), id_col.desc()).limit(limit + 1),
+            direction,
+        )
+
+    created_at, row_id, direction = decode_cursor(cursor)
+
+    if direction == NEXT:
+        condition = or_(
+            created_col < created_at,
+            and_(created_col == created_at, id_col < row_id),
+        )
+        order = (created_col.desc(), id_col.desc())
+    else:
+        condition = or_(
+            created_col > created_at,
+            and_(created_col == created_at, id_col > row_id),
+        )
+        order = (created_col.asc(), id_col.asc())
+
+    return query.filter(condition).order_by(*order).limit(limit + 1), direction
+
+
+def finalize_page(
+    rows: Sequence[Any],
+    limit: int,
+    direction: str,
+    had_cursor: bool,
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """
+    Trim the look-ahead row, restore newest-first order, and
+    build (rows, next_cursor, prev_cursor).
+    """
+    rows = list(rows)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if direction == PREV:
+        rows.reverse()
+
+    if not rows:
+        return rows, None, None
+
+    first, last = rows[0], rows[-1]
+
+    more_older = has_more if direction == NEXT else True
+    more_newer = had_cursor and (direction == NEXT or has_more)
+
+    next_cursor = encode_cursor(last.created_at, last.id, NEXT) if more_older else None
+    prev_cursor = encode_cursor(first.created_at, first.id, PREV) if more_newer else None
+
+    return rows, next_cursor, prev_cursor
+
+
+__all__ = [
+    "NEXT",
+    "PREV",
+    "encode_cursor",
+    "decode_cursor",
+    "clamp_page_size",
+    "apply_keyset",
+    "finalize_page",
+]
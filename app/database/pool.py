@@ -0,0 +1,220 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Connection Pool Configuration & Metrics
+# File: app/database/pool.py
+# ----------------------------------------------------------
+# Description:
+# Builds the pool arguments for create_engine() /
+# create_async_engine() from Settings, and counts what the
+# pool actually does so pool sizes can be chosen per worker
+# from data:
+#
+#   • checkouts / checkins / new connections
+#   • current and peak overflow
+#   • time spent waiting for a connection, and timeouts
+#   • invalidations (hard and soft)
+#
+# Pool choice by URL:
+#   sqlite :memory:  → StaticPool (one shared connection)
+#   sqlite file      → QueuePool sized from Settings
+#   server databases → QueuePool sized from Settings, with
+#                      pre-ping and recycle
+# ----------------------------------------------------------
+
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.core.config import settings
+
+
+# ----------------------------------------------------------
+# Counters
+# ----------------------------------------------------------
+class PoolMetrics:
+    """Thread-safe counters fed by pool events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.soft_invalidations = 0
+            self.timeouts = 0
+            self.peak_overflow = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self._pool = None
+
+    def observe_wait(self, pool, seconds: float, timed_out: bool = False) -> None:
+        overflow = pool.overflow()
+        with self._lock:
+            self._pool = pool
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+            if overflow > self.peak_overflow:
+                self.peak_overflow = overflow
+            if timed_out:
+                self.timeouts += 1
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        """Counters plus the pool's current occupancy."""
+        with self._lock:
+            pool = self._pool
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "timeouts": self.timeouts,
+                "peak_overflow": self.peak_overflow,
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 3),
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "wait_ms_avg": round(
+                    self.wait_seconds_total * 1000 / self.checkouts, 3
+                ) if self.checkouts else 0.0,
+            }
+
+        if pool is not None:
+            data.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return data
+
+
+# Named metrics ("sync", "async"), one per engine kind
+POOL_METRICS: Dict[str, PoolMetrics] = {}
+
+
+# ----------------------------------------------------------
+# Queue pools that time connection acquisition
+# ----------------------------------------------------------
+class _TimedCheckoutMixin:
+    """Measures how long _do_get() blocks on the pool queue."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_wait(self, time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_wait(self, time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+class MeteredQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+# ----------------------------------------------------------
+# create_engine() keyword arguments
+# ----------------------------------------------------------
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def pool_options(url: str, is_async: bool = False) -> dict:
+    """Pool keyword arguments for url, taken from Settings."""
+    parsed = make_url(url)
+
+    if _is_memory_sqlite(parsed):
+        # Every connection would be a separate empty database
+        return {"poolclass": StaticPool}
+
+    options = {
+        "poolclass": MeteredAsyncQueuePool if is_async else MeteredQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+    if parsed.get_backend_name() != "sqlite":
+        # Server connections go stale behind proxies / failovers
+        options["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE
+
+    return options
+
+
+# ----------------------------------------------------------
+# Event wiring
+# ----------------------------------------------------------
+def attach_pool_metrics(engine, name: str) -> PoolMetrics:
+    """Start counting pool events for engine under POOL_METRICS[name]."""
+    metrics = PoolMetrics()
+    POOL_METRICS[name] = metrics
+
+    pool = getattr(engine, "sync_engine", engine).pool
+    if isinstance(pool, _TimedCheckoutMixin):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_conn, record):
+        metrics.incr("connects")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):
+        metrics.incr("checkouts")
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_conn, record):
+        metrics.incr("checkins")
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_conn, record, exc):
+        metrics.incr("invalidations")
+
+    @event.listens_for(pool, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_conn, record, exc):
+        metrics.incr("soft_invalidations")
+
+    return metrics
+
+
+def pool_status() -> dict:
+    """Snapshot of every registered engine's pool metrics."""
+    return {name: metrics.snapshot() for name, metrics in POOL_METRICS.items()}
+
+
+__all__ = [
+    "PoolMetrics",
+    "POOL_METRICS",
+    "MeteredQueuePool",
+    "MeteredAsyncQueuePool",
+    "pool_options",
+    "attach_pool_metrics",
+    "pool_status",
+]
@@ -0,0 +1,150 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Read-Only Query Repository
+# File: app/database/reads.py
+# ----------------------------------------------------------
+# Description:
+# Core select() read path for the hot GET requests. Rows come
+# back as plain tuples and, where a route needs an object, are
+# wrapped in small __slots__ classes instead of ORM instances:
+# no identity map, no attribute instrumentation, no expiry
+# bookkeeping for data that is only read and serialized.
+#
+#   • CalculationRow   GET /calculations/{id}
+#   • history page     GET /calculations (tuples, encoded by
+#                      app/services/fast_json.py)
+#   • UserRow          current-user lookup (get_current_user,
+#                      principal cache hits)
+#
+# Writes keep using the ORM (app/database/calc_writes.py and
+# the auth routes).
+# ----------------------------------------------------------
+
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.models.cal_models import Calculation
+from app.models.user_model import User
+
+CALC_COLUMNS = ("id", "type", "a", "b", "result", "user_id", "created_at")
+
+# Everything the API reads from the current user (no password hash)
+USER_COLUMNS = (
+    "id",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "mobile",
+    "is_active",
+    "token_version",
+)
+
+
+# ----------------------------------------------------------
+# Row objects
+# ----------------------------------------------------------
+class CalculationRow:
+    """Read-only calculation; attribute names match Calculation."""
+
+    __slots__ = CALC_COLUMNS
+
+    def __init__(self, id, type, a, b, result, user_id, created_at):
+        self.id = id
+        self.type = type
+        self.a = a
+        self.b = b
+        self.result = result
+        self.user_id = user_id
+        self.created_at = created_at
+
+    def __repr__(self):
+        return f"CalculationRow(id={self.id}, type='{self.type}')"
+
+
+class UserRow:
+    """Read-only current user; attribute names match User."""
+
+    __slots__ = USER_COLUMNS
+
+    def __init__(
+        self, id, username, first_name, last_name, email, mobile, is_active, token_version
+    ):
+        self.id = id
+        self.username = username
+        self.first_name = first_name
+        self.last_name = last_name
+        self.email = email
+        self.mobile = mobile
+        self.is_active = is_active
+        self.token_version = token_version
+
+    def __repr__(self):
+        return f"UserRow(id={self.id}, username='{self.username}')"
+
+
+# ----------------------------------------------------------
+# Statements
+# ----------------------------------------------------------
+def calc_columns():
+    """Calculation columns for select() in CALC_COLUMNS order."""
+    return tuple(getattr(Calculation, name) for name in CALC_COLUMNS)
+
+
+def calc_by_id(calc_id: int, user_id: int):
+    return select(*calc_columns()).where(
+        Calculation.id == calc_id, Calculation.user_id == user_id
+    )
+
+
+def calc_history(user_id: int, conditions=()):
+    """Unordered history select; pagination adds ORDER BY / LIMIT."""
+    return select(*calc_columns()).where(Calculation.user_id == user_id, *conditions)
+
+
+def user_by_id(user_id: int):
+    return select(*(getattr(User, name) for name in USER_COLUMNS)).where(
+        User.id == user_id
+    )
+
+
+# ----------------------------------------------------------
+# Fetch helpers
+# ----------------------------------------------------------
+def fetch_calculation(session, calc_id: int, user_id: int) -> Optional[CalculationRow]:
+    row = session.execute(calc_by_id(calc_id, user_id)).first()
+    return CalculationRow(*row) if row is not None else None
+
+
+def fetch_user(session, user_id: int) -> Optional[UserRow]:
+    row = session.execute(user_by_id(user_id)).first()
+    return UserRow(*row) if row is not None else None
+
+
+async def afetch_calculation(session, calc_id: int, user_id: int) -> Optional[CalculationRow]:
+    """Async counterpart of fetch_calculation()."""
+    row = (await session.execute(calc_by_id(calc_id, user_id))).first()
+    return CalculationRow(*row) if row is not None else None
+
+
+async def afetch_user(session, user_id: int) -> Optional[UserRow]:
+    """Async counterpart of fetch_user()."""
+    row = (await session.execute(user_by_id(user_id))).first()
+    return UserRow(*row) if row is not None else None
+
+
+__all__ = [
+    "CALC_COLUMNS",
+    "USER_COLUMNS",
+    "CalculationRow",
+    "UserRow",
+    "calc_columns",
+    "calc_by_id",
+    "calc_history",
+    "user_by_id",
+    "fetch_calculation",
+    "fetch_user",
+    "afetch_calculation",
+    "afetch_user",
+]
@@ -0,0 +1,233 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: SQLite Performance Profile
+# File: app/database/sqlite_tuning.py
+# ----------------------------------------------------------
+# Description:
+# Settings-driven tuning for SQLite *file* databases (the
+# fallback / edge deployment target), applied to every new
+# DBAPI connection through the engine "connect" event:
+#
+#   busy_timeout   wait for a lock instead of failing with
+#                  "database is locked"
+#   journal_mode   WAL: readers never block the writer and
+#                  the writer never blocks readers
+#   synchronous    NORMAL: fsync at checkpoints, not on every
+#                  commit (safe with WAL)
+#   mmap_size / cache_size / temp_store=MEMORY
+#
+# Writer engines (see dbase.get_writer_engine) also start
+# every transaction with BEGIN IMMEDIATE, so a writer takes
+# the write lock up front and waits on busy_timeout instead
+# of failing on a read → write lock upgrade.
+#
+# WalCheckpointer runs a periodic wal_checkpoint so the WAL
+# file does not grow without bound between the automatic
+# checkpoints under sustained writes.
+# ----------------------------------------------------------
+
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+# ----------------------------------------------------------
+# Pragma profile
+# ----------------------------------------------------------
+def is_sqlite_file(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def sqlite_tuned(url: str) -> bool:
+    """True when the pragma profile applies to url."""
+    return settings.SQLITE_TUNING and is_sqlite_file(url)
+
+
+def sqlite_pragmas() -> List[Tuple[str, object]]:
+    """PRAGMA name/value pairs, in the order they are applied."""
+    return [
+        # First, so the journal_mode switch waits for locks too
+        ("busy_timeout", settings.SQLITE_BUSY_TIMEOUT_MS),
+        ("journal_mode", "WAL"),
+        ("synchronous", settings.SQLITE_SYNCHRONOUS),
+        ("mmap_size", settings.SQLITE_MMAP_SIZE),
+        ("cache_size", settings.SQLITE_CACHE_SIZE),
+        ("temp_store", "MEMORY"),
+    ]
+
+
+def apply_sqlite_profile(engine, immediate: bool = False) -> None:
+    """
+    Apply sqlite_pragmas() to every connection engine opens.
+    immediate=True also begins each transaction with
+    BEGIN IMMEDIATE (writer engines).
+    """
+    target = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(target, "connect")
+    def _on_connect(dbapi_conn, record):
+        if immediate:
+            # Let SQLAlchemy emit BEGIN instead of the driver
+            dbapi_conn.isolation_level = None
+        cursor = dbapi_conn.cursor()
+        for name, value in sqlite_pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    if immediate:
+
+        @event.listens_for(target, "begin")
+        def _on_begin(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+# ----------------------------------------------------------
+# Periodic WAL checkpoint
+# ----------------------------------------------------------
+class WalCheckpointer:
+    """Background thread running PRAGMA wal_checkpoint."""
+
+    def __init__(self, engine, interval: float, mode: str = "PASSIVE"):
+        mode = mode.upper()
+        if mode not in CHECKPOINT_MODES:
+            raise ValueError(f"Unknown checkpoint mode: {mode}")
+
+        self.engine = engine
+        self.interval = interval
+        self.mode = mode
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.busy = 0
+        self.errors = 0
+        self.last: Optional[dict] = None
+
+    def checkpoint(self) -> dict:
+        """Run one checkpoint now and return SQLite's counters."""
+        start = time.perf_counter()
+        # Raw connection: wal_checkpoint cannot run inside the
+        # transaction SQLAlchemy would begin around it
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.execute(f"PRAGMA wal_checkpoint({self.mode})")
+            busy, log_frames, checkpointed = cursor.fetchone()
+            cursor.close()
+        finally:
+            raw.close()
+
+        result = {
+            "busy": bool(busy),
+            "wal_frames": log_frames,
+            "checkpointed_frames": checkpointed,
+            "ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        with self._lock:
+            self.runs += 1
+            self.busy += int(bool(busy))
+            self.last = result
+        return result
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.checkpoint()
+            except Exception:
+                with self._lock:
+                    self.errors += 1
+
+    def start(self) -> None:
+        if self._thread is None and self.interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="wal-checkpoint", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "interval": self.interval,
+                "mode": self.mode,
+                "runs": self.runs,
+                "busy": self.busy,
+                "errors": self.errors,
+                "last": self.last,
+            }
+
+
+# ----------------------------------------------------------
+# Process-wide checkpointer (owned by app/database/dbase.py)
+# ----------------------------------------------------------
+_checkpointer: Optional[WalCheckpointer] = None
+
+
+def start_checkpointer(engine) -> WalCheckpointer:
+    global _checkpointer
+
+    stop_checkpointer()
+    _checkpointer = WalCheckpointer(
+        engine,
+        interval=settings.SQLITE_CHECKPOINT_INTERVAL,
+        mode=settings.SQLITE_CHECKPOINT_MODE,
+    )
+    _checkpointer.start()
+    return _checkpointer
+
+
+def stop_checkpointer() -> None:
+    global _checkpointer
+
+    checkpointer, _checkpointer = _checkpointer, None
+    if checkpointer is not None:
+        checkpointer.stop()
+
+
+def sqlite_status(engine) -> dict:
+    """Effective pragmas on one pooled connection + checkpoint counters."""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        pragmas = {}
+        for name, _ in sqlite_pragmas():
+            cursor.execute(f"PRAGMA {name}")
+            pragmas[name] = cursor.fetchone()[0]
+        cursor.close()
+    finally:
+        raw.close()
+
+    return {
+        "tuned": sqlite_tuned(str(engine.url)),
+        "pragmas": pragmas,
+        "checkpoint": _checkpointer.stats() if _checkpointer is not None else None,
+    }
+
+
+__all__ = [
+    "WalCheckpointer",
+    "apply_sqlite_profile",
+    "is_sqlite_file",
+    "sqlite_pragmas",
+    "sqlite_status",
+    "sqlite_tuned",
+    "start_checkpointer",
+    "stop_checkpointer",
+]
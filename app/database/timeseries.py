@@ -0,0 +1,143 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation Time Series
+# File: app/database/timeseries.py
+# ----------------------------------------------------------
+# Description:
+# Builds GET /calculations/timeseries: one GROUP BY over the
+# (user_id, created_at, id) index range [from, to), with
+# count / sum / avg / min / max of results per time bucket.
+#
+#   • Buckets are epoch-aligned widths computed in SQL
+#     (strftime('%s') on SQLite, extract(epoch) on
+#     PostgreSQL), so any multiple of a minute, hour or day
+#     works on both backends.
+#   • bucket_width() widens the requested unit until the
+#     range fits in TIMESERIES_MAX_POINTS buckets: response
+#     size is bounded however much history exists.
+#   • Only buckets containing calculations are returned.
+# ----------------------------------------------------------
+
+import math
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import BigInteger, Integer, cast, extract, func, select
+
+from app.models.cal_models import Calculation
+
+BUCKET_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+_calcs = Calculation.__table__
+
+
+def as_utc(value: datetime) -> datetime:
+    """Aware UTC datetime; naive values are taken to be UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _bucket_count(start: datetime, end: datetime, width: int) -> int:
+    return int(end.timestamp() // width) - int(start.timestamp() // width) + 1
+
+
+def bucket_width(bucket: str, start: datetime, end: datetime, max_points: int) -> int:
+    """Seconds per bucket: a multiple of the unit, at most max_points buckets."""
+    unit = BUCKET_SECONDS[bucket]
+    span = max((end - start).total_seconds(), 0.0)
+    factor = max(1, math.ceil(span / (unit * max_points)))
+
+    # Epoch alignment can add one partial bucket at either end
+    while _bucket_count(start, end, unit * factor) > max_points:
+        factor += 1
+    return unit * factor
+
+
+# ----------------------------------------------------------
+# Statements
+# ----------------------------------------------------------
+def _epoch(dialect: str, column):
+    if dialect == "postgresql":
+        return cast(func.floor(extract("epoch", column)), BigInteger)
+    # SQLite stores UTC text; '%s' is seconds since the epoch
+    return cast(func.strftime("%s", column), Integer)
+
+
+def history_start(user_id: int):
+    """Oldest created_at for the user (an index seek)."""
+    return select(func.min(_calcs.c.created_at)).where(_calcs.c.user_id == user_id)
+
+
+def timeseries_select(
+    dialect: str, user_id: int, start: datetime, end: datetime, width: int
+):
+    c = _calcs.c
+    bucket = (_epoch(dialect, c.created_at) // width * width).label("bucket")
+    return (
+        select(
+            bucket,
+            func.count().label("calc_count"),
+            func.sum(c.result).label("result_sum"),
+            func.avg(c.result).label("result_avg"),
+            func.min(c.result).label("result_min"),
+            func.max(c.result).label("result_max"),
+        )
+        .where(c.user_id == user_id, c.created_at >= start, c.created_at < end)
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+
+
+# ----------------------------------------------------------
+# Response
+# ----------------------------------------------------------
+def resolve_range(
+    start: Optional[datetime], end: Optional[datetime], earliest: Optional[datetime]
+):
+    """
+    Fill in defaults: to = now, from = the oldest calculation
+    (or to, for an empty history).
+
+    Raises:
+        ValueError: If from is after to.
+    """
+    end = as_utc(end) if end else datetime.now(timezone.utc)
+    start = as_utc(start or earliest or end)
+    if start > end:
+        raise ValueError("'from' must not be after 'to'")
+    return start, end
+
+
+def series_payload(
+    bucket: str, width: int, start: datetime, end: datetime, rows: Iterable
+) -> dict:
+    """TimeseriesRead payload from timeseries_select() rows."""
+    return {
+        "bucket": bucket,
+        "bucket_seconds": width,
+        "start": start,
+        "end": end,
+        "points": [
+            {
+                "start": datetime.fromtimestamp(int(r.bucket), timezone.utc),
+                "count": r.calc_count,
+                "sum": r.result_sum,
+                "avg": r.result_avg,
+                "min": r.result_min,
+                "max": r.result_max,
+            }
+            for r in rows
+        ],
+    }
+
+
+__all__ = [
+    "BUCKET_SECONDS",
+    "as_utc",
+    "bucket_width",
+    "history_start",
+    "timeseries_select",
+    "resolve_range",
+    "series_payload",
+]
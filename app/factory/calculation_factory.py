@@ -6,37 +6,39 @@
 # Description:
 # Central factory for creating arithmetic operation objects.
 # Normalizes operation names, supports synonyms, and returns
-# an instance of the correct operation class.
+# an instance of the correct operation class. Name resolution
+# and arithmetic both come from the operation registry.
 # ----------------------------------------------------------
 
+from app.operations.registry import ALIASES, OPERATIONS, resolve
+
 
 # ----------------------------------------------------------
 # Arithmetic Operation Classes
+# compute() is the registry callable itself — no extra hop.
 # ----------------------------------------------------------
 class AddOperation:
-    @staticmethod
-    def compute(a: float, b: float) -> float:
-        return a + b
+    compute = staticmethod(OPERATIONS["add"])
 
 
 class SubtractOperation:
-    @staticmethod
-    def compute(a: float, b: float) -> float:
-        return a - b
+    compute = staticmethod(OPERATIONS["subtract"])
 
 
 class MultiplyOperation:
-    @staticmethod
-    def compute(a: float, b: float) -> float:
-        return a * b
+    compute = staticmethod(OPERATIONS["multiply"])
 
 
 class DivideOperation:
-    @staticmethod
-    def compute(a: float, b: float) -> float:
-        if b == 0:
-            raise ValueError("Division by zero")
-        return a / b
+    compute = staticmethod(OPERATIONS["divide"])
+
+
+_CLASSES = {
+    "add": AddOperation,
+    "subtract": SubtractOperation,
+    "multiply": MultiplyOperation,
+    "divide": DivideOperation,
+}
 
 
 # ----------------------------------------------------------
@@ -49,25 +51,8 @@ class CalculationFactory:
     """
 
     OPERATIONS = {
-        # Addition
-        "add": AddOperation,
-        "addition": AddOperation,
-        "plus": AddOperation,
-
-        # Subtraction
-        "subtract": SubtractOperation,
-        "sub": SubtractOperation,
-        "minus": SubtractOperation,
-
-        # Multiplication
-        "multiply": MultiplyOperation,
-        "mul": MultiplyOperation,
-        "times": MultiplyOperation,
-
-        # Division
-        "divide": DivideOperation,
-        "div": DivideOperation,
-        "division": DivideOperation,
+        **_CLASSES,
+        **{alias: _CLASSES[name] for alias, name in ALIASES.items()},
     }
 
     @classmethod
@@ -76,10 +61,7 @@ class CalculationFactory:
         Normalize the operation string and return an instance of the
         associated operation class.
         """
-        key = op_type.strip().lower()
-
-        if key not in cls.OPERATIONS:
-            raise ValueError("Unsupported calculation type")
-
-        operation_class = cls.OPERATIONS[key]
+        operation_class = cls.OPERATIONS.get(op_type)
+        if operation_class is None:
+            operation_class = _CLASSES[resolve(op_type, aliases=True)]
         return operation_class()
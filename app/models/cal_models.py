@@ -11,8 +11,16 @@
 #   • Result value (nullable for error cases)
 #   • created_at timestamp (fixes N/A date issue in dashboard)
 #   • Foreign key to User model
+#   • Composite (user_id, created_at DESC, id DESC) index for
+#     keyset-paginated history, plus per-user type, result
+#     and operand indexes for the history filters
+#   • compute_result() backed by the operation registry
+#   • CalculationStats: per-user, per-type rollup maintained
+#     by the write paths (app/database/calc_stats.py)
 # ----------------------------------------------------------
 
+from datetime import datetime, timezone
+
 from sqlalchemy import (
     Column,
     Integer,
@@ -20,10 +28,16 @@ from sqlalchemy import (
     String,
     ForeignKey,
     DateTime,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship
 from app.database.dbase import Base
+from app.operations.registry import compute
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class Calculation(Base):
@@ -41,8 +55,11 @@ class Calculation(Base):
     result = Column(Float, nullable=True)
 
     # NEW FIELD — fixes "N/A" in dashboard history
+    # Client-side default keeps full microsecond precision so
+    # keyset cursors compare exactly on every backend.
     created_at = Column(
         DateTime(timezone=True),
+        default=_utcnow,
         server_default=func.now(),
         nullable=False,
     )
@@ -52,3 +69,64 @@ class Calculation(Base):
 
     # Relationship back to User.calculations
     user = relationship("User", back_populates="calculations")
+
+    # Each history page is a range scan on this index; id DESC
+    # matches the page ORDER BY so no sort step is needed.
+    __table_args__ = (
+        Index(
+            "ix_calculations_user_created_id",
+            user_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+        # History filters (app/database/history_filters.py)
+        Index(
+            "ix_calculations_user_type_created_id",
+            user_id,
+            type,
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index("ix_calculations_user_result", user_id, result),
+        Index(
+            "ix_calculations_user_a_created_id",
+            user_id,
+            a,
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index(
+            "ix_calculations_user_b_created_id",
+            user_id,
+            b,
+            created_at.desc(),
+            id.desc(),
+        ),
+    )
+
+    # Recompute and store the result from the current operands
+    def compute_result(self) -> float:
+        self.result = compute(self.type, self.a, self.b)
+        return self.result
+
+
+class CalculationStats(Base):
+    __tablename__ = "calculation_stats"
+
+    # One row per (user, operation type) ever used; a row whose
+    # count drops to zero is kept so its version never goes back
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    type = Column(String, primary_key=True)
+
+    calc_count = Column(Integer, nullable=False, default=0)
+    # Aggregates over non-null results
+    result_sum = Column(Float, nullable=False, default=0.0)
+    result_min = Column(Float, nullable=True)
+    result_max = Column(Float, nullable=True)
+    last_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Bumped by every write to this rollup; their sum per user is
+    # the history ETag validator (app/database/calc_versions.py)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
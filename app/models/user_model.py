@@ -57,6 +57,9 @@ class User(Base):
     # ------------------------------------------------------
     password_hash = Column(String(255), nullable=False)
 
+    # Bumped to revoke every token issued before (stateless auth)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # ------------------------------------------------------
     # Timestamps
     # ------------------------------------------------------
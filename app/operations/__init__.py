@@ -21,6 +21,13 @@
 import logging
 from typing import Union
 
+from app.operations.registry import OPERATIONS
+
+_add = OPERATIONS["add"]
+_subtract = OPERATIONS["subtract"]
+_multiply = OPERATIONS["multiply"]
+_divide = OPERATIONS["divide"]
+
 # ----------------------------------------------------------
 # Type Alias and Logger Configuration
 # ----------------------------------------------------------
@@ -51,7 +58,7 @@ def validate_number(value: Number) -> Number:
 def add(a: Number, b: Number) -> float:
     """Perform addition."""
     a, b = validate_number(a), validate_number(b)
-    result = a + b
+    result = _add(a, b)
     logger.info(f"Add operation: {a} + {b} = {result}")
     return float(result)
 
@@ -59,7 +66,7 @@ def add(a: Number, b: Number) -> float:
 def subtract(a: Number, b: Number) -> float:
     """Perform subtraction."""
     a, b = validate_number(a), validate_number(b)
-    result = a - b
+    result = _subtract(a, b)
     logger.info(f"Subtract operation: {a} - {b} = {result}")
     return float(result)
 
@@ -67,7 +74,7 @@ def subtract(a: Number, b: Number) -> float:
 def multiply(a: Number, b: Number) -> float:
     """Perform multiplication."""
     a, b = validate_number(a), validate_number(b)
-    result = a * b
+    result = _multiply(a, b)
     logger.info(f"Multiply operation: {a} * {b} = {result}")
     return float(result)
 
@@ -82,7 +89,7 @@ def divide(a: Number, b: Number) -> float:
     if b == 0:
         logger.warning(f"Division by zero attempt: a={a}, b={b}")
         raise ValueError("Division by zero is not allowed.")
-    result = a / b
+    result = _divide(a, b)
     logger.info(f"Divide operation: {a} / {b} = {result}")
     return float(result)
 
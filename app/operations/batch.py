@@ -0,0 +1,104 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Batch (Columnar) Calculation Engine
+# File: app/operations/batch.py
+# ----------------------------------------------------------
+# Description:
+# Computes a whole columnar batch of calculations in one pass.
+# Rows are grouped by operation type and each group is fed
+# through a single map() over the builtin operator, instead of
+# dispatching compute_result() once per row. Row-level problems
+# (unsupported type, division by zero) are reported by index
+# so the caller can persist the valid rows and explain the rest.
+# ----------------------------------------------------------
+
+from typing import List, Optional, Sequence, Tuple
+
+from app.operations.registry import VECTOR_OPERATIONS, resolve
+
+BatchError = Tuple[int, str]
+
+
+# ----------------------------------------------------------
+# Helper: resolve each distinct type string once
+# ----------------------------------------------------------
+def _resolve_distinct(types: Sequence[str]) -> dict:
+    """Return {raw type: canonical type or None if unsupported}."""
+    resolved = {}
+    for raw in set(types):
+        try:
+            resolved[raw] = resolve(raw)
+        except ValueError:
+            resolved[raw] = None
+    return resolved
+
+
+# ----------------------------------------------------------
+# Helper: group row indices by canonical operation type
+# ----------------------------------------------------------
+def _group_indices(types: Sequence[str]) -> dict:
+    """
+    Return {canonical_type: [row indices]}; unsupported types
+    are grouped under None.
+    """
+    normalized = _resolve_distinct(types)
+    groups: dict = {}
+
+    for index, raw in enumerate(types):
+        groups.setdefault(normalized[raw], []).append(index)
+
+    return groups
+
+
+# ----------------------------------------------------------
+# Vectorized batch computation
+# ----------------------------------------------------------
+def compute_batch(
+    types: Sequence[str],
+    a: Sequence[float],
+    b: Sequence[float],
+) -> Tuple[List[Optional[float]], List[BatchError]]:
+    """
+    Compute results for three equally sized columns.
+
+    Returns:
+        results: one entry per row (None where the row failed)
+        errors:  sorted list of (row index, message)
+    """
+    if not (len(types) == len(a) == len(b)):
+        raise ValueError("Columns types, a and b must have the same length")
+
+    results: List[Optional[float]] = [None] * len(types)
+    errors: List[BatchError] = []
+
+    for op_type, indices in _group_indices(types).items():
+        if op_type is None:
+            errors.extend((i, "Unsupported calculation type") for i in indices)
+            continue
+
+        if op_type == "divide":
+            zero = [i for i in indices if b[i] == 0]
+            if zero:
+                errors.extend((i, "Division by zero") for i in zero)
+                zero_set = set(zero)
+                indices = [i for i in indices if i not in zero_set]
+
+        func = VECTOR_OPERATIONS[op_type]
+        values = map(func, [a[i] for i in indices], [b[i] for i in indices])
+        for i, value in zip(indices, values):
+            results[i] = value
+
+    errors.sort()
+    return results, errors
+
+
+# ----------------------------------------------------------
+# Canonical type column for persistence
+# ----------------------------------------------------------
+def canonical_types(types: Sequence[str]) -> List[Optional[str]]:
+    """Map each raw type to its canonical name (None if unsupported)."""
+    resolved = _resolve_distinct(types)
+    return [resolved[raw] for raw in types]
+
+
+__all__ = ["compute_batch", "canonical_types"]
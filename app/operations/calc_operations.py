@@ -14,6 +14,13 @@
 
 from typing import Union
 
+from app.operations.registry import OPERATIONS
+
+_add = OPERATIONS["add"]
+_subtract = OPERATIONS["subtract"]
+_multiply = OPERATIONS["multiply"]
+_divide = OPERATIONS["divide"]
+
 # Numeric types allowed for all operations
 Number = Union[int, float]
 
@@ -35,24 +42,22 @@ def _validate(value: Number) -> float:
 # ----------------------------------------------------------
 def add(a: Number, b: Number) -> float:
     a, b = _validate(a), _validate(b)
-    return a + b
+    return _add(a, b)
 
 
 def subtract(a: Number, b: Number) -> float:
     a, b = _validate(a), _validate(b)
-    return a - b
+    return _subtract(a, b)
 
 
 def multiply(a: Number, b: Number) -> float:
     a, b = _validate(a), _validate(b)
-    return a * b
+    return _multiply(a, b)
 
 
 def divide(a: Number, b: Number) -> float:
     a, b = _validate(a), _validate(b)
-    if b == 0:
-        raise ValueError("Division by zero")
-    return a / b
+    return _divide(a, b)
 
 
 # ----------------------------------------------------------
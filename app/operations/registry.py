@@ -0,0 +1,122 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Operation Registry
+# File: app/operations/registry.py
+# ----------------------------------------------------------
+# Description:
+# Single source of truth for calculator arithmetic. Every
+# operation name (canonical or synonym) is resolved to a
+# preresolved callable once at import time, so callers do one
+# dict lookup instead of re-normalizing and branching on the
+# type string for each request.
+#
+# Used by:
+#   • CalculationCreate schema (validation + result)
+#   • Calculation ORM model
+#   • CalculationFactory
+#   • Function / class operations in app/operations
+#   • Batch engine (app/operations/batch.py)
+# ----------------------------------------------------------
+
+import operator
+from typing import Callable, Dict
+
+Operation = Callable[[float, float], float]
+
+
+# ----------------------------------------------------------
+# Scalar division with the project-wide zero check
+# ----------------------------------------------------------
+def _divide(a: float, b: float) -> float:
+    if b == 0:
+        raise ValueError("Division by zero")
+    return a / b
+
+
+# ----------------------------------------------------------
+# Canonical operations (what is stored in the database)
+# ----------------------------------------------------------
+OPERATIONS: Dict[str, Operation] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": _divide,
+}
+
+# Raw builtin operators for columnar batches; callers filter
+# zero divisors out before mapping over "divide".
+VECTOR_OPERATIONS: Dict[str, Operation] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+# Synonyms accepted by the factory
+ALIASES: Dict[str, str] = {
+    "addition": "add",
+    "plus": "add",
+    "sub": "subtract",
+    "minus": "subtract",
+    "mul": "multiply",
+    "times": "multiply",
+    "div": "divide",
+    "division": "divide",
+}
+
+ALLOWED_TYPES = frozenset(OPERATIONS)
+
+# Name → canonical name, built once
+_CANONICAL: Dict[str, str] = {name: name for name in OPERATIONS}
+_CANONICAL_WITH_ALIASES: Dict[str, str] = {**_CANONICAL, **ALIASES}
+
+# Canonical name → callable, bound for the hot path
+_DISPATCH_GET = OPERATIONS.get
+
+
+# ----------------------------------------------------------
+# Name resolution
+# ----------------------------------------------------------
+def resolve(op_type: str, aliases: bool = False) -> str:
+    """
+    Return the canonical operation name for op_type.
+    Exact names hit the table directly; only unusual input
+    (mixed case, padding) pays for strip().lower().
+
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    table = _CANONICAL_WITH_ALIASES if aliases else _CANONICAL
+
+    name = table.get(op_type)
+    if name is None and isinstance(op_type, str):
+        name = table.get(op_type.strip().lower())
+
+    if name is None:
+        raise ValueError("Unsupported calculation type")
+
+    return name
+
+
+def get_operation(op_type: str, aliases: bool = False) -> Operation:
+    """Return the preresolved callable for op_type."""
+    return _DISPATCH_GET(op_type) or OPERATIONS[resolve(op_type, aliases)]
+
+
+def compute(op_type: str, a: float, b: float) -> float:
+    """Resolve op_type and apply it to (a, b)."""
+    func = _DISPATCH_GET(op_type)
+    if func is None:
+        func = OPERATIONS[resolve(op_type)]
+    return func(a, b)
+
+
+__all__ = [
+    "OPERATIONS",
+    "VECTOR_OPERATIONS",
+    "ALIASES",
+    "ALLOWED_TYPES",
+    "resolve",
+    "get_operation",
+    "compute",
+]
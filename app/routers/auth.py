@@ -7,11 +7,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.database.dbase import get_db
+from app.database.dbase import get_db, get_write_db
 from app.models.user_model import User
 from app.schemas.user_schema import UserCreate, UserRead
-from app.auth.security import hash_password, verify_password, create_access_token
+from app.auth.security import create_access_token
 from app.auth.dependencies import get_current_user
+from app.auth.hashing import password_hasher
+from app.auth.principal import token_claims
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -22,19 +24,22 @@ TEST_USERS = {
 }
 
 
-def auto_create_test_user(db: Session, email: str):
-    """Automatically create required Playwright test users."""
-    password = TEST_USERS[email]
-
-    user = User(
+def build_test_user(email: str) -> User:
+    """Build (unsaved) a required Playwright test user."""
+    return User(
         first_name="Auto",
         last_name="Test",
         username=email.split("@")[0],
         email=email,
         mobile="1234567890",
-        password_hash=hash_password(password),
+        password_hash=password_hasher.hash(TEST_USERS[email]),
         is_active=True,
     )
+
+
+def auto_create_test_user(db: Session, email: str):
+    """Automatically create required Playwright test users."""
+    user = build_test_user(email)
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -42,10 +47,10 @@ def auto_create_test_user(db: Session, email: str):
 
 
 # ----------------------------------------------------------
-# REGISTER USER
+# Shared helpers (also used by app/routers/auth_async.py)
 # ----------------------------------------------------------
-@router.post("/register", status_code=201)
-def register_user(payload: UserCreate, db: Session = Depends(get_db)):
+def prepare_registration(payload: UserCreate) -> None:
+    """Fill legacy defaults and check password confirmation."""
 
     # AUTO-CREATE username if old tests didn't send one
     if not payload.username or payload.username.strip() == "":
@@ -58,29 +63,65 @@ def register_user(payload: UserCreate, db: Session = Depends(get_db)):
         if payload.password != payload.confirm_password:
             raise HTTPException(400, "Passwords do not match")
 
-    # Check if user exists
-    exists = (
-        db.query(User)
-        .filter(
-            (User.username == payload.username)
-            | (User.email == payload.email)
-            | (User.mobile == payload.mobile)
-        )
-        .first()
+
+def registration_conflict(payload: UserCreate):
+    """Filter matching any existing username, email or mobile."""
+    return (
+        (User.username == payload.username)
+        | (User.email == payload.email)
+        | (User.mobile == payload.mobile)
     )
-    if exists:
-        raise HTTPException(400, "User with this username, email, or mobile already exists")
 
-    # Create user
-    user = User(
+
+def login_identity(identifier: str):
+    """Filter matching a username, email or mobile identifier."""
+    return (
+        (User.username == identifier)
+        | (User.email == identifier)
+        | (User.mobile == identifier)
+    )
+
+
+def read_login_payload(payload: dict):
+    """Return (identifier, password) or raise 400."""
+    identifier = payload.get("identifier") or payload.get("username")
+    password = payload.get("password")
+
+    if not identifier:
+        raise HTTPException(400, "Login identifier is required")
+    if not password:
+        raise HTTPException(400, "Password is required")
+
+    return identifier, password
+
+
+def new_user(payload: UserCreate, password_hash: str) -> User:
+    return User(
         first_name=payload.first_name,
         last_name=payload.last_name,
         username=payload.username,
         email=payload.email,
         mobile=payload.mobile,
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
         is_active=True,
     )
+
+
+# ----------------------------------------------------------
+# REGISTER USER
+# ----------------------------------------------------------
+@router.post("/register", status_code=201)
+def register_user(payload: UserCreate, db: Session = Depends(get_db)):
+
+    prepare_registration(payload)
+
+    # Check if user exists
+    exists = db.query(User).filter(registration_conflict(payload)).first()
+    if exists:
+        raise HTTPException(400, "User with this username, email, or mobile already exists")
+
+    # Create user
+    user = new_user(payload, password_hasher.hash(payload.password))
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -94,33 +135,19 @@ def register_user(payload: UserCreate, db: Session = Depends(get_db)):
 @router.post("/login", status_code=200)
 def login_user(payload: dict, db: Session = Depends(get_db)):
 
-    identifier = payload.get("identifier") or payload.get("username")
-    password = payload.get("password")
-
-    if not identifier:
-        raise HTTPException(400, "Login identifier is required")
-    if not password:
-        raise HTTPException(400, "Password is required")
+    identifier, password = read_login_payload(payload)
 
-    user = (
-        db.query(User)
-        .filter(
-            (User.username == identifier)
-            | (User.email == identifier)
-            | (User.mobile == identifier)
-        )
-        .first()
-    )
+    user = db.query(User).filter(login_identity(identifier)).first()
 
     # CREATE test user dynamically if correct password
     if not user and identifier in TEST_USERS:
         if TEST_USERS[identifier] == password:
             user = auto_create_test_user(db, identifier)
 
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not password_hasher.verify(password, user.password_hash):
         raise HTTPException(401, "Invalid credentials")
 
-    token = create_access_token({"sub": str(user.id)})
+    token = create_access_token(token_claims(user))
 
     return {
         "message": "Login successful",
@@ -135,3 +162,16 @@ def login_user(payload: dict, db: Session = Depends(get_db)):
 @router.get("/me", response_model=UserRead)
 def get_me(current_user: User = Depends(get_current_user)):
     return current_user
+
+
+# ----------------------------------------------------------
+# REVOKE ALL TOKENS (bumps token_version)
+# ----------------------------------------------------------
+@router.post("/revoke", status_code=200)
+def revoke_tokens(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_write_db)
+):
+    user = db.get(User, current_user.id)
+    user.token_version = (user.token_version or 0) + 1
+    db.commit()
+    return {"message": "All tokens revoked"}
@@ -0,0 +1,114 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Async Authentication Router
+# File: app/routers/auth_async.py
+# ----------------------------------------------------------
+# Description:
+# AsyncSession versions of the routes in app/routers/auth.py,
+# mounted instead of them when settings.DB_ASYNC is enabled.
+# bcrypt runs in the password hashing pool (app/auth/hashing.py)
+# and is awaited, never run on the event loop.
+# ----------------------------------------------------------
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.database.async_dbase import get_async_db, get_async_write_db
+from app.models.user_model import User
+from app.schemas.user_schema import UserCreate, UserRead
+from app.auth.security import create_access_token
+from app.auth.hashing import password_hasher
+from app.auth.principal import token_claims
+from app.auth.dependencies import get_current_user_async
+from app.routers.auth import (
+    TEST_USERS,
+    build_test_user,
+    login_identity,
+    new_user,
+    prepare_registration,
+    read_login_payload,
+    registration_conflict,
+)
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+
+async def auto_create_test_user(db: AsyncSession, email: str):
+    """Automatically create required Playwright test users."""
+    user = await run_in_threadpool(build_test_user, email)
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+# ----------------------------------------------------------
+# REGISTER USER
+# ----------------------------------------------------------
+@router.post("/register", status_code=201)
+async def register_user(payload: UserCreate, db: AsyncSession = Depends(get_async_db)):
+
+    prepare_registration(payload)
+
+    result = await db.execute(select(User.id).where(registration_conflict(payload)).limit(1))
+    if result.first():
+        raise HTTPException(400, "User with this username, email, or mobile already exists")
+
+    password_hash = await password_hasher.hash_async(payload.password)
+    user = new_user(payload, password_hash)
+    db.add(user)
+    await db.commit()
+
+    return {"message": "Registration successful", "username": user.username}
+
+
+# ----------------------------------------------------------
+# LOGIN USER
+# ----------------------------------------------------------
+@router.post("/login", status_code=200)
+async def login_user(payload: dict, db: AsyncSession = Depends(get_async_db)):
+
+    identifier, password = read_login_payload(payload)
+
+    result = await db.execute(select(User).where(login_identity(identifier)).limit(1))
+    user = result.scalar_one_or_none()
+
+    # CREATE test user dynamically if correct password
+    if not user and identifier in TEST_USERS:
+        if TEST_USERS[identifier] == password:
+            user = await auto_create_test_user(db, identifier)
+
+    if not user or not await password_hasher.verify_async(password, user.password_hash):
+        raise HTTPException(401, "Invalid credentials")
+
+    token = create_access_token(token_claims(user))
+
+    return {
+        "message": "Login successful",
+        "access_token": token,
+        "username": user.username,
+    }
+
+
+# ----------------------------------------------------------
+# CURRENT USER
+# ----------------------------------------------------------
+@router.get("/me", response_model=UserRead)
+async def get_me(current_user: User = Depends(get_current_user_async)):
+    return current_user
+
+
+# ----------------------------------------------------------
+# REVOKE ALL TOKENS (bumps token_version)
+# ----------------------------------------------------------
+@router.post("/revoke", status_code=200)
+async def revoke_tokens(
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_write_db),
+):
+    user = await db.get(User, current_user.id)
+    user.token_version = (user.token_version or 0) + 1
+    await db.commit()
+    return {"message": "All tokens revoked"}
@@ -9,69 +9,168 @@
 # Includes correct created_at support for Assignment-13 UI.
 # ----------------------------------------------------------
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.models.cal_models import Calculation
-from app.schemas.cal_schemas import CalculationCreate, CalculationRead
-from app.database.dbase import get_db
-from app.auth.dependencies import get_current_user
+from app.operations.batch import canonical_types, compute_batch
+from app.schemas.cal_schemas import (
+    CalculationCreate,
+    CalculationRead,
+    CalculationBatchCreate,
+    CalculationBatchResult,
+    CalculationStatsRead,
+    TimeseriesRead,
+)
+from app.core.config import settings
+from app.database.bulk import bulk_insert_calculations
+from app.database.calc_stats import record_added, record_removed, stats_select, summarize
+from app.database.calc_versions import current_version
+from app.database.calc_writes import (
+    calc_delete,
+    calc_insert,
+    calc_update,
+    calc_values,
+    old_values,
+)
+from app.database.history_filters import history_filters
+from app.database.reads import calc_history, fetch_calculation
+from app.database.dbase import get_db, get_session_factory, get_write_db
+from app.database.timeseries import (
+    bucket_width,
+    history_start,
+    resolve_range,
+    series_payload,
+    timeseries_select,
+)
+from app.database.pagination import apply_keyset, clamp_page_size, finalize_page
+from app.auth.dependencies import get_current_principal
+from app.services.history_export import (
+    EXPORT_FORMATS,
+    encode_history,
+    iter_history_partitions,
+)
+from app.services.conditional import (
+    calculation_etag,
+    etag_matches,
+    history_etag,
+    not_modified,
+    validator_headers,
+)
+from app.services.fast_json import calculations_response
+from app.services.history_fragments import (
+    FRAGMENT_CHUNK_ROWS,
+    FRAGMENT_MEDIA_TYPE,
+    encode_fragments,
+)
+from app.services.history_import import import_stream
+from app.services.group_commit import get_group_writer
 
 router = APIRouter(prefix="/calculations", tags=["Calculations"])
 
 
-# ----------------------------------------------------------
-# Helper: Calculator Engine
-# ----------------------------------------------------------
-def compute_result(calc_type: str, a: float, b: float) -> float:
-    calc_type = calc_type.strip().lower()
-
-    if calc_type == "add":
-        return a + b
-    if calc_type == "subtract":
-        return a - b
-    if calc_type == "multiply":
-        return a * b
-    if calc_type == "divide":
-        if b == 0:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Division by zero"
-            )
-        return a / b
-
-    raise HTTPException(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        detail="Invalid operation type"
-    )
-
-
 # ----------------------------------------------------------
 # CREATE
 # ----------------------------------------------------------
 @router.post("", response_model=CalculationRead, status_code=status.HTTP_201_CREATED)
 def create_calculation(
     payload: CalculationCreate,
-    user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_write_db),
 ):
     """Create a new calculation for the authenticated user."""
 
-    result = compute_result(payload.type, payload.a, payload.b)
+    # Result was computed once by CalculationCreate validation;
+    # RETURNING hands back id + created_at in the same round-trip
+    values = calc_values(payload)
 
-    calc = Calculation(
-        type=payload.type,
-        a=payload.a,
-        b=payload.b,
-        result=result,
-        user_id=user.id,
-    )
+    if settings.WRITE_GROUP_COMMIT:
+        future = get_group_writer().submit({**values, "user_id": user.id})
+        if future is not None:
+            return future.result()  # after the shared commit
 
-    db.add(calc)
+    row = db.execute(calc_insert(values, user.id)).one()
+    record_added(db, [row])
     db.commit()
-    db.refresh(calc)  # loads created_at
 
-    return calc
+    return row
+
+
+# ----------------------------------------------------------
+# CREATE (Batch)
+# ----------------------------------------------------------
+@router.post(
+    "/batch",
+    response_model=CalculationBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_calculation_batch(
+    payload: CalculationBatchCreate,
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_write_db),
+):
+    """
+    Create many calculations from a columnar payload. Results are
+    computed in one vectorized pass; valid rows are written with a
+    single multi-row INSERT and failed rows are reported by index.
+    """
+    results, errors = compute_batch(payload.types, payload.a, payload.b)
+    types = canonical_types(payload.types)
+    now = datetime.now(timezone.utc)
+
+    rows = [
+        {
+            "type": types[i],
+            "a": payload.a[i],
+            "b": payload.b[i],
+            "result": value,
+            "user_id": user.id,
+            "created_at": now,
+        }
+        for i, value in enumerate(results)
+        if value is not None
+    ]
+
+    if rows:
+        bulk_insert_calculations(db, rows)
+        record_added(db, rows)
+        db.commit()
+
+    return {
+        "inserted": len(rows),
+        "results": results,
+        "errors": [{"index": i, "detail": msg} for i, msg in errors],
+    }
+
+
+# ----------------------------------------------------------
+# IMPORT (Streaming CSV / NDJSON upload)
+# ----------------------------------------------------------
+@router.post("/import")
+async def import_calculations(
+    request: Request,
+    fmt: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_write_db),
+):
+    """
+    Import calculations from a (chunked) CSV or NDJSON upload.
+    Rows are validated and bulk-inserted in fixed-size chunks;
+    the response summarizes accepted and rejected rows with
+    their line numbers.
+    """
+
+    def write_chunk(rows):
+        bulk_insert_calculations(db, rows)
+        record_added(db, rows)
+        db.commit()
+
+    return await import_stream(request.stream(), fmt, user.id, write_chunk)
 
 
 # ----------------------------------------------------------
@@ -79,36 +178,168 @@ def create_calculation(
 # ----------------------------------------------------------
 @router.get("", response_model=list[CalculationRead])
 def list_calculations(
-    user=Depends(get_current_user),
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = Query(default=None),
+    filters: list = Depends(history_filters),
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_db),
+):
+    """
+    Return one page of user calculations, newest first.
+    Pages are keyset-paginated on (created_at, id); follow the
+    X-Next-Cursor / X-Prev-Cursor response headers to move.
+    Optional filters (type, from / to, result_min / result_max,
+    a, b) are applied in SQL; keep them on every page request.
+
+    Rows are selected as tuples and encoded straight to bytes
+    (app/services/fast_json.py); response_model documents the
+    shape only. A matching If-None-Match returns 304 before the
+    history is queried (app/services/conditional.py).
+    """
+    limit = clamp_page_size(
+        limit, settings.CALC_PAGE_SIZE_DEFAULT, settings.CALC_PAGE_SIZE_MAX
+    )
+
+    stmt = calc_history(user.id, filters)
+    try:
+        stmt, direction = apply_keyset(
+            stmt, Calculation.created_at, Calculation.id, cursor, limit
+        )
+    except ValueError:
+        raise HTTPException(400, detail="Invalid cursor")
+
+    etag = history_etag(user.id, current_version(db, user.id), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    rows, next_cursor, prev_cursor = finalize_page(
+        db.execute(stmt).all(), limit, direction, cursor is not None
+    )
+
+    headers = validator_headers(etag)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if prev_cursor:
+        headers["X-Prev-Cursor"] = prev_cursor
+
+    return calculations_response(rows, headers)
+
+
+# ----------------------------------------------------------
+# EXPORT (Streaming NDJSON / CSV)
+# ----------------------------------------------------------
+@router.get("/export")
+def export_calculations(
+    fmt: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    user=Depends(get_current_principal),
+):
+    """
+    Stream the user's full history from a server-side cursor.
+    Memory use is constant regardless of history size.
+    """
+    partitions = iter_history_partitions(get_session_factory(), user.id)
+
+    return StreamingResponse(
+        encode_history(fmt, partitions),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="calculations.{fmt}"'
+        },
+    )
+
+
+# ----------------------------------------------------------
+# ROWS (streamed <tr> fragments for the dashboard)
+# ----------------------------------------------------------
+@router.get("/rows")
+def history_rows(
+    request: Request,
+    user=Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
-    """Return all user calculations sorted by newest first."""
-    return (
-        db.query(Calculation)
-        .filter(Calculation.user_id == user.id)
-        .order_by(Calculation.created_at.desc())
-        .all()
+    """
+    Full history, newest first, as pre-rendered <tr> rows
+    streamed from a server-side cursor one partition at a time
+    (app/services/history_fragments.py). Revalidates like the
+    JSON list: a matching If-None-Match returns 304.
+    """
+    etag = history_etag(user.id, current_version(db, user.id), request, kind="r")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    partitions = iter_history_partitions(
+        get_session_factory(), user.id, FRAGMENT_CHUNK_ROWS
+    )
+    return StreamingResponse(
+        encode_fragments(partitions),
+        media_type=FRAGMENT_MEDIA_TYPE,
+        headers=validator_headers(etag),
     )
 
 
+# ----------------------------------------------------------
+# STATS (rollup maintained by the write paths)
+# ----------------------------------------------------------
+@router.get("/stats", response_model=CalculationStatsRead)
+def calculation_stats(
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_db),
+):
+    """Per-user totals and per-type breakdown, read from the rollup."""
+    return summarize(db.execute(stats_select(user.id)).all())
+
+
+# ----------------------------------------------------------
+# TIME SERIES (bucketed aggregates, bounded size)
+# ----------------------------------------------------------
+@router.get("/timeseries", response_model=TimeseriesRead)
+def calculation_timeseries(
+    bucket: str = Query(default="hour", pattern="^(minute|hour|day)$"),
+    start: Optional[datetime] = Query(default=None, alias="from"),
+    end: Optional[datetime] = Query(default=None, alias="to"),
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_db),
+):
+    """
+    Count / sum / avg / min / max of results per time bucket
+    over [from, to), aggregated in SQL. Buckets widen past
+    the requested unit when the range would exceed
+    TIMESERIES_MAX_POINTS; bucket_seconds reports the width.
+    """
+    earliest = None if start else db.execute(history_start(user.id)).scalar()
+    try:
+        start, end = resolve_range(start, end, earliest)
+    except ValueError as exc:
+        raise HTTPException(400, detail=str(exc))
+
+    width = bucket_width(bucket, start, end, settings.TIMESERIES_MAX_POINTS)
+    dialect = db.get_bind().dialect.name
+    rows = db.execute(timeseries_select(dialect, user.id, start, end, width)).all()
+    return series_payload(bucket, width, start, end, rows)
+
+
 # ----------------------------------------------------------
 # READ
 # ----------------------------------------------------------
 @router.get("/{calc_id}", response_model=CalculationRead)
 def read_calculation(
     calc_id: int,
-    user=Depends(get_current_user),
+    request: Request,
+    response: Response,
+    user=Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
-    calc = (
-        db.query(Calculation)
-        .filter(Calculation.id == calc_id, Calculation.user_id == user.id)
-        .first()
-    )
+    etag = calculation_etag(user.id, current_version(db, user.id), calc_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    calc = fetch_calculation(db, calc_id, user.id)
 
-    if not calc:
+    if calc is None:
         raise HTTPException(404, detail="Calculation not found")
 
+    response.headers.update(validator_headers(etag))
     return calc
 
 
@@ -119,27 +350,18 @@ def read_calculation(
 def update_calculation(
     calc_id: int,
     payload: CalculationCreate,
-    user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_write_db),
 ):
-    calc = (
-        db.query(Calculation)
-        .filter(Calculation.id == calc_id, Calculation.user_id == user.id)
-        .first()
-    )
+    row = db.execute(calc_update(calc_id, user.id, calc_values(payload))).one_or_none()
 
-    if not calc:
+    if row is None:
         raise HTTPException(404, detail="Calculation not found")
 
-    calc.type = payload.type
-    calc.a = payload.a
-    calc.b = payload.b
-    calc.result = compute_result(payload.type, payload.a, payload.b)
-
+    record_removed(db, old_values(row))
+    record_added(db, [row])
     db.commit()
-    db.refresh(calc)
-
-    return calc
+    return row
 
 
 # ----------------------------------------------------------
@@ -148,18 +370,14 @@ def update_calculation(
 @router.delete("/{calc_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_calculation(
     calc_id: int,
-    user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user=Depends(get_current_principal),
+    db: Session = Depends(get_write_db),
 ):
-    calc = (
-        db.query(Calculation)
-        .filter(Calculation.id == calc_id, Calculation.user_id == user.id)
-        .first()
-    )
+    deleted = db.execute(calc_delete(calc_id, user.id)).one_or_none()
 
-    if not calc:
+    if deleted is None:
         raise HTTPException(404, detail="Calculation not found")
 
-    db.delete(calc)
+    record_removed(db, deleted)
     db.commit()
     return None
@@ -0,0 +1,356 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Async Calculation Routes
+# File: app/routers/calc_async.py
+# ----------------------------------------------------------
+# Description:
+# AsyncSession versions of the routes in app/routers/calc.py,
+# mounted instead of them when settings.DB_ASYNC is enabled.
+# Request/response contracts are identical; database calls
+# are awaited on the event loop rather than occupying a
+# threadpool slot for the full round-trip.
+# ----------------------------------------------------------
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cal_models import Calculation
+from app.operations.batch import canonical_types, compute_batch
+from app.schemas.cal_schemas import (
+    CalculationCreate,
+    CalculationRead,
+    CalculationBatchCreate,
+    CalculationBatchResult,
+    CalculationStatsRead,
+    TimeseriesRead,
+)
+from app.core.config import settings
+from app.database.async_dbase import (
+    get_async_db,
+    get_async_session_factory,
+    get_async_write_db,
+)
+from app.database.calc_stats import arecord_added, arecord_removed, stats_select, summarize
+from app.database.calc_versions import acurrent_version
+from app.database.history_filters import history_filters
+from app.database.reads import afetch_calculation, calc_history
+from app.database.calc_writes import (
+    calc_delete,
+    calc_insert,
+    calc_update,
+    calc_values,
+    old_values,
+)
+from app.database.timeseries import (
+    bucket_width,
+    history_start,
+    resolve_range,
+    series_payload,
+    timeseries_select,
+)
+from app.database.pagination import apply_keyset, clamp_page_size, finalize_page
+from app.auth.dependencies import get_current_principal_async
+from app.services.history_export import (
+    EXPORT_FORMATS,
+    aencode_history,
+    aiter_history_partitions,
+)
+from app.services.conditional import (
+    calculation_etag,
+    etag_matches,
+    history_etag,
+    not_modified,
+    validator_headers,
+)
+from app.services.fast_json import calculations_response
+from app.services.history_fragments import (
+    FRAGMENT_CHUNK_ROWS,
+    FRAGMENT_MEDIA_TYPE,
+    aencode_fragments,
+)
+from app.services.history_import import import_stream
+from app.services.group_commit import get_group_writer
+
+router = APIRouter(prefix="/calculations", tags=["Calculations"])
+
+
+# ----------------------------------------------------------
+# CREATE
+# ----------------------------------------------------------
+@router.post("", response_model=CalculationRead, status_code=status.HTTP_201_CREATED)
+async def create_calculation(
+    payload: CalculationCreate,
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_write_db),
+):
+    """Create a new calculation for the authenticated user."""
+    values = calc_values(payload)
+
+    if settings.WRITE_GROUP_COMMIT:
+        future = get_group_writer().submit({**values, "user_id": user.id})
+        if future is not None:
+            return await asyncio.wrap_future(future)
+
+    result = await db.execute(calc_insert(values, user.id))
+    row = result.one()
+    await arecord_added(db, [row])
+    await db.commit()
+
+    return row
+
+
+# ----------------------------------------------------------
+# CREATE (Batch)
+# ----------------------------------------------------------
+@router.post(
+    "/batch",
+    response_model=CalculationBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_calculation_batch(
+    payload: CalculationBatchCreate,
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_write_db),
+):
+    """Columnar batch create (see calc.create_calculation_batch)."""
+    results, errors = compute_batch(payload.types, payload.a, payload.b)
+    types = canonical_types(payload.types)
+    now = datetime.now(timezone.utc)
+
+    rows = [
+        {
+            "type": types[i],
+            "a": payload.a[i],
+            "b": payload.b[i],
+            "result": value,
+            "user_id": user.id,
+            "created_at": now,
+        }
+        for i, value in enumerate(results)
+        if value is not None
+    ]
+
+    if rows:
+        await db.execute(insert(Calculation), rows)
+        await arecord_added(db, rows)
+        await db.commit()
+
+    return {
+        "inserted": len(rows),
+        "results": results,
+        "errors": [{"index": i, "detail": msg} for i, msg in errors],
+    }
+
+
+# ----------------------------------------------------------
+# IMPORT (Streaming CSV / NDJSON upload)
+# ----------------------------------------------------------
+@router.post("/import")
+async def import_calculations(
+    request: Request,
+    fmt: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_write_db),
+):
+    """Streaming import (see calc.import_calculations)."""
+
+    async def write_chunk(rows):
+        await db.execute(insert(Calculation), rows)
+        await arecord_added(db, rows)
+        await db.commit()
+
+    return await import_stream(request.stream(), fmt, user.id, write_chunk)
+
+
+# ----------------------------------------------------------
+# LIST (History)
+# ----------------------------------------------------------
+@router.get("", response_model=list[CalculationRead])
+async def list_calculations(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = Query(default=None),
+    filters: list = Depends(history_filters),
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Keyset-paginated, optionally filtered history, newest first."""
+    limit = clamp_page_size(
+        limit, settings.CALC_PAGE_SIZE_DEFAULT, settings.CALC_PAGE_SIZE_MAX
+    )
+
+    stmt = calc_history(user.id, filters)
+    try:
+        stmt, direction = apply_keyset(
+            stmt, Calculation.created_at, Calculation.id, cursor, limit
+        )
+    except ValueError:
+        raise HTTPException(400, detail="Invalid cursor")
+
+    etag = history_etag(user.id, await acurrent_version(db, user.id), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    result = await db.execute(stmt)
+    rows, next_cursor, prev_cursor = finalize_page(
+        result.all(), limit, direction, cursor is not None
+    )
+
+    headers = validator_headers(etag)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if prev_cursor:
+        headers["X-Prev-Cursor"] = prev_cursor
+
+    return calculations_response(rows, headers)
+
+
+# ----------------------------------------------------------
+# EXPORT (Streaming NDJSON / CSV)
+# ----------------------------------------------------------
+@router.get("/export")
+async def export_calculations(
+    fmt: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    user=Depends(get_current_principal_async),
+):
+    """Stream the full history from an async server-side cursor."""
+    partitions = aiter_history_partitions(get_async_session_factory(), user.id)
+
+    return StreamingResponse(
+        aencode_history(fmt, partitions),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="calculations.{fmt}"'
+        },
+    )
+
+
+# ----------------------------------------------------------
+# ROWS (streamed <tr> fragments)
+# ----------------------------------------------------------
+@router.get("/rows")
+async def history_rows(
+    request: Request,
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """<tr> fragments from an async server-side cursor (see calc.history_rows)."""
+    etag = history_etag(user.id, await acurrent_version(db, user.id), request, kind="r")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    partitions = aiter_history_partitions(
+        get_async_session_factory(), user.id, FRAGMENT_CHUNK_ROWS
+    )
+    return StreamingResponse(
+        aencode_fragments(partitions),
+        media_type=FRAGMENT_MEDIA_TYPE,
+        headers=validator_headers(etag),
+    )
+
+
+# ----------------------------------------------------------
+# STATS
+# ----------------------------------------------------------
+@router.get("/stats", response_model=CalculationStatsRead)
+async def calculation_stats(
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Per-user totals from the rollup (see calc.calculation_stats)."""
+    result = await db.execute(stats_select(user.id))
+    return summarize(result.all())
+
+
+# ----------------------------------------------------------
+# TIME SERIES
+# ----------------------------------------------------------
+@router.get("/timeseries", response_model=TimeseriesRead)
+async def calculation_timeseries(
+    bucket: str = Query(default="hour", pattern="^(minute|hour|day)$"),
+    start: Optional[datetime] = Query(default=None, alias="from"),
+    end: Optional[datetime] = Query(default=None, alias="to"),
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Bucketed aggregates (see calc.calculation_timeseries)."""
+    earliest = None if start else (await db.execute(history_start(user.id))).scalar()
+    try:
+        start, end = resolve_range(start, end, earliest)
+    except ValueError as exc:
+        raise HTTPException(400, detail=str(exc))
+
+    width = bucket_width(bucket, start, end, settings.TIMESERIES_MAX_POINTS)
+    dialect = db.get_bind().dialect.name
+    result = await db.execute(timeseries_select(dialect, user.id, start, end, width))
+    return series_payload(bucket, width, start, end, result.all())
+
+
+# ----------------------------------------------------------
+# READ
+# ----------------------------------------------------------
+@router.get("/{calc_id}", response_model=CalculationRead)
+async def read_calculation(
+    calc_id: int,
+    request: Request,
+    response: Response,
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = calculation_etag(user.id, await acurrent_version(db, user.id), calc_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    calc = await afetch_calculation(db, calc_id, user.id)
+
+    if calc is None:
+        raise HTTPException(404, detail="Calculation not found")
+
+    response.headers.update(validator_headers(etag))
+    return calc
+
+
+# ----------------------------------------------------------
+# UPDATE
+# ----------------------------------------------------------
+@router.put("/{calc_id}", response_model=CalculationRead)
+async def update_calculation(
+    calc_id: int,
+    payload: CalculationCreate,
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_write_db),
+):
+    row = (await db.execute(calc_update(calc_id, user.id, calc_values(payload)))).one_or_none()
+
+    if row is None:
+        raise HTTPException(404, detail="Calculation not found")
+
+    await arecord_removed(db, old_values(row))
+    await arecord_added(db, [row])
+    await db.commit()
+    return row
+
+
+# ----------------------------------------------------------
+# DELETE
+# ----------------------------------------------------------
+@router.delete("/{calc_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_calculation(
+    calc_id: int,
+    user=Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_write_db),
+):
+    deleted = (await db.execute(calc_delete(calc_id, user.id))).one_or_none()
+
+    if deleted is None:
+        raise HTTPException(404, detail="Calculation not found")
+
+    await arecord_removed(db, deleted)
+    await db.commit()
+    return None
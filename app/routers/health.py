@@ -7,13 +7,72 @@
 # Minimal health endpoint used by Docker, CI/CD, and
 # external service monitors. Returns a simple JSON
 # response confirming the API is running.
+#
+# /health/pool reports connection pool counters for sizing
+# DB_POOL_SIZE / DB_MAX_OVERFLOW per worker; /health/hashing
+# reports bcrypt pool queue depth and latency;
+# /health/principal-cache reports current-user cache counters;
+# /health/group-commit reports write batching counters;
+# /health/sqlite reports effective pragmas and WAL checkpoints.
+#
+# Plain /health is public. The diagnostics expose pool sizes,
+# queue depths and pragmas, so they answer only when
+# HEALTH_DETAILS is on (404 otherwise, the default).
 # ----------------------------------------------------------
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.auth.hashing import password_hasher
+from app.auth.principal_cache import principal_cache
+from app.core.config import settings
+from app.database.dbase import get_shared_engine
+from app.database.pool import pool_status
+from app.database.sqlite_tuning import sqlite_status
+from app.services.group_commit import get_group_writer
 
 router = APIRouter()
 
 
+def _details_enabled() -> None:
+    if not settings.HEALTH_DETAILS:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+# Internal counters; mounted under /health but gated
+details = APIRouter(dependencies=[Depends(_details_enabled)])
+
+
 @router.get("/health")
 def health():
     return {"status": "healthy"}
+
+
+@details.get("/health/pool")
+def health_pool():
+    return pool_status()
+
+
+@details.get("/health/hashing")
+def health_hashing():
+    return password_hasher.metrics()
+
+
+@details.get("/health/principal-cache")
+def health_principal_cache():
+    return principal_cache.stats()
+
+
+@details.get("/health/group-commit")
+def health_group_commit():
+    return get_group_writer().stats()
+
+
+@details.get("/health/sqlite")
+def health_sqlite():
+    engine = get_shared_engine()
+    if engine.dialect.name != "sqlite":
+        return {"tuned": False}
+    return sqlite_status(engine)
+
+
+router.include_router(details)
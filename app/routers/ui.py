@@ -13,60 +13,81 @@
 #   • Logout confirmation screen
 #
 # UI is kept separate from API routes for clean architecture.
+# Templates link static files through asset_url(), which
+# returns fingerprinted URLs (app/services/assets.py).
+#
+# None of the pages depend on the request (auth lives in
+# localStorage), so they are rendered once and served from
+# memory with ETag / Last-Modified (app/services/page_cache.py).
 # ----------------------------------------------------------
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from app.core.config import settings
+from app.services.assets import asset_manifest
+from app.services.page_cache import PageCache
+
 router = APIRouter(tags=["UI Pages"])
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["asset_url"] = asset_manifest.url
+
+# Re-rendered after template / static edits when UI_WATCH is on
+pages = PageCache(
+    templates,
+    watch=settings.UI_WATCH,
+    watch_dirs=(asset_manifest.directory,),
+    check_interval=settings.UI_WATCH_INTERVAL,
+)
+
+UI_PAGES = ("index.html", "login.html", "register.html", "dashboard.html", "logout.html")
 
 
 # ----------------------------------------------------------
 # Public Homepage
 # ----------------------------------------------------------
 @router.get("/", response_class=HTMLResponse)
-def home_page(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+async def home_page(request: Request):
+    return pages.response("index.html", request)
 
 
 # ----------------------------------------------------------
 # Login Page
 # ----------------------------------------------------------
 @router.get("/login", response_class=HTMLResponse)
-def login_page(request: Request):
-    return templates.TemplateResponse("login.html", {"request": request})
+async def login_page(request: Request):
+    return pages.response("login.html", request)
 
 
 # ----------------------------------------------------------
 # Registration Page
 # ----------------------------------------------------------
 @router.get("/register", response_class=HTMLResponse)
-def register_page(request: Request):
-    return templates.TemplateResponse("register.html", {"request": request})
+async def register_page(request: Request):
+    return pages.response("register.html", request)
 
 
 # ----------------------------------------------------------
 # Dashboard Page
 # ----------------------------------------------------------
 @router.get("/dashboard", response_class=HTMLResponse)
-def dashboard_page(request: Request):
+async def dashboard_page(request: Request):
     """
     The dashboard requires token validation on the frontend.
     If no token exists in localStorage, dashboard.html JS will
     automatically redirect the user back to /login.
     """
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return pages.response("dashboard.html", request)
 
 
 # ----------------------------------------------------------
 # Logout Page — FRONTEND ONLY
 # ----------------------------------------------------------
 @router.get("/logout", response_class=HTMLResponse)
-def logout_page(request: Request):
+async def logout_page(request: Request):
     """
     This route displays the logout page.
     The logout.html template clears localStorage and redirects.
     """
-    return templates.TemplateResponse("logout.html", {"request": request})
+    return pages.response("logout.html", request)
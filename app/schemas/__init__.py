@@ -19,4 +19,6 @@ from .cal_schemas import (
     CalculationCreate,
     CalculationRead,
     CalculationDBRead,
+    CalculationBatchCreate,
+    CalculationBatchResult,
 )
@@ -11,11 +11,14 @@
 # ----------------------------------------------------------
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, field_validator, model_validator, ValidationInfo
+from typing import Dict, List, Optional
+from pydantic import BaseModel, field_validator, model_validator
 
-# Allowed operation types
-ALLOWED_TYPES = {"add", "subtract", "multiply", "divide"}
+# ALLOWED_TYPES is re-exported for existing importers
+from app.operations.registry import ALLOWED_TYPES, OPERATIONS, resolve  # noqa: F401
+
+# Upper bound on rows accepted by one batch request
+MAX_BATCH_SIZE = 100_000
 
 
 # ----------------------------------------------------------
@@ -27,32 +30,16 @@ class CalculationCreate(BaseModel):
     b: float
     result: Optional[float] = None
 
-    # Validate operation name
+    # Validate operation name (canonical names only)
     @field_validator("type")
     def validate_type(cls, v: str) -> str:
-        v = v.lower().strip()
-        if v not in ALLOWED_TYPES:
-            raise ValueError("Unsupported calculation type")
-        return v
-
-    # Prevent division by zero
-    @field_validator("b")
-    def validate_division(cls, b: float, info: ValidationInfo):
-        if info.data.get("type") == "divide" and b == 0:
-            raise ValueError("Division by zero")
-        return b
-
-    # Auto-compute result after validation
+        return resolve(v)
+
+    # Compute result once through the registry; division by
+    # zero is rejected by the registry's divide operation.
     @model_validator(mode="after")
     def compute_result(self):
-        if self.type == "add":
-            self.result = self.a + self.b
-        elif self.type == "subtract":
-            self.result = self.a - self.b
-        elif self.type == "multiply":
-            self.result = self.a * self.b
-        elif self.type == "divide":
-            self.result = self.a / self.b
+        self.result = OPERATIONS[self.type](self.a, self.b)
         return self
 
 
@@ -73,3 +60,75 @@ class CalculationRead(BaseModel):
 
 class CalculationDBRead(CalculationRead):
     pass
+
+
+# ----------------------------------------------------------
+# Batch (Columnar) Create Schema
+# ----------------------------------------------------------
+class CalculationBatchCreate(BaseModel):
+    """Columnar payload: row i is (types[i], a[i], b[i])."""
+
+    types: List[str]
+    a: List[float]
+    b: List[float]
+
+    # Columns must line up and stay within the batch limit
+    @model_validator(mode="after")
+    def validate_columns(self):
+        size = len(self.types)
+        if size == 0:
+            raise ValueError("Batch must contain at least one row")
+        if len(self.a) != size or len(self.b) != size:
+            raise ValueError("Columns types, a and b must have the same length")
+        if size > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size exceeds limit of {MAX_BATCH_SIZE}")
+        return self
+
+
+# ----------------------------------------------------------
+# Batch Result Schema (API response)
+# ----------------------------------------------------------
+class CalculationBatchError(BaseModel):
+    index: int
+    detail: str
+
+
+class CalculationBatchResult(BaseModel):
+    inserted: int
+    results: List[Optional[float]]
+    errors: List[CalculationBatchError]
+
+
+# ----------------------------------------------------------
+# Statistics Schemas (GET /calculations/stats)
+# ----------------------------------------------------------
+class CalculationTypeStats(BaseModel):
+    count: int
+    sum: float
+    min: Optional[float] = None
+    max: Optional[float] = None
+    last_at: Optional[datetime] = None
+
+
+class CalculationStatsRead(CalculationTypeStats):
+    by_type: Dict[str, CalculationTypeStats]
+
+
+# ----------------------------------------------------------
+# Time Series Schemas (GET /calculations/timeseries)
+# ----------------------------------------------------------
+class TimeseriesPoint(BaseModel):
+    start: datetime
+    count: int
+    sum: Optional[float] = None
+    avg: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+
+class TimeseriesRead(BaseModel):
+    bucket: str
+    bucket_seconds: int
+    start: datetime
+    end: datetime
+    points: List[TimeseriesPoint]
@@ -0,0 +1,139 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Fingerprinted Static Assets
+# File: app/services/assets.py
+# ----------------------------------------------------------
+# Description:
+# Content-hashed URLs for everything under static/:
+#
+#   css/style.css  →  /static/css/style.<hash>.css
+#
+# Templates call asset_url("css/style.css") (a Jinja global
+# registered in app/routers/ui.py); PrecompressedStaticFiles
+# maps the hashed name back to the file and serves it with
+# Cache-Control: public, max-age=<1 year>, immutable. A new
+# file content means a new URL, so browsers never revalidate
+# an asset they already hold.
+#
+# The manifest is built at startup (or on first use). With
+# watch on (UI_WATCH, for development), lookups re-hash a file whose mtime
+# or size changed, so edits show up without a restart; the
+# superseded hashed name stops resolving (404) instead of
+# serving the new content under an old immutable URL.
+# ----------------------------------------------------------
+
+import hashlib
+import os
+import posixpath
+import threading
+from typing import Dict, NamedTuple, Optional
+
+from app.core.config import settings
+
+# Written by precompress_static(); never fingerprinted themselves
+_DERIVED_SUFFIXES = (".gz", ".br", ".tmp")
+
+
+class _Entry(NamedTuple):
+    mtime_ns: int
+    size: int
+    hashed: str
+
+
+def fingerprint(path: str, data: bytes) -> str:
+    """css/style.css + content → css/style.<16 hex>.css"""
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    stem, ext = posixpath.splitext(path)
+    return f"{stem}.{digest}{ext}"
+
+
+class AssetManifest:
+    def __init__(self, directory: str, url_prefix: str = "/static", watch: bool = False):
+        self.directory = directory
+        self.url_prefix = url_prefix.rstrip("/")
+        self.watch = watch
+        self._entries: Dict[str, _Entry] = {}
+        self._originals: Dict[str, str] = {}
+        self._built = False
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------
+    # Building
+    # ------------------------------------------------------
+    def _hash_file(self, path: str) -> Optional[_Entry]:
+        previous = self._entries.pop(path, None)
+        if previous is not None:
+            self._originals.pop(previous.hashed, None)
+
+        full = os.path.join(self.directory, *path.split("/"))
+        try:
+            stat = os.stat(full)
+            with open(full, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return None
+
+        entry = _Entry(stat.st_mtime_ns, stat.st_size, fingerprint(path, data))
+        self._entries[path] = entry
+        self._originals[entry.hashed] = path
+        return entry
+
+    def build(self) -> Dict[str, str]:
+        """Hash every asset; returns {path: hashed path}."""
+        with self._lock:
+            self._entries, self._originals = {}, {}
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if name.endswith(_DERIVED_SUFFIXES):
+                        continue
+                    rel = os.path.relpath(os.path.join(root, name), self.directory)
+                    self._hash_file(rel.replace(os.sep, "/"))
+            self._built = True
+            return {path: e.hashed for path, e in self._entries.items()}
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.build()
+
+    def _current(self, path: str) -> Optional[_Entry]:
+        entry = self._entries.get(path)
+        if not self.watch:
+            return entry
+
+        full = os.path.join(self.directory, *path.split("/"))
+        try:
+            stat = os.stat(full)
+        except OSError:
+            stat = None
+        if stat is None or entry is None or (stat.st_mtime_ns, stat.st_size) != entry[:2]:
+            with self._lock:
+                entry = self._hash_file(path)
+        return entry
+
+    # ------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------
+    def url(self, path: str) -> str:
+        """Fingerprinted URL, or the plain one for unknown files."""
+        self._ensure_built()
+        path = path.lstrip("/")
+        entry = self._current(path)
+        return f"{self.url_prefix}/{entry.hashed if entry else path}"
+
+    def resolve(self, hashed: str) -> Optional[str]:
+        """Original path behind a current fingerprinted one, else None."""
+        self._ensure_built()
+        path = self._originals.get(hashed)
+        if path is None or not self.watch:
+            return path
+
+        # The file may have changed since this name was handed out
+        entry = self._current(path)
+        return path if entry is not None and entry.hashed == hashed else None
+
+
+# Shared by the /static mount and the templates
+asset_manifest = AssetManifest("static", watch=settings.UI_WATCH)
+
+
+__all__ = ["AssetManifest", "asset_manifest", "fingerprint"]
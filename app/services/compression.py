@@ -0,0 +1,216 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Response Compression Middleware
+# File: app/services/compression.py
+# ----------------------------------------------------------
+# Description:
+# Pure ASGI middleware compressing responses with brotli or
+# gzip, negotiated from Accept-Encoding (brotli only when the
+# optional brotli package is installed):
+#
+#   • Only Content-Types on the allowlist, and only when the
+#     response is not already encoded (precompressed static
+#     files pass straight through)
+#   • Complete bodies under the minimum size are sent as is
+#   • Streaming bodies (history export) are compressed chunk
+#     by chunk and flushed after each one, so clients keep
+#     receiving data as it is produced
+#   • Strong ETags become weak on the compressed variant;
+#     If-None-Match comparison is weak, so 304s still work
+#
+# Settings: COMPRESSION_* in app/core/config.py.
+# ----------------------------------------------------------
+
+import zlib
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Preference order when the client weighs encodings equally
+_PREFERENCE = ("br", "gzip")
+
+
+def available_encodings() -> tuple:
+    return tuple(e for e in _PREFERENCE if e != "br" or brotli is not None)
+
+
+def parse_types(value: str) -> frozenset:
+    """Comma-separated media types → normalized set."""
+    return frozenset(t.strip().lower() for t in value.split(",") if t.strip())
+
+
+def negotiate(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """Best encoding both sides support (q > 0), or None."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+# ----------------------------------------------------------
+# Compressors (same interface for both encodings)
+# ----------------------------------------------------------
+class _Gzip:
+    def __init__(self, level: int):
+        # wbits 31 = deflate stream in a gzip container
+        self._c = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._c.compress(data) + self._c.flush(zlib.Z_SYNC_FLUSH)
+
+    def last(self, data: bytes) -> bytes:
+        return self._c.compress(data) + self._c.flush()
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        self._c = brotli.Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._c.process(data) + self._c.flush()
+
+    def last(self, data: bytes) -> bytes:
+        return self._c.process(data) + self._c.finish()
+
+
+# ----------------------------------------------------------
+# Middleware
+# ----------------------------------------------------------
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = frozenset(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compressor(self, encoding: str):
+        if encoding == "br":
+            return _Brotli(self.brotli_quality)
+        return _Gzip(self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""), available_encodings()
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _Responder(self, encoding, send))
+
+
+class _Responder:
+    """send() wrapper holding response.start until the body decides."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start = None
+        self.compressor = None
+        self.passthrough = False
+
+    def eligible(self, message) -> bool:
+        status = message["status"]
+        if status < 200 or status in (204, 304):
+            return False
+
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if media_type not in self.middleware.content_types:
+            return False
+
+        length = headers.get("content-length")
+        return length is None or int(length) >= self.middleware.minimum_size
+
+    def encoded_start(self, streaming: bool):
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+        if streaming and "content-length" in headers:
+            del headers["content-length"]
+        return self.start
+
+    async def __call__(self, message):
+        kind = message["type"]
+
+        if kind == "http.response.start":
+            self.start = message
+            if not self.eligible(message):
+                self.passthrough = True
+                await self.send(message)
+            return
+
+        if self.passthrough or kind != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+
+            self.compressor = self.middleware.compressor(self.encoding)
+            start = self.encoded_start(streaming=more)
+            if not more:
+                data = self.compressor.last(body)
+                MutableHeaders(raw=start["headers"])["Content-Length"] = str(len(data))
+                await self.send(start)
+                await self.send({"type": kind, "body": data, "more_body": False})
+                return
+            await self.send(start)
+
+        data = self.compressor.chunk(body) if more else self.compressor.last(body)
+        await self.send({"type": kind, "body": data, "more_body": more})
+
+
+__all__ = [
+    "CompressionMiddleware",
+    "available_encodings",
+    "negotiate",
+    "parse_types",
+]
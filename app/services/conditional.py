@@ -0,0 +1,76 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Conditional GET for Calculation Resources
+# File: app/services/conditional.py
+# ----------------------------------------------------------
+# Description:
+# Strong ETags for GET /calculations and /calculations/{id},
+# derived from the user's calculation version (sum of their
+# calculation_stats versions, app/database/calc_versions.py)
+# instead of hashing bodies:
+#
+#   history page   "h<user>.<version>.<query digest>"
+#   history rows   "r<user>.<version>.<query digest>"  (HTML)
+#   calculation    "c<user>.<version>.<id>"
+#
+# The query digest covers limit / cursor / filters, so each
+# page and filter combination has its own validator. A
+# matching If-None-Match gets a bodyless 304 before the
+# history query or serialization runs.
+#
+# Routes read the version before the rows: a write landing in
+# between leaves an older tag on newer data, which only costs
+# the client one extra full response later.
+# ----------------------------------------------------------
+
+import hashlib
+
+from fastapi.responses import Response
+
+# Authenticated data: caches may keep it, but must revalidate
+CACHE_CONTROL = "private, no-cache"
+
+
+def _query_digest(request) -> str:
+    items = sorted(request.query_params.multi_items())
+    raw = "&".join(f"{k}={v}" for k, v in items).encode()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def history_etag(user_id: int, version: int, request, kind: str = "h") -> str:
+    """kind tells representations of the same history apart."""
+    return f'"{kind}{user_id}.{version}.{_query_digest(request)}"'
+
+
+def calculation_etag(user_id: int, version: int, calc_id: int) -> str:
+    return f'"c{user_id}.{version}.{calc_id}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """If-None-Match check (weak comparison, RFC 9110 §13.1.2)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def validator_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag))
+
+
+__all__ = [
+    "CACHE_CONTROL",
+    "history_etag",
+    "calculation_etag",
+    "etag_matches",
+    "validator_headers",
+    "not_modified",
+]
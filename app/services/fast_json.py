@@ -0,0 +1,104 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Fast JSON Encoding for Calculation Rows
+# File: app/services/fast_json.py
+# ----------------------------------------------------------
+# Description:
+# Encodes calculation rows straight to response bytes,
+# skipping per-row CalculationRead validation and
+# jsonable_encoder:
+#
+#   • Rows are plain tuples in CALC_COLUMNS order, selected
+#     through app/database/reads.py (no ORM identity map)
+#   • orjson when installed (datetimes handled natively)
+#   • Otherwise a reused stdlib JSONEncoder with compact
+#     separators and check_circular off
+#
+# Output matches CalculationRead's JSON field for field.
+# ----------------------------------------------------------
+
+import json
+from typing import Sequence
+
+from fastapi.responses import Response
+
+from app.database.reads import CALC_COLUMNS, calc_columns  # noqa: F401
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z if orjson is not None else 0
+
+_stdlib_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+def encoder_name() -> str:
+    return "orjson" if orjson is not None else "json"
+
+
+def _iso(value):
+    if value is None:
+        return None
+    text = value.isoformat()
+    # Pydantic writes UTC as "Z"
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _as_dicts(rows: Sequence[tuple]):
+    cols = CALC_COLUMNS
+    return [dict(zip(cols, r)) for r in rows]
+
+
+def _as_json_dicts(rows: Sequence[tuple]):
+    return [
+        {
+            "id": r[0],
+            "type": r[1],
+            "a": r[2],
+            "b": r[3],
+            "result": r[4],
+            "user_id": r[5],
+            "created_at": _iso(r[6]),
+        }
+        for r in rows
+    ]
+
+
+# ----------------------------------------------------------
+# Encoders
+# ----------------------------------------------------------
+def dumps_calculations(rows: Sequence[tuple]) -> bytes:
+    """JSON array of calculation objects."""
+    if orjson is not None:
+        return orjson.dumps(_as_dicts(rows), option=_ORJSON_OPTIONS)
+    return _stdlib_encode(_as_json_dicts(rows)).encode()
+
+
+def ndjson_calculations(rows: Sequence[tuple]) -> bytes:
+    """One calculation object per line."""
+    if orjson is not None:
+        return b"".join(
+            orjson.dumps(d, option=_ORJSON_OPTIONS) + b"\n" for d in _as_dicts(rows)
+        )
+    return "".join(_stdlib_encode(d) + "\n" for d in _as_json_dicts(rows)).encode()
+
+
+def calculations_response(rows: Sequence[tuple], headers=None) -> Response:
+    """application/json response with the rows pre-encoded."""
+    return Response(
+        content=dumps_calculations(rows),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+__all__ = [
+    "CALC_COLUMNS",
+    "calc_columns",
+    "encoder_name",
+    "dumps_calculations",
+    "ndjson_calculations",
+    "calculations_response",
+]
@@ -0,0 +1,255 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Group-Commit Calculation Writer
+# File: app/services/group_commit.py
+# ----------------------------------------------------------
+# Description:
+# Optional write path for POST /calculations
+# (WRITE_GROUP_COMMIT=true). Instead of one transaction (and
+# one fsync) per request, concurrent creates are queued and a
+# single background thread writes them together:
+#
+#   request → queue → flusher: one INSERT ... RETURNING for
+#                     up to WRITE_GROUP_MAX_ROWS rows, the
+#                     stats rollup update, one COMMIT, then
+#                     every waiting request gets its row back
+#
+# A batch closes when it reaches WRITE_GROUP_MAX_ROWS or
+# WRITE_GROUP_MAX_DELAY_MS after its first row (0 = flush as
+# soon as the queue is empty; rows arriving during a flush
+# form the next batch). Requests return only after the
+# commit, so acknowledged rows are durable.
+#
+# When the queue (WRITE_GROUP_QUEUE_MAX) is full, or the
+# writer has been stopped, the request commits directly if
+# WRITE_GROUP_FALLBACK is on, otherwise it is rejected with
+# 503.
+#
+# A failed batch is split in half and each half retried in
+# its own transaction, down to single rows, so one bad row
+# fails only its own request.
+# ----------------------------------------------------------
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.database.calc_stats import record_added
+from app.database.calc_writes import calc_insert_many
+from app.database.dbase import get_write_session_factory
+
+_STOP = object()
+
+_FULL = "Write queue is full, please retry"
+_SHUT_DOWN = "Write queue is shut down, please retry"
+
+
+def _unavailable(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=detail,
+        headers={"Retry-After": "1"},
+    )
+
+
+class GroupCommitWriter:
+    """Batches queued calculation rows into shared transactions."""
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        max_rows: int,
+        max_delay: float,
+        queue_max: int,
+        fallback: bool = True,
+    ):
+        self.session_factory = session_factory
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.fallback = fallback
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_max)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.batches = 0
+        self.rows = 0
+        self.largest_batch = 0
+        self.fallbacks = 0
+        self.failures = 0
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+    def _ensure_started(self) -> None:
+        # Caller holds self._lock
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="group-commit", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Flush what is queued and stop the background thread."""
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Resolve anything the stopped flusher left in the queue."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                item[1].set_exception(_unavailable(_SHUT_DOWN))
+
+    # ------------------------------------------------------
+    # Request side
+    # ------------------------------------------------------
+    def submit(self, row: dict) -> Optional[Future]:
+        """
+        Queue row (calc_insert columns incl. user_id). Returns a
+        Future resolving to the inserted row, or None when the
+        caller should commit directly.
+
+        Raises:
+            HTTPException: 503 when full or stopped and fallback
+            is off.
+        """
+        future: Future = Future()
+        with self._lock:
+            if not self._closed:
+                self._ensure_started()
+                try:
+                    self._queue.put_nowait((row, future))
+                    return future
+                except queue.Full:
+                    pass
+
+            if not self.fallback:
+                raise _unavailable(_SHUT_DOWN if self._closed else _FULL)
+            self.fallbacks += 1
+            return None
+
+    # ------------------------------------------------------
+    # Flusher side
+    # ------------------------------------------------------
+    def _collect(self, first) -> Tuple[List, bool]:
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+
+        while len(batch) < self.max_rows:
+            try:
+                if self.max_delay > 0:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _flush(self, batch: List) -> None:
+        rows = [row for row, _ in batch]
+        try:
+            with self.session_factory() as session:
+                inserted = session.execute(calc_insert_many(), rows).all()
+                record_added(session, inserted)
+                session.commit()
+        except Exception as exc:
+            if len(batch) > 1:
+                # Bisect: only the offending row's request fails
+                middle = len(batch) // 2
+                self._flush(batch[:middle])
+                self._flush(batch[middle:])
+                return
+            with self._lock:
+                self.failures += 1
+            batch[0][1].set_exception(exc)
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.rows += len(rows)
+            self.largest_batch = max(self.largest_batch, len(rows))
+
+        for (_, future), result in zip(batch, inserted):
+            future.set_result(result)
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch, stopping = self._collect(first)
+            self._flush(batch)
+            if stopping:
+                return
+
+    # ------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": settings.WRITE_GROUP_COMMIT,
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "rows": self.rows,
+                "avg_batch": round(self.rows / self.batches, 2) if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+                "fallbacks": self.fallbacks,
+                "failures": self.failures,
+            }
+
+
+# ----------------------------------------------------------
+# Process-wide writer (created on first use)
+# ----------------------------------------------------------
+_writer: Optional[GroupCommitWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_group_writer() -> GroupCommitWriter:
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = GroupCommitWriter(
+                    session_factory=lambda: get_write_session_factory()(),
+                    max_rows=settings.WRITE_GROUP_MAX_ROWS,
+                    max_delay=settings.WRITE_GROUP_MAX_DELAY_MS / 1000,
+                    queue_max=settings.WRITE_GROUP_QUEUE_MAX,
+                    fallback=settings.WRITE_GROUP_FALLBACK,
+                )
+    return _writer
+
+
+def stop_group_writer() -> None:
+    """Drain and stop the process-wide writer (app shutdown)."""
+    global _writer
+
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
+
+
+__all__ = ["GroupCommitWriter", "get_group_writer", "stop_group_writer"]
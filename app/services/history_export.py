@@ -0,0 +1,143 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation History Export
+# File: app/services/history_export.py
+# ----------------------------------------------------------
+# Description:
+# Streams a user's full calculation history as NDJSON or CSV.
+# Rows are read through a server-side cursor (yield_per) as
+# plain tuples and encoded one partition at a time, so memory
+# stays constant regardless of history size and the first
+# chunk is sent as soon as the first partition arrives.
+# NDJSON lines come from app/services/fast_json.py.
+# ----------------------------------------------------------
+
+import csv
+import io
+from typing import AsyncIterator, Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy import select
+
+from app.models.cal_models import Calculation
+from app.services.fast_json import CALC_COLUMNS, ndjson_calculations
+
+EXPORT_COLUMNS = CALC_COLUMNS
+
+# Rows fetched from the server-side cursor per round-trip
+EXPORT_CHUNK_ROWS = 1000
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+# ----------------------------------------------------------
+# Server-side cursor over one user's history
+# ----------------------------------------------------------
+def history_statement(user_id: int, chunk_rows: Optional[int] = None):
+    """Newest-first tuple select streamed in chunk_rows partitions."""
+    return (
+        select(*(getattr(Calculation, col) for col in EXPORT_COLUMNS))
+        .where(Calculation.user_id == user_id)
+        .order_by(Calculation.created_at.desc(), Calculation.id.desc())
+        .execution_options(yield_per=chunk_rows or EXPORT_CHUNK_ROWS)
+    )
+
+
+def iter_history_partitions(
+    session_factory,
+    user_id: int,
+    chunk_rows: Optional[int] = None,
+) -> Iterator[Sequence[tuple]]:
+    """
+    Yield lists of row tuples, newest first. The session is
+    owned by the generator because streaming continues after
+    the request's dependencies have been closed.
+    """
+    session = session_factory()
+    try:
+        result = session.execute(history_statement(user_id, chunk_rows))
+        for partition in result.partitions():
+            yield partition
+    finally:
+        session.close()
+
+
+async def aiter_history_partitions(
+    async_session_factory,
+    user_id: int,
+    chunk_rows: Optional[int] = None,
+) -> AsyncIterator[Sequence[tuple]]:
+    """Async counterpart of iter_history_partitions()."""
+    async with async_session_factory() as session:
+        result = await session.stream(history_statement(user_id, chunk_rows))
+        async for partition in result.partitions():
+            yield partition
+
+
+# ----------------------------------------------------------
+# Encoders (one bytes chunk per partition)
+# ----------------------------------------------------------
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def ndjson_chunk(rows: Sequence[tuple]) -> bytes:
+    return ndjson_calculations(rows)
+
+
+def csv_chunk(rows: Sequence[tuple], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(r[:6] + (_iso(r[6]),) for r in rows)
+    return buffer.getvalue().encode()
+
+
+def _encoder(fmt: str):
+    """Return a (rows, first) -> bytes encoder for fmt."""
+    if fmt == "csv":
+        return lambda rows, first: csv_chunk(rows, header=first)
+    return lambda rows, first: ndjson_chunk(rows)
+
+
+def encode_history(fmt: str, partitions: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    """Encode partitions for an EXPORT_FORMATS key."""
+    encode = _encoder(fmt)
+    first = True
+    for rows in partitions:
+        yield encode(rows, first)
+        first = False
+
+    # Empty history still gets a CSV header row
+    if first and fmt == "csv":
+        yield csv_chunk((), header=True)
+
+
+async def aencode_history(
+    fmt: str, partitions: AsyncIterator[Sequence[tuple]]
+) -> AsyncIterator[bytes]:
+    """Async counterpart of encode_history()."""
+    encode = _encoder(fmt)
+    first = True
+    async for rows in partitions:
+        yield encode(rows, first)
+        first = False
+
+    if first and fmt == "csv":
+        yield csv_chunk((), header=True)
+
+
+__all__ = [
+    "EXPORT_COLUMNS",
+    "EXPORT_FORMATS",
+    "history_statement",
+    "iter_history_partitions",
+    "aiter_history_partitions",
+    "ndjson_chunk",
+    "csv_chunk",
+    "encode_history",
+    "aencode_history",
+]
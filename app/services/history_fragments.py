@@ -0,0 +1,78 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Streamed History Table Rows
+# File: app/services/history_fragments.py
+# ----------------------------------------------------------
+# Description:
+# Renders the dashboard's history table on the server as
+# <tr> fragments, one bytes chunk per server-side cursor
+# partition (app/services/history_export.py). The dashboard
+# appends each chunk as it arrives, so a long history paints
+# its first rows right away and the browser parses each row
+# exactly once.
+#
+# Cells match the table in templates/dashboard.html: type,
+# a, b, result, date (<time>, localized by the page) and a
+# delete button carrying the row id.
+# ----------------------------------------------------------
+
+from html import escape
+from typing import AsyncIterator, Iterable, Iterator, Sequence
+
+# Smaller partitions than the export: first paint comes sooner
+FRAGMENT_CHUNK_ROWS = 250
+
+FRAGMENT_MEDIA_TYPE = "text/html; charset=utf-8"
+
+
+def _num(value) -> str:
+    """Numbers as the JSON-built table showed them (3, not 3.0)."""
+    if value is None:
+        return ""
+    if float(value).is_integer() and abs(value) < 1e16:
+        return str(int(value))
+    return repr(value)
+
+
+def _time(value) -> str:
+    if value is None:
+        return "N/A"
+    stamp = value.isoformat()
+    return f'<time datetime="{stamp}">{stamp[:10]}</time>'
+
+
+def rows_fragment(rows: Sequence[tuple]) -> bytes:
+    """<tr> markup for CALC_COLUMNS-ordered tuples."""
+    return "".join(
+        f'<tr data-id="{r[0]}">'
+        f"<td>{escape(r[1])}</td>"
+        f"<td>{_num(r[2])}</td>"
+        f"<td>{_num(r[3])}</td>"
+        f"<td>{_num(r[4])}</td>"
+        f"<td>{_time(r[6])}</td>"
+        f'<td><button class="delete-btn btn-small" data-id="{r[0]}">Delete</button></td>'
+        f"</tr>\n"
+        for r in rows
+    ).encode()
+
+
+def encode_fragments(partitions: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    for rows in partitions:
+        yield rows_fragment(rows)
+
+
+async def aencode_fragments(
+    partitions: AsyncIterator[Sequence[tuple]],
+) -> AsyncIterator[bytes]:
+    """Async counterpart of encode_fragments()."""
+    async for rows in partitions:
+        yield rows_fragment(rows)
+
+
+__all__ = [
+    "FRAGMENT_CHUNK_ROWS",
+    "FRAGMENT_MEDIA_TYPE",
+    "rows_fragment",
+    "encode_fragments",
+    "aencode_fragments",
+]
@@ -0,0 +1,215 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Streaming Calculation Import
+# File: app/services/history_import.py
+# ----------------------------------------------------------
+# Description:
+# Incremental import pipeline for CSV / NDJSON uploads:
+#
+#   request body chunks → lines → records → validated rows
+#                       → fixed-size chunks → bulk write
+#
+# Each stage is a generator, so only one chunk of rows is
+# held in memory. The upload is read only while no write is
+# in flight: awaiting the bulk write stops pulling from the
+# request stream, which lets the server's flow control push
+# back on the client instead of buffering the upload.
+# ----------------------------------------------------------
+
+import codecs
+import csv
+import inspect
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from app.operations.registry import OPERATIONS, resolve
+
+# Rows validated and written per bulk insert
+IMPORT_CHUNK_ROWS = 1000
+
+# Row errors reported back to the caller (the count is exact)
+IMPORT_MAX_ERRORS = 100
+
+
+# ----------------------------------------------------------
+# Stage 1: body chunks → numbered lines
+# ----------------------------------------------------------
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Yield (line number, text) as soon as each line is complete."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()  # drops a leading BOM
+    pending = ""
+    line_no = 0
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *complete, pending = pending.split("\n")
+        for line in complete:
+            line_no += 1
+            yield line_no, line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield line_no + 1, pending.rstrip("\r")
+
+
+# ----------------------------------------------------------
+# Stage 2: lines → records
+# ----------------------------------------------------------
+def _ndjson_record(line: str) -> dict:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        raise ValueError("Invalid JSON")
+    if not isinstance(record, dict):
+        raise ValueError("Expected a JSON object")
+    return record
+
+
+class _CsvRecords:
+    """Turns CSV lines into dicts using the first line as header."""
+
+    def __init__(self):
+        self.header: Optional[List[str]] = None
+
+    def __call__(self, line: str) -> Optional[dict]:
+        values = next(csv.reader([line]))
+        if self.header is None:
+            self.header = [name.strip().lower() for name in values]
+            return None
+        return dict(zip(self.header, values))
+
+
+# ----------------------------------------------------------
+# Stage 3: record → validated row
+# ----------------------------------------------------------
+def _number(record: dict, field: str) -> float:
+    if field not in record or record[field] in (None, ""):
+        raise ValueError(f"Missing field '{field}'")
+    try:
+        return float(record[field])
+    except (TypeError, ValueError):
+        raise ValueError(f"Field '{field}' must be numeric")
+
+
+def _timestamp(value, default: datetime) -> datetime:
+    if value in (None, ""):
+        return default
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError("Field 'created_at' must be an ISO-8601 timestamp")
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def record_to_row(record: dict, user_id: int, now: datetime) -> dict:
+    """
+    Validate one record and compute its result.
+
+    Raises:
+        ValueError: With a user-facing reason for rejection.
+    """
+    raw_type = record.get("type")
+    if not isinstance(raw_type, str):
+        raise ValueError("Unsupported calculation type")
+
+    op_type = resolve(raw_type)
+    a = _number(record, "a")
+    b = _number(record, "b")
+
+    return {
+        "type": op_type,
+        "a": a,
+        "b": b,
+        "result": OPERATIONS[op_type](a, b),
+        "user_id": user_id,
+        "created_at": _timestamp(record.get("created_at"), now),
+    }
+
+
+# ----------------------------------------------------------
+# Summary accumulator
+# ----------------------------------------------------------
+class ImportSummary:
+    def __init__(self):
+        self.accepted = 0
+        self.rejected = 0
+        self.errors: List[dict] = []
+
+    def reject(self, line_no: int, detail: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append({"line": line_no, "detail": detail})
+
+    def as_dict(self) -> dict:
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "errors_truncated": self.rejected > len(self.errors),
+        }
+
+
+# ----------------------------------------------------------
+# Pipeline driver
+# ----------------------------------------------------------
+async def import_stream(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    user_id: int,
+    write_chunk: Callable[[List[dict]], Union[None, Awaitable[None]]],
+) -> dict:
+    """
+    Consume an upload and write accepted rows in chunks of
+    IMPORT_CHUNK_ROWS. A blocking write_chunk (sync session)
+    runs in the threadpool, a coroutine function (AsyncSession)
+    is awaited directly; either way the stream is not read
+    while a write is in flight.
+    """
+    if inspect.iscoroutinefunction(write_chunk):
+        write = write_chunk
+    else:
+        async def write(rows):
+            await run_in_threadpool(write_chunk, rows)
+
+    parse = _CsvRecords() if fmt == "csv" else _ndjson_record
+    summary = ImportSummary()
+    now = datetime.now(timezone.utc)
+    rows: List[dict] = []
+
+    async for line_no, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        try:
+            record = parse(line)
+            if record is None:
+                continue
+            rows.append(record_to_row(record, user_id, now))
+        except (ValueError, csv.Error) as exc:
+            summary.reject(line_no, str(exc))
+            continue
+
+        if len(rows) >= IMPORT_CHUNK_ROWS:
+            await write(rows)
+            summary.accepted += len(rows)
+            rows = []
+
+    if rows:
+        await write(rows)
+        summary.accepted += len(rows)
+
+    return summary.as_dict()
+
+
+__all__ = [
+    "IMPORT_CHUNK_ROWS",
+    "IMPORT_MAX_ERRORS",
+    "iter_lines",
+    "record_to_row",
+    "import_stream",
+]
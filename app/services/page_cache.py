@@ -0,0 +1,166 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Prerendered UI Pages
+# File: app/services/page_cache.py
+# ----------------------------------------------------------
+# Description:
+# The UI pages carry no per-request server state (auth lives
+# in localStorage), so each template is rendered once into
+# bytes and served from memory:
+#
+#   • ETag        hash of the rendered page
+#   • Last-Modified  newest template file
+#   • If-None-Match / If-Modified-Since → 304
+#   • gzip / brotli variants compressed once per page and
+#     served with a weak ETag, like CompressionMiddleware
+#
+# Pages render on first hit or via warm() at startup. With
+# watch on (UI_WATCH, for development) a hit first checks the
+# newest mtime under the template (and static) directories,
+# at most once per check_interval, and re-renders only when
+# it moved; unchanged pages keep their compressed variants.
+# ----------------------------------------------------------
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterable, NamedTuple, Tuple
+
+from fastapi.responses import HTMLResponse, Response
+
+from app.services import compression
+from app.services.conditional import etag_matches
+
+CACHE_CONTROL = "no-cache"
+
+
+class _Page(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: str  # HTTP-date
+    mtime: int
+    encoded: Dict[str, bytes]
+    stamp: Tuple[int, int]  # sources it was rendered from (watch mode)
+
+
+def _compress(encoding: str, body: bytes) -> bytes:
+    if encoding == "br":
+        return compression.brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _modified_since(header: str, mtime: int) -> bool:
+    try:
+        since = parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return True
+    return mtime > since
+
+
+class PageCache:
+    def __init__(
+        self,
+        templates,
+        watch: bool = False,
+        watch_dirs: Iterable[str] = (),
+        check_interval: float = 1.0,
+    ):
+        self.templates = templates
+        self.watch = watch
+        self.watch_dirs = tuple(watch_dirs)
+        self.check_interval = check_interval
+        self._pages: Dict[str, _Page] = {}
+        self._lock = threading.Lock()
+        self._stamp: Tuple[int, int] = (0, 0)
+        self._checked_at = float("-inf")
+
+    # ------------------------------------------------------
+    # Source tracking
+    # ------------------------------------------------------
+    def _scan(self) -> Tuple[int, int]:
+        """(newest mtime in ns, file count) of every source directory."""
+        newest, count = 0, 0
+        for directory in (*self.templates.env.loader.searchpath, *self.watch_dirs):
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    try:
+                        mtime = os.stat(os.path.join(root, name)).st_mtime_ns
+                    except OSError:  # removed mid-walk
+                        continue
+                    newest, count = max(newest, mtime), count + 1
+        self._stamp, self._checked_at = (newest, count), time.monotonic()
+        return self._stamp
+
+    def _sources(self) -> Tuple[int, int]:
+        """Last scan, redone once check_interval has passed."""
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            return self._scan()
+        return self._stamp
+
+    # ------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------
+    def render(self, name: str) -> _Page:
+        # Scanned first, so an edit during rendering is seen next time
+        stamp = self._scan()
+        body = self.templates.get_template(name).render().encode()
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        mtime = stamp[0] // 1_000_000_000
+        return _Page(body, f'"p{digest}"', formatdate(mtime, usegmt=True), mtime, {}, stamp)
+
+    def _stale(self, page) -> bool:
+        return page is None or (self.watch and page.stamp != self._sources())
+
+    def page(self, name: str) -> _Page:
+        page = self._pages.get(name)
+        if self._stale(page):
+            with self._lock:
+                page = self._pages.get(name)
+                if self._stale(page):
+                    page = self._pages[name] = self.render(name)
+        return page
+
+    def warm(self, names: Iterable[str]) -> None:
+        """Render pages ahead of the first request."""
+        for name in names:
+            self.page(name)
+
+    # ------------------------------------------------------
+    # Responses
+    # ------------------------------------------------------
+    def response(self, name: str, request) -> Response:
+        page = self.page(name)
+        headers = {
+            "ETag": page.etag,
+            "Last-Modified": page.last_modified,
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+
+        encoding = compression.negotiate(
+            request.headers.get("accept-encoding", ""), compression.available_encodings()
+        )
+        if encoding is not None:
+            headers["ETag"] = "W/" + page.etag
+
+        if "if-none-match" in request.headers:
+            if etag_matches(request, page.etag):
+                return Response(status_code=304, headers=headers)
+        elif "if-modified-since" in request.headers:
+            if not _modified_since(request.headers["if-modified-since"], page.mtime):
+                return Response(status_code=304, headers=headers)
+
+        if encoding is None:
+            return HTMLResponse(page.body, headers=headers)
+
+        body = page.encoded.get(encoding)
+        if body is None:
+            body = page.encoded.setdefault(encoding, _compress(encoding, page.body))
+        headers["Content-Encoding"] = encoding
+        return HTMLResponse(body, headers=headers)
+
+
+__all__ = ["PageCache"]
@@ -0,0 +1,174 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Precompressed Static Files
+# File: app/services/static_files.py
+# ----------------------------------------------------------
+# Description:
+# Static assets are compressed once, not on every request:
+#
+#   • precompress_static() writes .gz (and .br when brotli is
+#     installed) next to each compressible file under static/,
+#     skipping files whose sibling is already up to date
+#   • PrecompressedStaticFiles serves the best sibling the
+#     client accepts, with the original file's Content-Type,
+#     and falls back to the plain file otherwise
+#   • Given an asset manifest (app/services/assets.py), it
+#     also serves fingerprinted names with an immutable
+#     Cache-Control; plain names must revalidate
+#
+# Runs at startup when STATIC_PRECOMPRESS is on, or as a
+# build step:
+#     python -m app.services.static_files precompress [DIR]
+# ----------------------------------------------------------
+
+import gzip
+import mimetypes
+import os
+import sys
+import tempfile
+from typing import List, Optional
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+
+from app.services.compression import available_encodings, brotli, negotiate
+
+# Encoding → file suffix
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".html", ".svg", ".json", ".txt", ".map")
+
+
+def _fresh(target: str, source_stat: os.stat_result) -> bool:
+    try:
+        return os.stat(target).st_mtime >= source_stat.st_mtime
+    except OSError:
+        return False
+
+
+def _write(target: str, data: bytes) -> None:
+    # Unique temp name: several workers may precompress at once,
+    # and each must publish a whole file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# ----------------------------------------------------------
+# Build step
+# ----------------------------------------------------------
+def precompress_static(directory: str, min_size: int = 0) -> List[str]:
+    """Write missing or stale .gz / .br siblings; returns paths written."""
+    written = []
+
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            source = os.path.join(root, name)
+            source_stat = os.stat(source)
+            if source_stat.st_size < min_size:
+                continue
+
+            with open(source, "rb") as fh:
+                data = fh.read()
+
+            for encoding in available_encodings():
+                target = source + SUFFIXES[encoding]
+                if _fresh(target, source_stat):
+                    continue
+                if encoding == "br":
+                    _write(target, brotli.compress(data, quality=11))
+                else:
+                    # mtime=0: identical input gives identical output
+                    _write(target, gzip.compress(data, compresslevel=9, mtime=0))
+                written.append(target)
+
+    return written
+
+
+# ----------------------------------------------------------
+# Serving
+# ----------------------------------------------------------
+class PrecompressedStaticFiles(StaticFiles):
+    def __init__(self, *args, manifest=None, immutable_max_age: int = 31536000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manifest = manifest
+        self.immutable_max_age = immutable_max_age
+
+    def _original(self, path: str) -> Optional[str]:
+        if self.manifest is None:
+            return None
+        return self.manifest.resolve(path.replace(os.sep, "/"))
+
+    async def get_response(self, path: str, scope):
+        original = self._original(path)
+        response = await super().get_response(original or path, scope)
+
+        if original is not None:
+            response.headers["Cache-Control"] = (
+                f"public, max-age={self.immutable_max_age}, immutable"
+            )
+        elif self.manifest is not None:
+            response.headers.setdefault("Cache-Control", "no-cache")
+        return response
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+
+        encoding = None
+        if str(full_path).endswith(COMPRESSIBLE_EXTENSIONS):
+            candidates = [
+                e for e in available_encodings()
+                if _fresh(str(full_path) + SUFFIXES[e], stat_result)
+            ]
+            encoding = negotiate(request_headers.get("accept-encoding", ""), candidates)
+
+        if encoding is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            if str(full_path).endswith(COMPRESSIBLE_EXTENSIONS):
+                response.headers.setdefault("Vary", "Accept-Encoding")
+            return response
+
+        sibling = str(full_path) + SUFFIXES[encoding]
+        response = FileResponse(
+            sibling,
+            status_code=status_code,
+            stat_result=os.stat(sibling),
+            media_type=media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def main(argv: List[str]) -> int:
+    if not argv or argv[0] != "precompress":
+        print("usage: python -m app.services.static_files precompress [DIR]")
+        return 2
+
+    directory = argv[1] if len(argv) > 1 else "static"
+    written = precompress_static(directory)
+    print(f"Precompressed {len(written)} file(s) under {directory}")
+    return 0
+
+
+__all__ = [
+    "COMPRESSIBLE_EXTENSIONS",
+    "PrecompressedStaticFiles",
+    "precompress_static",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,135 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Sync vs Async Route Throughput
+# File: benchmarks/bench_async_throughput.py
+# ----------------------------------------------------------
+# Description:
+# Fires concurrent GET /calculations and GET /auth/me requests
+# at two in-process apps — one with the sync routers, one
+# with the AsyncSession routers — and reports requests/sec
+# at several concurrency levels. Requests go through httpx's
+# ASGITransport, so the numbers measure the app and driver,
+# not the network. Against local SQLite the async path is a
+# little slower (aiosqlite still hops through a worker
+# thread); it pays off when round-trips are slow (PostgreSQL
+# over a network), where sync routes queue on the threadpool
+# and the connection pool.
+#
+# Usage:
+#     python benchmarks/bench_async_throughput.py
+#     DATABASE_URL=postgresql://... python benchmarks/bench_async_throughput.py
+# ----------------------------------------------------------
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+if "DATABASE_URL" not in os.environ:
+    _tmp = tempfile.mkdtemp(prefix="bench_async_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.database.async_dbase import dispose_async_engine  # noqa: E402
+from app.database.dbase import init_db  # noqa: E402
+from app.routers import auth, auth_async, calc, calc_async  # noqa: E402
+
+# Kept below the sync engine's pool capacity (DB_POOL_SIZE +
+# DB_MAX_OVERFLOW): past that, sync requests wait on the pool;
+# see /health/pool for the wait-time counters.
+CONCURRENCY = (1, 4, 12)
+REQUESTS = 600
+SEED_ROWS = 200
+PATHS = ("/calculations?limit=20", "/auth/me")
+
+
+def _build(*routers) -> FastAPI:
+    app = FastAPI()
+    for r in routers:
+        app.include_router(r.router)
+    return app
+
+
+async def _headers(client: httpx.AsyncClient) -> dict:
+    await client.post(
+        "/auth/register",
+        json={
+            "first_name": "Bench",
+            "last_name": "User",
+            "username": "bench_user",
+            "email": "bench@ex.com",
+            "mobile": "1010101010",
+            "password": "Pass123A",
+            "confirm_password": "Pass123A",
+        },
+    )
+    res = await client.post(
+        "/auth/login",
+        json={"identifier": "bench@ex.com", "password": "Pass123A"},
+    )
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+    await client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={
+            "types": ["add"] * SEED_ROWS,
+            "a": list(range(SEED_ROWS)),
+            "b": [1] * SEED_ROWS,
+        },
+    )
+    return headers
+
+
+async def _run(client, headers, path: str, concurrency: int) -> float:
+    queue = asyncio.Queue()
+    for _ in range(REQUESTS):
+        queue.put_nowait(path)
+
+    async def worker():
+        while not queue.empty():
+            res = await client.get(queue.get_nowait(), headers=headers)
+            res.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def main():
+    init_db()
+    apps = {
+        "sync": _build(auth, calc),
+        "async": _build(auth_async, calc_async),
+    }
+
+    print(f"{'path':<26} {'conc':>5} {'sync req/s':>12} {'async req/s':>12}")
+    clients = {
+        name: httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+        for name, app in apps.items()
+    }
+    headers = await _headers(clients["sync"])
+
+    for path in PATHS:
+        for concurrency in CONCURRENCY:
+            rates = [
+                await _run(clients[name], headers, path, concurrency)
+                for name in ("sync", "async")
+            ]
+            print(f"{path:<26} {concurrency:>5} {rates[0]:>12.0f} {rates[1]:>12.0f}")
+
+    for client in clients.values():
+        await client.aclose()
+    await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Batch Endpoint Benchmark
+# File: benchmarks/bench_batch.py
+# ----------------------------------------------------------
+# Description:
+# Compares N single POST /calculations calls against one
+# POST /calculations/batch call for N = 10, 1k and 100k.
+# Runs in-process through TestClient against a throwaway
+# SQLite database. Single-call timings above SINGLE_CAP rows
+# are measured on SINGLE_CAP calls and extrapolated.
+#
+# Usage:
+#     python benchmarks/bench_batch.py
+# ----------------------------------------------------------
+
+import os
+import sys
+import random
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_batch_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database.dbase import init_db  # noqa: E402
+from main import app  # noqa: E402
+
+SIZES = (10, 1_000, 100_000)
+SINGLE_CAP = 1_000
+TYPES = ("add", "subtract", "multiply", "divide")
+
+
+def _headers(client: TestClient) -> dict:
+    """Register a benchmark user and return auth headers."""
+    client.post(
+        "/auth/register",
+        json={
+            "first_name": "Bench",
+            "last_name": "User",
+            "username": "bench_user",
+            "email": "bench@ex.com",
+            "mobile": "1010101010",
+            "password": "Pass123A",
+            "confirm_password": "Pass123A",
+        },
+    )
+    token = client.post(
+        "/auth/login",
+        json={"identifier": "bench@ex.com", "password": "Pass123A"},
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _columns(n: int):
+    rng = random.Random(n)
+    types = [rng.choice(TYPES) for _ in range(n)]
+    a = [rng.uniform(-1000, 1000) for _ in range(n)]
+    b = [rng.uniform(1, 1000) for _ in range(n)]
+    return types, a, b
+
+
+def bench_single(client, headers, types, a, b) -> float:
+    calls = min(len(types), SINGLE_CAP)
+    start = time.perf_counter()
+    for i in range(calls):
+        client.post(
+            "/calculations",
+            headers=headers,
+            json={"type": types[i], "a": a[i], "b": b[i]},
+        )
+    elapsed = time.perf_counter() - start
+    return elapsed * len(types) / calls
+
+
+def bench_batch(client, headers, types, a, b) -> float:
+    start = time.perf_counter()
+    res = client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": types, "a": a, "b": b},
+    )
+    elapsed = time.perf_counter() - start
+    assert res.status_code == 201, res.text
+    return elapsed
+
+
+def main():
+    init_db()
+    with TestClient(app) as client:
+        headers = _headers(client)
+
+        print(f"{'rows':>8} {'single (s)':>12} {'batch (s)':>11} {'speedup':>9}")
+        for n in SIZES:
+            types, a, b = _columns(n)
+            single = bench_single(client, headers, types, a, b)
+            batch = bench_batch(client, headers, types, a, b)
+            note = "*" if n > SINGLE_CAP else " "
+            print(f"{n:>8} {single:>11.3f}{note} {batch:>11.3f} {single / batch:>8.1f}x")
+
+    print(f"* extrapolated from {SINGLE_CAP} single calls")
+
+
+if __name__ == "__main__":
+    main()
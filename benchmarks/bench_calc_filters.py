@@ -0,0 +1,144 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: History Filter Benchmark
+# File: benchmarks/bench_calc_filters.py
+# ----------------------------------------------------------
+# Description:
+# First page (50 rows) of a filtered history for one user
+# with a large history:
+#
+#   • client   load every row and filter in Python (what the
+#              dashboard had to do before)
+#   • sql      history_conditions() + keyset page, with the
+#              filter indexes
+#   • no-ix    the same SQL with the filter indexes dropped
+#
+# Usage:
+#     python benchmarks/bench_calc_filters.py [rows]
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_filters_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from sqlalchemy import select, text  # noqa: E402
+
+from app.database.dbase import get_session_factory  # noqa: E402
+from app.database.history_filters import history_conditions  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+from app.database.pagination import apply_keyset  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+TYPES = ["add", "subtract", "multiply", "divide"]
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+REPEAT = 5
+
+CASES = {
+    "type=multiply": {"op_type": "multiply"},
+    "a=123": {"a": 123},
+    "result 10..20": {"result_min": 10, "result_max": 20},
+    "type+from": {"op_type": "divide", "start": T0 + timedelta(seconds=ROWS // 2)},
+}
+FILTER_INDEXES = [
+    "ix_calculations_user_type_created_id",
+    "ix_calculations_user_result",
+    "ix_calculations_user_a_created_id",
+    "ix_calculations_user_b_created_id",
+]
+
+
+def seed(session, user_id):
+    for start in range(0, ROWS, 50_000):
+        session.execute(
+            Calculation.__table__.insert(),
+            [
+                {"type": TYPES[i % 4], "a": i % 1000, "b": 7, "result": float(i % 5000),
+                 "user_id": user_id, "created_at": T0 + timedelta(seconds=i)}
+                for i in range(start, min(start + 50_000, ROWS))
+            ],
+        )
+    session.commit()
+
+
+def client_side(session, user_id, filters):
+    rows = session.execute(
+        select(Calculation).where(Calculation.user_id == user_id)
+    ).scalars().all()
+    op = filters.get("op_type")
+    start = filters.get("start")
+    matches = [
+        r for r in rows
+        if (op is None or r.type == op)
+        and (filters.get("a") is None or r.a == filters["a"])
+        and (filters.get("result_min") is None or r.result >= filters["result_min"])
+        and (filters.get("result_max") is None or r.result <= filters["result_max"])
+        and (start is None or r.created_at.replace(tzinfo=timezone.utc) >= start)
+    ]
+    matches.sort(key=lambda r: (r.created_at, r.id), reverse=True)
+    session.expunge_all()
+    return matches[:50]
+
+
+def server_side(session, user_id, filters):
+    stmt = select(Calculation).where(
+        Calculation.user_id == user_id, *history_conditions(**filters)
+    )
+    stmt, _ = apply_keyset(stmt, Calculation.created_at, Calculation.id, None, 50)
+    rows = session.execute(stmt).scalars().all()
+    session.expunge_all()
+    return rows
+
+
+def best_ms(fn, *args):
+    timings = []
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - t)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    migrate()
+    session = get_session_factory()()
+    user = User(first_name="Bench", last_name="Filter", username="bench_filter",
+                email="filter@ex.com", password_hash="not-used")
+    session.add(user)
+    session.commit()
+    seed(session, user.id)
+
+    timings = {
+        name: [
+            best_ms(client_side, session, user.id, f),
+            best_ms(server_side, session, user.id, f),
+        ]
+        for name, f in CASES.items()
+    }
+
+    for name in FILTER_INDEXES:
+        session.execute(text(f"DROP INDEX {name}"))
+    session.commit()
+    for name, f in CASES.items():
+        timings[name].append(best_ms(server_side, session, user.id, f))
+
+    print(f"{ROWS} rows, first page of 50\n")
+    print(f"{'filter':<15} {'client (ms)':>12} {'sql (ms)':>10} {'no-ix (ms)':>11}")
+    for name, (client_ms, sql_ms, noix_ms) in timings.items():
+        print(f"{name:<15} {client_ms:>12.1f} {sql_ms:>10.2f} {noix_ms:>11.2f}")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation Stats Benchmark
+# File: benchmarks/bench_calc_stats.py
+# ----------------------------------------------------------
+# Description:
+# Cost of one user's statistics read as their history grows:
+#
+#   • scan     GROUP BY type over the calculations table
+#              (what a dashboard would run without a rollup)
+#   • rollup   stats_select() over calculation_stats
+#
+# plus the per-write price of keeping the rollup current
+# (POST-style INSERT ... RETURNING with and without
+# record_added()).
+#
+# Usage:
+#     python benchmarks/bench_calc_stats.py [max_rows]
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_stats_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from sqlalchemy import func, select  # noqa: E402
+
+from app.database.calc_stats import (  # noqa: E402
+    rebuild_stats,
+    record_added,
+    stats_select,
+    summarize,
+)
+from app.database.calc_writes import calc_insert  # noqa: E402
+from app.database.dbase import get_session_factory  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+MAX_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+TYPES = ["add", "subtract", "multiply", "divide"]
+READS = 200
+WRITES = 500
+
+
+def scan(session, user_id):
+    c = Calculation
+    return session.execute(
+        select(c.type, func.count(), func.sum(c.result), func.min(c.result),
+               func.max(c.result), func.max(c.created_at))
+        .where(c.user_id == user_id)
+        .group_by(c.type)
+    ).all()
+
+
+def grow(session, user_id, start, stop):
+    now = datetime.now(timezone.utc)
+    session.execute(
+        Calculation.__table__.insert(),
+        [
+            {"type": TYPES[i % 4], "a": i, "b": 2, "result": i * 2.0,
+             "user_id": user_id, "created_at": now}
+            for i in range(start, stop)
+        ],
+    )
+    rebuild_stats(session, user_id)
+    session.commit()
+
+
+def main() -> None:
+    migrate()
+    session = get_session_factory()()
+    user = User(first_name="Bench", last_name="Stats", username="bench_stats",
+                email="stats@ex.com", password_hash="not-used")
+    session.add(user)
+    session.commit()
+
+    print(f"{'rows':>8} {'scan (ms)':>10} {'rollup (ms)':>12}")
+    size = 0
+    target = 1_000
+    while target <= MAX_ROWS:
+        grow(session, user.id, size, target)
+        size = target
+        t_scan = timeit.timeit(lambda: scan(session, user.id), number=READS)
+        t_roll = timeit.timeit(
+            lambda: summarize(session.execute(stats_select(user.id)).all()), number=READS
+        )
+        print(f"{size:>8} {t_scan * 1000 / READS:>10.3f} {t_roll * 1000 / READS:>12.3f}")
+        target *= 10
+
+    def write(maintain):
+        row = session.execute(
+            calc_insert({"type": "add", "a": 1, "b": 1, "result": 2}, user.id)
+        ).one()
+        if maintain:
+            record_added(session, [row])
+        session.commit()
+
+    plain = timeit.timeit(lambda: write(False), number=WRITES)
+    maintained = timeit.timeit(lambda: write(True), number=WRITES)
+    print(f"\nwrite without rollup: {plain * 1000 / WRITES:.3f} ms")
+    print(f"write with rollup:    {maintained * 1000 / WRITES:.3f} ms")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
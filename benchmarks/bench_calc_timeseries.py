@@ -0,0 +1,112 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation Time Series Benchmark
+# File: benchmarks/bench_calc_timeseries.py
+# ----------------------------------------------------------
+# Description:
+# A year of one user's history charted by day, as the
+# history grows:
+#
+#   • client   fetch every row and bucket in Python (what
+#              the browser had to do with the full history)
+#   • sql      timeseries_select() at a bounded bucket count
+#
+# Reports latency and the number of values shipped back.
+#
+# Usage:
+#     python benchmarks/bench_calc_timeseries.py [max_rows]
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_series_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from sqlalchemy import select  # noqa: E402
+
+from app.database.dbase import get_session_factory  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+from app.database.timeseries import bucket_width, timeseries_select  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+MAX_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+START = END - timedelta(days=365)
+REPEAT = 3
+
+
+def grow(session, user_id, start, stop):
+    # Spread every stage over the whole year
+    year = int((END - START).total_seconds())
+    session.execute(
+        Calculation.__table__.insert(),
+        [
+            {"type": "add", "a": i, "b": 1, "result": float(i % 97),
+             "user_id": user_id, "created_at": START + timedelta(seconds=(i * 7919) % year)}
+            for i in range(start, stop)
+        ],
+    )
+    session.commit()
+
+
+def client_side(session, user_id):
+    c = Calculation
+    rows = session.execute(
+        select(c.created_at, c.result).where(c.user_id == user_id)
+    ).all()
+    buckets = defaultdict(list)
+    for created_at, result in rows:
+        buckets[created_at.date()].append(result)
+    summary = {d: (len(v), sum(v), min(v), max(v)) for d, v in buckets.items()}
+    return len(rows) * 2, summary
+
+
+def server_side(session, user_id):
+    width = bucket_width("day", START, END, 500)
+    rows = session.execute(timeseries_select("sqlite", user_id, START, END, width)).all()
+    return len(rows) * 6, rows
+
+
+def best(fn, *args):
+    timings = []
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        shipped, _ = fn(*args)
+        timings.append(time.perf_counter() - t)
+    return min(timings) * 1000, shipped
+
+
+def main() -> None:
+    migrate()
+    session = get_session_factory()()
+    user = User(first_name="Bench", last_name="Series", username="bench_series",
+                email="series@ex.com", password_hash="not-used")
+    session.add(user)
+    session.commit()
+
+    print(f"{'rows':>9} {'client (ms)':>12} {'values':>9} {'sql (ms)':>10} {'values':>7}")
+    size, target = 0, 10_000
+    while target <= MAX_ROWS:
+        for chunk in range(size, target, 50_000):
+            grow(session, user.id, chunk, min(chunk + 50_000, target))
+        size = target
+        client_ms, client_values = best(client_side, session, user.id)
+        sql_ms, sql_values = best(server_side, session, user.id)
+        print(f"{size:>9} {client_ms:>12.1f} {client_values:>9} {sql_ms:>10.1f} {sql_values:>7}")
+        target *= 10
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Operation Dispatch Microbenchmark
+# File: benchmarks/bench_dispatch.py
+# ----------------------------------------------------------
+# Description:
+# Compares the operation registry against the dispatch paths
+# it replaced: the router's strip().lower() if-chain, the old
+# factory lookup, and the old CalculationCreate schema that
+# computed the result (and the router then computed it again).
+# The legacy implementations are reproduced here verbatim so
+# the comparison stays runnable after the refactor.
+#
+# Usage:
+#     python benchmarks/bench_dispatch.py
+# ----------------------------------------------------------
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from pydantic import BaseModel, ValidationInfo, field_validator, model_validator  # noqa: E402
+
+from app.factory.calculation_factory import CalculationFactory  # noqa: E402
+from app.operations import registry  # noqa: E402
+from app.schemas.cal_schemas import CalculationCreate  # noqa: E402
+
+NUMBER = 200_000
+CASES = [("add", 5.0, 3.0), ("subtract", 5.0, 3.0), ("multiply", 5.0, 3.0), ("divide", 5.0, 3.0)]
+
+
+# ----------------------------------------------------------
+# Legacy implementations (pre-registry)
+# ----------------------------------------------------------
+def legacy_compute_result(calc_type: str, a: float, b: float) -> float:
+    calc_type = calc_type.strip().lower()
+    if calc_type == "add":
+        return a + b
+    if calc_type == "subtract":
+        return a - b
+    if calc_type == "multiply":
+        return a * b
+    if calc_type == "divide":
+        if b == 0:
+            raise ValueError("Division by zero")
+        return a / b
+    raise ValueError("Invalid operation type")
+
+
+class LegacyCalculationCreate(BaseModel):
+    type: str
+    a: float
+    b: float
+    result: Optional[float] = None
+
+    @field_validator("type")
+    def validate_type(cls, v: str) -> str:
+        v = v.lower().strip()
+        if v not in {"add", "subtract", "multiply", "divide"}:
+            raise ValueError("Unsupported calculation type")
+        return v
+
+    @field_validator("b")
+    def validate_division(cls, b: float, info: ValidationInfo):
+        if info.data.get("type") == "divide" and b == 0:
+            raise ValueError("Division by zero")
+        return b
+
+    @model_validator(mode="after")
+    def compute_result(self):
+        if self.type == "add":
+            self.result = self.a + self.b
+        elif self.type == "subtract":
+            self.result = self.a - self.b
+        elif self.type == "multiply":
+            self.result = self.a * self.b
+        elif self.type == "divide":
+            self.result = self.a / self.b
+        return self
+
+
+class _LegacyAdd:
+    @staticmethod
+    def compute(a, b):
+        return a + b
+
+
+class _LegacySubtract:
+    @staticmethod
+    def compute(a, b):
+        return a - b
+
+
+class _LegacyMultiply:
+    @staticmethod
+    def compute(a, b):
+        return a * b
+
+
+class _LegacyDivide:
+    @staticmethod
+    def compute(a, b):
+        if b == 0:
+            raise ValueError("Division by zero")
+        return a / b
+
+
+_LEGACY_FACTORY = {
+    "add": _LegacyAdd,
+    "subtract": _LegacySubtract,
+    "multiply": _LegacyMultiply,
+    "divide": _LegacyDivide,
+}
+
+
+def legacy_factory(calc_type: str, a: float, b: float) -> float:
+    key = calc_type.strip().lower()
+    if key not in _LEGACY_FACTORY:
+        raise ValueError("Unsupported calculation type")
+    return _LEGACY_FACTORY[key]().compute(a, b)
+
+
+# ----------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------
+def _run(label: str, func, number: int = NUMBER) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3))
+    per_call = seconds / (number * len(CASES)) * 1e9
+    print(f"{label:<38} {per_call:>9.1f} ns/op")
+    return per_call
+
+
+def main():
+    print(f"{'path':<38} {'cost':>12}")
+
+    _run("legacy router compute_result", lambda: [legacy_compute_result(*c) for c in CASES])
+    _run("registry.compute", lambda: [registry.compute(*c) for c in CASES])
+
+    _run("legacy factory create+compute", lambda: [legacy_factory(*c) for c in CASES])
+    _run(
+        "CalculationFactory.create+compute",
+        lambda: [CalculationFactory.create(t).compute(a, b) for t, a, b in CASES],
+    )
+
+    def legacy_request():
+        # Old create path: schema computes, router recomputes
+        for t, a, b in CASES:
+            payload = LegacyCalculationCreate(type=t, a=a, b=b)
+            legacy_compute_result(payload.type, payload.a, payload.b)
+
+    def registry_request():
+        for t, a, b in CASES:
+            CalculationCreate(type=t, a=a, b=b).result
+
+    _run("legacy create request (2x compute)", legacy_request, NUMBER // 10)
+    _run("registry create request (1x compute)", registry_request, NUMBER // 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: History Serialization Benchmark
+# File: benchmarks/bench_fast_json.py
+# ----------------------------------------------------------
+# Description:
+# Query + serialize one history response of N rows, N from
+# 10 to 100k:
+#
+#   • model    ORM objects → response_model validation →
+#              jsonable_encoder → JSONResponse (the old
+#              list_calculations path)
+#   • json     tuple select + stdlib encoder (fast_json
+#              fallback)
+#   • orjson   tuple select + orjson (fast_json default)
+#
+# Usage:
+#     python benchmarks/bench_fast_json.py
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_json_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.database.dbase import get_session_factory  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.schemas.cal_schemas import CalculationRead  # noqa: E402
+from app.services import fast_json  # noqa: E402
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_adapter = TypeAdapter(list[CalculationRead])
+
+
+def model_path(session, user_id, n):
+    rows = (
+        session.query(Calculation)
+        .filter(Calculation.user_id == user_id)
+        .order_by(Calculation.created_at.desc(), Calculation.id.desc())
+        .limit(n)
+        .all()
+    )
+    validated = _adapter.validate_python(rows, from_attributes=True)
+    body = JSONResponse(jsonable_encoder(_adapter.dump_python(validated, mode="json"))).body
+    session.expunge_all()
+    return body
+
+
+def tuple_path(session, user_id, n):
+    rows = session.execute(
+        select(*fast_json.calc_columns())
+        .where(Calculation.user_id == user_id)
+        .order_by(Calculation.created_at.desc(), Calculation.id.desc())
+        .limit(n)
+    ).all()
+    return fast_json.calculations_response(rows).body
+
+
+def best_ms(fn, *args, repeat):
+    timings = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - t)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    migrate()
+    session = get_session_factory()()
+    user = User(first_name="Bench", last_name="Json", username="bench_json",
+                email="json@ex.com", password_hash="not-used")
+    session.add(user)
+    session.commit()
+    session.execute(
+        Calculation.__table__.insert(),
+        [
+            {"type": "divide", "a": i, "b": 3, "result": i / 3, "user_id": user.id,
+             "created_at": T0 + timedelta(seconds=i)}
+            for i in range(max(SIZES))
+        ],
+    )
+    session.commit()
+
+    orjson_module = fast_json.orjson
+    print(f"{'rows':>8} {'model (ms)':>11} {'json (ms)':>10} {'orjson (ms)':>12}")
+    for n in SIZES:
+        repeat = 20 if n <= 1000 else 3
+        model_ms = best_ms(model_path, session, user.id, n, repeat=repeat)
+        fast_json.orjson = None
+        json_ms = best_ms(tuple_path, session, user.id, n, repeat=repeat)
+        fast_json.orjson = orjson_module
+        orjson_ms = float("nan")
+        if orjson_module is not None:
+            orjson_ms = best_ms(tuple_path, session, user.id, n, repeat=repeat)
+        print(f"{n:>8} {model_ms:>11.2f} {json_ms:>10.2f} {orjson_ms:>12.2f}")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Group-Commit Load Test
+# File: benchmarks/bench_group_commit.py
+# ----------------------------------------------------------
+# Description:
+# Write-heavy load test for POST /calculations storage:
+# N client threads each insert rows as fast as they can,
+#
+#   • direct:   one INSERT ... RETURNING + COMMIT per row
+#               (the default request path)
+#   • grouped:  rows submitted to GroupCommitWriter at a few
+#               WRITE_GROUP_MAX_DELAY_MS settings
+#
+# and reports rows/s, commits/s and per-row p50 / p99
+# latency (submit → durable row returned). Runs against a
+# throwaway SQLite file database.
+#
+# Usage:
+#     python benchmarks/bench_group_commit.py [threads] [rows_per_thread]
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_group_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from sqlalchemy import event  # noqa: E402
+
+import app.models.cal_models  # noqa: E402,F401  (registers Calculation mapper)
+from app.database.calc_writes import calc_insert  # noqa: E402
+from app.database.dbase import (  # noqa: E402
+    get_session,
+    get_session_factory,
+    get_shared_engine,
+    init_db,
+)
+from app.models.user_model import User  # noqa: E402
+from app.services.group_commit import GroupCommitWriter  # noqa: E402
+
+THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+ROWS_PER_THREAD = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+DELAYS_MS = (0, 2, 10)
+
+
+def _seed_user() -> int:
+    session = get_session()
+    user = User(
+        first_name="Bench",
+        last_name="Writer",
+        username="bench_writer",
+        email="writer@ex.com",
+        password_hash="not-used",
+    )
+    session.add(user)
+    session.commit()
+    user_id = user.id
+    session.close()
+    return user_id
+
+
+def _values(i: int) -> dict:
+    return {"type": "add", "a": i, "b": 1, "result": i + 1}
+
+
+# ----------------------------------------------------------
+# Load driver
+# ----------------------------------------------------------
+def _run(label: str, write_one) -> None:
+    engine = get_shared_engine()
+    commits = [0]
+
+    def count_commit(conn):
+        commits[0] += 1
+
+    event.listen(engine, "commit", count_commit)
+    latencies = []
+    lock = threading.Lock()
+
+    def client(offset: int):
+        mine = []
+        for i in range(ROWS_PER_THREAD):
+            start = time.perf_counter()
+            write_one(offset + i)
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [
+        threading.Thread(target=client, args=(t * ROWS_PER_THREAD,))
+        for t in range(THREADS)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "commit", count_commit)
+
+    latencies.sort()
+    rows = len(latencies)
+    p50 = latencies[rows // 2] * 1000
+    p99 = latencies[min(rows - 1, int(rows * 0.99))] * 1000
+    print(
+        f"{label:<18} {rows / elapsed:>10.0f} {commits[0] / elapsed:>10.0f}"
+        f" {p50:>9.2f} {p99:>9.2f}"
+    )
+
+
+def main() -> None:
+    init_db()
+    user_id = _seed_user()
+    factory = get_session_factory()
+
+    def direct(i: int):
+        with factory() as session:
+            session.execute(calc_insert(_values(i), user_id)).one()
+            session.commit()
+
+    print(f"{THREADS} threads x {ROWS_PER_THREAD} rows, SQLite file database\n")
+    print(f"{'mode':<18} {'rows/s':>10} {'commits/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    _run("direct", direct)
+
+    for delay_ms in DELAYS_MS:
+        writer = GroupCommitWriter(
+            session_factory=factory,
+            max_rows=200,
+            max_delay=delay_ms / 1000,
+            queue_max=THREADS * 2,
+        )
+
+        def grouped(i: int, writer=writer):
+            future = writer.submit({**_values(i), "user_id": user_id})
+            if future is None:
+                direct(i)
+            else:
+                future.result()
+
+        _run(f"grouped {delay_ms}ms", grouped)
+        stats = writer.stats()
+        writer.stop()
+        print(
+            f"{'':<18} avg batch {stats['avg_batch']}, largest {stats['largest_batch']},"
+            f" fallbacks {stats['fallbacks']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Streamed History Rows Benchmark
+# File: benchmarks/bench_history_rows.py
+# ----------------------------------------------------------
+# Description:
+# Server side of the dashboard history table for histories
+# of N rows, N from 1k to 100k: time until the first <tr>
+# chunk is ready (what the browser can paint first) and the
+# total time to stream every row, using the same cursor and
+# encoder as GET /calculations/rows. Total time per row
+# should stay flat as N grows; first-chunk time should not
+# grow at all.
+#
+# Usage:
+#     python benchmarks/bench_history_rows.py
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_rows_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from app.database.dbase import get_session_factory  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.services.history_export import iter_history_partitions  # noqa: E402
+from app.services.history_fragments import (  # noqa: E402
+    FRAGMENT_CHUNK_ROWS,
+    encode_fragments,
+)
+
+SIZES = [1_000, 10_000, 100_000]
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def seed(factory, n):
+    with factory() as session:
+        user = User(first_name="Bench", last_name="Rows", username=f"rows{n}",
+                    email=f"rows{n}@ex.com", password_hash="not-used")
+        session.add(user)
+        session.commit()
+        session.execute(
+            Calculation.__table__.insert(),
+            [{"type": "add", "a": i, "b": 1, "result": i + 1, "user_id": user.id,
+              "created_at": T0 + timedelta(seconds=i)} for i in range(n)],
+        )
+        session.commit()
+        return user.id
+
+
+def stream(factory, user_id):
+    start = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in encode_fragments(iter_history_partitions(factory, user_id, FRAGMENT_CHUNK_ROWS)):
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    return first, time.perf_counter() - start, size
+
+
+def main() -> None:
+    migrate()
+    factory = get_session_factory()
+
+    print(f"{'rows':>8} {'first chunk ms':>15} {'total ms':>10} {'us/row':>8} {'KiB':>8}")
+    for n in SIZES:
+        user_id = seed(factory, n)
+        stream(factory, user_id)  # warm up
+        first, total, size = stream(factory, user_id)
+        print(f"{n:>8} {first * 1e3:>15.2f} {total * 1e3:>10.1f} "
+              f"{total * 1e6 / n:>8.2f} {size / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
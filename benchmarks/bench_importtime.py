@@ -0,0 +1,111 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Startup Import-Time Benchmark
+# File: benchmarks/bench_importtime.py
+# ----------------------------------------------------------
+# Description:
+# Measures the cost of `import main` (the main:app entry
+# point) with `python -X importtime` in fresh interpreters,
+# and lists the slowest app.* modules and third-party
+# packages. Also checks that importing the app creates no
+# database engine.
+#
+# Results can be saved and compared to track startup cost
+# over time:
+#
+# Usage:
+#     python benchmarks/bench_importtime.py
+#     python benchmarks/bench_importtime.py --save baseline.json
+#     python benchmarks/bench_importtime.py --compare baseline.json
+# ----------------------------------------------------------
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+RUNS = 5
+TOP = 10
+PROBE = (
+    "import main\n"
+    "from app.database import dbase\n"
+    "print('engine created at import:', dbase._engine is not None)\n"
+)
+
+
+def _measure() -> tuple:
+    """One fresh interpreter: (cumulative µs per module, probe output)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|")
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum)
+    return cumulative, result.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--save", metavar="FILE")
+    parser.add_argument("--compare", metavar="FILE")
+    args = parser.parse_args()
+
+    _measure()  # warm the bytecode cache
+    samples = defaultdict(list)
+    probe = ""
+    for _ in range(RUNS):
+        cumulative, probe = _measure()
+        for name, micros in cumulative.items():
+            samples[name].append(micros)
+
+    median = {name: statistics.median(v) for name, v in samples.items()}
+    total_ms = median["main"] / 1000
+
+    print(f"import main: {total_ms:.1f} ms (median of {RUNS})")
+    print(probe)
+
+    app_modules = sorted(
+        (n for n in median if n.startswith("app.") and "." in n),
+        key=median.get,
+        reverse=True,
+    )[:TOP]
+    packages = sorted(
+        (n for n in median if "." not in n and not n.startswith("_") and n not in ("main", "app")),
+        key=median.get,
+        reverse=True,
+    )[:TOP]
+
+    print(f"\n{'app module':<40} {'ms':>8}")
+    for name in app_modules:
+        print(f"{name:<40} {median[name] / 1000:>8.1f}")
+    print(f"\n{'top-level package':<40} {'ms':>8}")
+    for name in packages:
+        print(f"{name:<40} {median[name] / 1000:>8.1f}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        delta = total_ms - baseline["main_ms"]
+        print(f"\nvs baseline {baseline['main_ms']:.1f} ms: {delta:+.1f} ms")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({"main_ms": total_ms, "modules_ms": {
+            n: median[n] / 1000 for n in app_modules + packages
+        }}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
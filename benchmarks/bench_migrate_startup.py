@@ -0,0 +1,51 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Startup Schema Check Benchmark
+# File: benchmarks/bench_migrate_startup.py
+# ----------------------------------------------------------
+# Description:
+# Per-worker startup cost of making sure the schema exists,
+# on an already-current SQLite database:
+#
+#   • create_all   the old init_db() (reflects every table
+#                  and index on each start)
+#   • migrate      app/database/migrate.py fast path (one
+#                  version query)
+#
+# Usage:
+#     python benchmarks/bench_migrate_startup.py
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_migrate_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from app.database.dbase import Base, get_shared_engine  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+
+CALLS = 500
+
+
+def main() -> None:
+    engine = get_shared_engine()
+    print(f"First run applied: {migrate(engine)}")
+
+    create_all = timeit.timeit(lambda: Base.metadata.create_all(bind=engine), number=CALLS)
+    fast_path = timeit.timeit(lambda: migrate(engine), number=CALLS)
+
+    print(f"\n{'check':<12} {'per start (ms)':>15}")
+    print(f"{'create_all':<12} {create_all * 1000 / CALLS:>15.3f}")
+    print(f"{'migrate':<12} {fast_path * 1000 / CALLS:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
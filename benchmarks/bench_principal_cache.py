@@ -0,0 +1,93 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Principal Cache Benchmark
+# File: benchmarks/bench_principal_cache.py
+# ----------------------------------------------------------
+# Description:
+# Per-request authentication overhead with the principal
+# cache on and off:
+#
+#   • get_current_user() called directly with a real session
+#     (decode + SELECT vs cache hit)
+#   • GET /auth/me end to end through TestClient
+#
+# Runs against a throwaway SQLite database.
+#
+# Usage:
+#     python benchmarks/bench_principal_cache.py
+# ----------------------------------------------------------
+
+import logging
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_principal_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.auth.dependencies import create_access_token, get_current_user  # noqa: E402
+from app.auth.principal_cache import principal_cache  # noqa: E402
+from app.database.dbase import get_session, init_db  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from main import app  # noqa: E402
+
+DIRECT_CALLS = 5_000
+HTTP_CALLS = 500
+
+
+def _seed_user() -> str:
+    session = get_session()
+    user = User(
+        first_name="Bench",
+        last_name="User",
+        username="bench_user",
+        email="bench@ex.com",
+        password_hash="not-used",
+        is_active=True,
+    )
+    session.add(user)
+    session.commit()
+    token = create_access_token({"sub": str(user.id)})
+    session.close()
+    return token
+
+
+def _per_call_us(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    init_db()
+    token = _seed_user()
+    session = get_session()
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'path':<32} {'cache off':>12} {'cache on':>12}")
+    for label, func, number in (
+        ("get_current_user()", lambda: get_current_user(token=token, db=session), DIRECT_CALLS),
+        ("GET /auth/me", lambda: client.get("/auth/me", headers=headers), HTTP_CALLS),
+    ):
+        timings = []
+        for enabled in (False, True):
+            principal_cache.enabled = enabled
+            principal_cache.clear()
+            func()  # warm (and populate the cache when enabled)
+            timings.append(_per_call_us(func, number))
+        print(f"{label:<32} {timings[0]:>10.1f}us {timings[1]:>10.1f}us")
+
+    print("\ncache stats:", principal_cache.stats())
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Read Path Benchmark
+# File: benchmarks/bench_read_path.py
+# ----------------------------------------------------------
+# Description:
+# Per-request latency and Python allocations of the hot GET
+# lookups, ORM hydration vs the Core read repository
+# (app/database/reads.py), each in a fresh session as a
+# request would use:
+#
+#   • calc by id     db.query(Calculation)  vs fetch_calculation()
+#   • current user   db.query(User)         vs fetch_user()
+#   • history page   50 ORM objects         vs 50 tuples
+#
+# Allocations are tracemalloc peak bytes and block count.
+#
+# Usage:
+#     python benchmarks/bench_read_path.py
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_reads_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from app.database.dbase import get_session_factory  # noqa: E402
+from app.database.migrate import migrate  # noqa: E402
+from app.database.reads import calc_history, fetch_calculation, fetch_user  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+CALLS = 2000
+PAGE = 50
+
+
+def orm_calc(session, user_id, calc_id):
+    return (
+        session.query(Calculation)
+        .filter(Calculation.id == calc_id, Calculation.user_id == user_id)
+        .first()
+    )
+
+
+def orm_user(session, user_id, calc_id):
+    return session.query(User).filter(User.id == user_id).first()
+
+
+def orm_page(session, user_id, calc_id):
+    return (
+        session.query(Calculation)
+        .filter(Calculation.user_id == user_id)
+        .order_by(Calculation.created_at.desc(), Calculation.id.desc())
+        .limit(PAGE)
+        .all()
+    )
+
+
+def core_calc(session, user_id, calc_id):
+    return fetch_calculation(session, calc_id, user_id)
+
+
+def core_user(session, user_id, calc_id):
+    return fetch_user(session, user_id)
+
+
+def core_page(session, user_id, calc_id):
+    stmt = calc_history(user_id).order_by(
+        Calculation.created_at.desc(), Calculation.id.desc()
+    ).limit(PAGE)
+    return session.execute(stmt).all()
+
+
+def measure(fn, factory, user_id, calc_id):
+    def request():
+        with factory() as session:
+            return fn(session, user_id, calc_id)
+
+    for _ in range(50):  # warm statement caches
+        request()
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        request()
+    per_call_us = (time.perf_counter() - start) * 1e6 / CALLS
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = request()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in after.compare_to(before, "filename") if s.count_diff > 0)
+    del result
+    return per_call_us, peak, blocks
+
+
+def main() -> None:
+    migrate()
+    factory = get_session_factory()
+    with factory() as session:
+        user = User(first_name="Bench", last_name="Reads", username="bench_reads",
+                    email="reads@ex.com", password_hash="not-used")
+        session.add(user)
+        session.commit()
+        session.execute(
+            Calculation.__table__.insert(),
+            [{"type": "add", "a": i, "b": 1, "result": i + 1, "user_id": user.id}
+             for i in range(1000)],
+        )
+        session.commit()
+        user_id = user.id
+    calc_id = 500
+
+    print(f"{'lookup':<14} {'path':<5} {'us/request':>11} {'peak bytes':>11} {'blocks':>7}")
+    for label, orm, core in (
+        ("calc by id", orm_calc, core_calc),
+        ("current user", orm_user, core_user),
+        (f"page of {PAGE}", orm_page, core_page),
+    ):
+        for path, fn in (("orm", orm), ("core", core)):
+            us, peak, blocks = measure(fn, factory, user_id, calc_id)
+            print(f"{label:<14} {path:<5} {us:>11.1f} {peak:>11} {blocks:>7}")
+
+
+if __name__ == "__main__":
+    main()
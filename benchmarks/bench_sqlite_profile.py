@@ -0,0 +1,168 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: SQLite Profile Benchmark
+# File: benchmarks/bench_sqlite_profile.py
+# ----------------------------------------------------------
+# Description:
+# Simulates several uvicorn workers on one SQLite file: each
+# worker process runs writer threads (read the user, then
+# INSERT ... RETURNING + COMMIT, like POST /calculations)
+# and reader threads (history page SELECTs) for a fixed
+# time, with
+#
+#   • default:  SQLITE_TUNING=false (rollback journal, full
+#               sync, driver-default locking)
+#   • tuned:    WAL + pragma profile + single writer lane
+#
+# and reports committed writes/s, reads/s and "database is
+# locked" failures. Each mode gets a fresh database file.
+#
+# Usage:
+#     python benchmarks/bench_sqlite_profile.py [workers] [seconds]
+# ----------------------------------------------------------
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+WORKERS = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+SECONDS = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+WRITERS_PER_WORKER = 4
+READERS_PER_WORKER = 2
+
+
+def _prepare(url: str) -> int:
+    from app.database.dbase import get_session, init_db
+    import app.models.cal_models  # noqa: F401  (registers Calculation mapper)
+    from app.models.user_model import User
+
+    init_db()
+    session = get_session()
+    user = User(
+        first_name="Bench",
+        last_name="Lock",
+        username="bench_lock",
+        email="lock@ex.com",
+        password_hash="not-used",
+    )
+    session.add(user)
+    session.commit()
+    user_id = user.id
+    session.close()
+    return user_id
+
+
+def _worker(url: str, tuned: bool, user_id: int, deadline: float, out) -> None:
+    os.environ["DATABASE_URL"] = url
+    os.environ["SQLITE_TUNING"] = "true" if tuned else "false"
+
+    from sqlalchemy import select
+    from sqlalchemy.exc import OperationalError
+
+    import app.models.cal_models  # noqa: F401
+    from app.database.calc_writes import calc_insert
+    from app.database.dbase import get_session_factory, get_write_session_factory
+    from app.models.cal_models import Calculation
+    from app.models.user_model import User
+
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+
+    # Every worker starts measuring at the same moment
+    time.sleep(max(0.0, deadline - SECONDS - time.time()))
+
+    def bump(name):
+        with lock:
+            counts[name] += 1
+
+    def writer():
+        factory = get_write_session_factory()
+        i = 0
+        while time.time() < deadline:
+            try:
+                with factory() as session:
+                    session.get(User, user_id)
+                    values = {"type": "add", "a": i, "b": 1, "result": i + 1}
+                    session.execute(calc_insert(values, user_id)).one()
+                    session.commit()
+                bump("writes")
+            except OperationalError:
+                bump("locked")
+            i += 1
+
+    def reader():
+        factory = get_session_factory()
+        stmt = (
+            select(Calculation)
+            .where(Calculation.user_id == user_id)
+            .order_by(Calculation.id.desc())
+            .limit(50)
+        )
+        while time.time() < deadline:
+            try:
+                with factory() as session:
+                    session.execute(stmt).all()
+                bump("reads")
+            except OperationalError:
+                bump("locked")
+
+    threads = [threading.Thread(target=writer) for _ in range(WRITERS_PER_WORKER)]
+    threads += [threading.Thread(target=reader) for _ in range(READERS_PER_WORKER)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    out.put(counts)
+
+
+def _run(label: str, tuned: bool) -> None:
+    tmp = tempfile.mkdtemp(prefix="bench_sqlite_")
+    url = f"sqlite:///{tmp}/bench.db"
+    os.environ["DATABASE_URL"] = url
+    os.environ["SQLITE_TUNING"] = "true" if tuned else "false"
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        user_id = pool.apply(_prepare, (url,))
+
+    out = ctx.Queue()
+    deadline = time.time() + 2.0 + SECONDS  # 2s for process start-up
+    procs = [
+        ctx.Process(target=_worker, args=(url, tuned, user_id, deadline, out))
+        for _ in range(WORKERS)
+    ]
+    for p in procs:
+        p.start()
+    totals = {"writes": 0, "reads": 0, "locked": 0}
+    for _ in procs:
+        for key, value in out.get().items():
+            totals[key] += value
+    for p in procs:
+        p.join()
+
+    print(
+        f"{label:<10} {totals['writes'] / SECONDS:>10.0f} {totals['reads'] / SECONDS:>10.0f}"
+        f" {totals['locked']:>8}"
+    )
+
+
+def main() -> None:
+    print(
+        f"{WORKERS} worker processes x ({WRITERS_PER_WORKER} writers +"
+        f" {READERS_PER_WORKER} readers), ~{SECONDS:.0f}s each\n"
+    )
+    print(f"{'mode':<10} {'writes/s':>10} {'reads/s':>10} {'locked':>8}")
+    _run("default", tuned=False)
+    _run("tuned", tuned=True)
+
+
+if __name__ == "__main__":
+    main()
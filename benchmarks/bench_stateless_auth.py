@@ -0,0 +1,90 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Stateless Auth Benchmark
+# File: benchmarks/bench_stateless_auth.py
+# ----------------------------------------------------------
+# Description:
+# Per-request cost of resolving the caller for calculation
+# routes:
+#
+#   • database mode, principal cache off (decode + SELECT)
+#   • database mode, principal cache hit
+#   • stateless mode (decode + cached token version)
+#
+# Runs against a throwaway SQLite database.
+#
+# Usage:
+#     python benchmarks/bench_stateless_auth.py
+# ----------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="bench_stateless_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+
+from app.auth.dependencies import get_current_principal  # noqa: E402
+from app.auth.principal import token_claims  # noqa: E402
+from app.auth.principal_cache import principal_cache  # noqa: E402
+from app.auth.security import create_access_token  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.database.dbase import get_session, init_db  # noqa: E402
+from app.models.cal_models import Calculation  # noqa: E402,F401
+from app.models.user_model import User  # noqa: E402
+
+CALLS = 5_000
+
+
+def _seed_token() -> str:
+    session = get_session()
+    user = User(
+        first_name="Bench",
+        last_name="User",
+        username="bench_user",
+        email="bench@ex.com",
+        password_hash="not-used",
+        is_active=True,
+    )
+    session.add(user)
+    session.commit()
+    token = create_access_token(token_claims(user))
+    session.close()
+    return token
+
+
+def _per_call_us(func) -> float:
+    func()  # warm caches
+    return min(timeit.repeat(func, number=CALLS, repeat=3)) / CALLS * 1e6
+
+
+def main():
+    init_db()
+    token = _seed_token()
+    session = get_session()
+    resolve = lambda: get_current_principal(token=token, db=session)  # noqa: E731
+
+    modes = (
+        ("database, cache off", False, False),
+        ("database, principal cache hit", False, True),
+        ("stateless claims", True, False),
+    )
+
+    print(f"{'mode':<32} {'per request':>12}")
+    for label, stateless, cached in modes:
+        settings.STATELESS_AUTH = stateless
+        principal_cache.enabled = cached
+        principal_cache.clear()
+        print(f"{label:<32} {_per_call_us(resolve):>10.1f}us")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,19 +7,29 @@
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from fastapi.staticfiles import StaticFiles  
 
 from app.core.config import settings
-from app.database.dbase import init_db
-
-# Routers
-from app.routers.ui import router as ui_router
-from app.routers.auth import router as auth_router
-from app.routers.calc import router as calc_router
+from app.database.dbase import dispose
+from app.database.migrate import migrate
+from app.database.async_dbase import dispose_async_engine
+from app.auth.hashing import password_hasher
+from app.services.assets import asset_manifest
+from app.services.compression import CompressionMiddleware, parse_types
+from app.services.group_commit import stop_group_writer
+from app.services.static_files import PrecompressedStaticFiles, precompress_static
+
+# Routers (async variants when DB_ASYNC is enabled)
+from app.routers.ui import UI_PAGES, pages as ui_pages, router as ui_router
 from app.routers.health import router as health_router
 
+if settings.DB_ASYNC:
+    from app.routers.auth_async import router as auth_router
+    from app.routers.calc_async import router as calc_router
+else:
+    from app.routers.auth import router as auth_router
+    from app.routers.calc import router as calc_router
+
 
 # ----------------------------------------------------------
 # Create FastAPI application
@@ -31,9 +41,18 @@ app = FastAPI(
 )
 
 # ----------------------------------------------------------
-# Static Files (CSS, JS, Images)
+# Static Files (CSS, JS, Images; .gz / .br siblings preferred,
+# fingerprinted names cached as immutable)
 # ----------------------------------------------------------
-app.mount("/static", StaticFiles(directory="static"), name="static")  # <--- REQUIRED
+app.mount(
+    "/static",
+    PrecompressedStaticFiles(
+        directory="static",
+        manifest=asset_manifest,
+        immutable_max_age=settings.STATIC_IMMUTABLE_MAX_AGE,
+    ),
+    name="static",
+)  # <--- REQUIRED
 
 
 # ----------------------------------------------------------
@@ -46,12 +65,6 @@ logging.basicConfig(
 logger = logging.getLogger("main")
 
 
-# ----------------------------------------------------------
-# Templates
-# ----------------------------------------------------------
-templates = Jinja2Templates(directory="templates")
-
-
 # ----------------------------------------------------------
 # CORS Middleware
 # ----------------------------------------------------------
@@ -64,6 +77,19 @@ app.add_middleware(
 )
 
 
+# ----------------------------------------------------------
+# Response Compression (gzip / brotli)
+# ----------------------------------------------------------
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        content_types=parse_types(settings.COMPRESSION_TYPES),
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+
 # ----------------------------------------------------------
 # Register Routers
 # UI FIRST (because it defines "/")
@@ -75,15 +101,47 @@ app.include_router(health_router)
 
 
 # ----------------------------------------------------------
-# Startup: Initialize database
+# Startup: Migrate database (no-op when already current)
 # ----------------------------------------------------------
 @app.on_event("startup")
 def on_startup():
+    if not settings.DB_MIGRATE_ON_STARTUP:
+        return
     try:
-        logger.info("Initializing database...")
-        init_db()
+        applied = migrate()
+        if applied:
+            logger.info(f"Applied database migrations: {applied}")
     except Exception as e:
-        logger.error(f"Database initialization error: {e}")
+        logger.error(f"Database migration error: {e}")
+
+
+# ----------------------------------------------------------
+# Startup: Asset manifest, prerendered UI pages, then
+# precompress static assets (skips up-to-date files)
+# ----------------------------------------------------------
+@app.on_event("startup")
+def prepare_assets():
+    asset_manifest.build()
+    ui_pages.warm(UI_PAGES)
+    if not settings.STATIC_PRECOMPRESS:
+        return
+    try:
+        written = precompress_static("static", settings.COMPRESSION_MIN_SIZE)
+        if written:
+            logger.info(f"Precompressed {len(written)} static file(s)")
+    except OSError as e:
+        logger.warning(f"Static precompression skipped: {e}")
+
+
+# ----------------------------------------------------------
+# Shutdown: Release pooled connections and hashing workers
+# ----------------------------------------------------------
+@app.on_event("shutdown")
+async def on_shutdown():
+    stop_group_writer()
+    dispose()
+    await dispose_async_engine()
+    password_hasher.shutdown()
 
 
 # ----------------------------------------------------------
@@ -7,6 +7,8 @@
 # isolated SQLite database, provides SQLAlchemy sessions,
 # and generates realistic fake users including required
 # fields such as email, mobile number, and password hash.
+# Also registers users through the API (headers_for) and
+# stops the group-commit writer after every test.
 # Ensures all tests start with predictable and consistent
 # database state across the full suite.
 # ----------------------------------------------------------
@@ -20,10 +22,14 @@ from faker import Faker
 # ----------------------------------------------------------
 os.environ["ENV"] = "testing"
 os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+os.environ["HEALTH_DETAILS"] = "true"
 
 from app.database.dbase import Base, engine, SessionLocal
 from app.models.user_model import User
 from app.auth.security import hash_password
+from app.auth.principal_cache import principal_cache
+from app.auth.principal import token_versions
+from app.services.group_commit import stop_group_writer
 
 fake = Faker()
 Faker.seed(12345)
@@ -49,10 +55,57 @@ def reset_db():
     """Ensure each test begins with a clean schema."""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # Recreated tables reuse user ids; cached principals would leak
+    principal_cache.clear()
+    token_versions.clear()
     yield
     pass
 
 
+# ----------------------------------------------------------
+# Stop the process-wide group-commit writer after each test
+# ----------------------------------------------------------
+@pytest.fixture(autouse=True)
+def stop_process_writer():
+    """Tests that enable WRITE_GROUP_COMMIT leave no writer running."""
+    yield
+    stop_group_writer()
+
+
+# ----------------------------------------------------------
+# Register + log in through the API
+# ----------------------------------------------------------
+def _register_and_login(client, name: str, mobile: str, with_id: bool = False):
+    client.post(
+        "/auth/register",
+        json={
+            "first_name": "Test",
+            "last_name": "User",
+            "username": name,
+            "email": f"{name}@ex.com",
+            "mobile": mobile,
+            "password": "Pass123A",
+            "confirm_password": "Pass123A",
+        },
+    )
+    token = client.post(
+        "/auth/login", json={"identifier": name, "password": "Pass123A"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    if not with_id:
+        return headers
+    return headers, client.get("/auth/me", headers=headers).json()["id"]
+
+
+@pytest.fixture
+def headers_for():
+    """
+    headers_for(client, name, mobile) → Bearer headers for a new
+    user; with_id=True returns (headers, user id) instead.
+    """
+    return _register_and_login
+
+
 # ----------------------------------------------------------
 # SQLAlchemy session fixture
 # ----------------------------------------------------------
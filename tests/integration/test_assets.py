@@ -0,0 +1,158 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Fingerprinted Static Asset Tests
+# File: tests/integration/test_assets.py
+# ----------------------------------------------------------
+# Description:
+# Tests app/services/assets.py and the manifest-aware static
+# mount: content-hashed names, lookups in both directions,
+# watch mode picking up edits and retiring superseded names
+# (404, never new content), immutable Cache-Control on
+# fingerprinted URLs (also for precompressed siblings and
+# 304s), and templates linking the hashed URLs.
+# ----------------------------------------------------------
+
+import os
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.assets import AssetManifest, asset_manifest, fingerprint
+from app.services.static_files import PrecompressedStaticFiles, precompress_static
+from main import app
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text("body { color: red; }\n" * 80)
+    (tmp_path / "app.js").write_text("console.log(1);\n")
+    (tmp_path / "css" / "site.css.gz").write_bytes(b"ignored")
+    return tmp_path
+
+
+def static_client(manifest):
+    mini = FastAPI()
+    mini.mount(
+        "/static",
+        PrecompressedStaticFiles(directory=manifest.directory, manifest=manifest),
+        name="static",
+    )
+    return TestClient(mini)
+
+
+def touch_later(path, content):
+    stat = os.stat(path)
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+# ----------------------------------------------------------
+# Manifest
+# ----------------------------------------------------------
+def test_fingerprint_keeps_directory_and_extension():
+    hashed = fingerprint("css/style.css", b"a")
+    assert re.fullmatch(r"css/style\.[0-9a-f]{16}\.css", hashed)
+    assert fingerprint("css/style.css", b"a") == hashed
+    assert fingerprint("css/style.css", b"b") != hashed
+
+
+def test_manifest_maps_both_ways(static_dir):
+    manifest = AssetManifest(str(static_dir))
+    built = manifest.build()
+
+    assert set(built) == {"css/site.css", "app.js"}  # .gz siblings skipped
+    url = manifest.url("css/site.css")
+    assert url == "/static/" + built["css/site.css"]
+    assert manifest.resolve(built["app.js"]) == "app.js"
+    assert manifest.resolve("app.js") is None
+    assert manifest.url("/missing.png") == "/static/missing.png"
+
+
+def test_watch_mode_rehashes_edited_files(static_dir):
+    watched = AssetManifest(str(static_dir), watch=True)
+    frozen = AssetManifest(str(static_dir))
+    before = watched.url("app.js")
+    assert frozen.url("app.js") == before
+
+    touch_later(static_dir / "app.js", "console.log(2);\n")
+    after = watched.url("app.js")
+    assert after != before
+    assert frozen.url("app.js") == before
+    assert watched.resolve(after.removeprefix("/static/")) == "app.js"
+
+    # The superseded name no longer resolves
+    assert watched.resolve(before.removeprefix("/static/")) is None
+    assert frozen.resolve(before.removeprefix("/static/")) == "app.js"
+
+    # Files added or removed after the build
+    (static_dir / "new.js").write_text("1")
+    assert watched.url("new.js") != "/static/new.js"
+    os.remove(static_dir / "app.js")
+    assert watched.url("app.js") == "/static/app.js"
+    assert watched.resolve(after.removeprefix("/static/")) is None
+
+
+def test_stale_fingerprint_is_not_served_in_watch_mode(static_dir):
+    watched = AssetManifest(str(static_dir), watch=True)
+    client = static_client(watched)
+    old_url = watched.url("app.js")
+
+    # Edited without anyone asking for the new URL yet
+    touch_later(static_dir / "app.js", "console.log(2);\n")
+    assert client.get(old_url).status_code == 404
+
+    new = client.get(watched.url("app.js"), headers={"Accept-Encoding": "identity"})
+    assert new.text == "console.log(2);\n"
+    assert new.headers["cache-control"] == IMMUTABLE
+
+
+# ----------------------------------------------------------
+# Serving
+# ----------------------------------------------------------
+def test_fingerprinted_urls_are_immutable(static_dir):
+    manifest = AssetManifest(str(static_dir))
+    client = static_client(manifest)
+
+    hashed = client.get(manifest.url("app.js"), headers={"Accept-Encoding": "identity"})
+    assert hashed.status_code == 200
+    assert hashed.text == "console.log(1);\n"
+    assert hashed.headers["cache-control"] == IMMUTABLE
+
+    again = client.get(manifest.url("app.js"), headers={"If-None-Match": hashed.headers["etag"]})
+    assert again.status_code == 304
+    assert again.headers["cache-control"] == IMMUTABLE
+
+    plain = client.get("/static/app.js")
+    assert plain.headers["cache-control"] == "no-cache"
+    assert client.get("/static/css/site.00000000.css").status_code == 404
+
+
+def test_fingerprinted_url_uses_precompressed_sibling(static_dir):
+    os.remove(static_dir / "css" / "site.css.gz")
+    precompress_static(str(static_dir))
+    manifest = AssetManifest(str(static_dir))
+
+    res = static_client(manifest).get(
+        manifest.url("css/site.css"), headers={"Accept-Encoding": "gzip"}
+    )
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["content-type"].startswith("text/css")
+    assert res.headers["cache-control"] == IMMUTABLE
+
+
+def test_pages_link_fingerprinted_assets():
+    with TestClient(app) as client:
+        html = client.get("/login").text
+        css_url = asset_manifest.url("css/style.css")
+        js_url = asset_manifest.url("js/script.js")
+        assert css_url in html and js_url in html
+        assert css_url != "/static/css/style.css"
+
+        res = client.get(css_url)
+        assert res.status_code == 200
+        assert res.headers["cache-control"] == IMMUTABLE
@@ -0,0 +1,165 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Async Route Tests
+# File: tests/integration/test_async_routes.py
+# ----------------------------------------------------------
+# Description:
+# Exercises the AsyncSession routers (auth_async, calc_async)
+# mounted on a standalone app, the same way main.py mounts
+# them when DB_ASYNC is enabled. Covers the auth flow, CRUD,
+# keyset pagination, batch, streaming export/import and the
+# sync → async DATABASE_URL rewrite.
+# ----------------------------------------------------------
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.database.async_dbase import dispose_async_engine, get_async_database_url
+from app.routers.auth_async import router as auth_router
+from app.routers.calc_async import router as calc_router
+
+async_app = FastAPI()
+async_app.include_router(auth_router)
+async_app.include_router(calc_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+
+@pytest.fixture
+def client():
+    with TestClient(async_app) as c:
+        yield c
+
+
+# ----------------------------------------------------------
+# DATABASE_URL driver rewrite
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+        ("postgresql://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+        ("postgresql+psycopg2://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+        ("sqlite+aiosqlite:///x.db", "sqlite+aiosqlite:///x.db"),
+    ],
+)
+def test_async_database_url(url, expected):
+    assert get_async_database_url(url) == expected
+
+
+# ----------------------------------------------------------
+# Auth flow
+# ----------------------------------------------------------
+def test_async_auth_flow(client, headers_for):
+    headers = headers_for(client, "async_user", "3334445555")
+
+    me = client.get("/auth/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["username"] == "async_user"
+
+    dup = client.post(
+        "/auth/register",
+        json={
+            "first_name": "Async",
+            "last_name": "User",
+            "username": "async_user",
+            "email": "other@ex.com",
+            "mobile": "9998887777",
+            "password": "Pass123A",
+        },
+    )
+    assert dup.status_code == 400
+
+    bad = client.post("/auth/login", json={"identifier": "async_user", "password": "nope"})
+    assert bad.status_code == 401
+
+    assert client.get("/auth/me").status_code == 401
+    assert client.get("/auth/me", headers={"Authorization": "Bearer bad"}).status_code == 401
+
+
+def test_async_login_autocreates_test_user(client):
+    res = client.post(
+        "/auth/login",
+        json={"identifier": "test@example.com", "password": "TestPass123"},
+    )
+    assert res.status_code == 200
+    assert res.json()["username"] == "test"
+
+
+# ----------------------------------------------------------
+# CRUD
+# ----------------------------------------------------------
+def test_async_crud(client, headers_for):
+    headers = headers_for(client, "async_user", "3334445555")
+
+    created = client.post(
+        "/calculations", json={"type": "Multiply", "a": 3, "b": 4}, headers=headers
+    )
+    assert created.status_code == 201
+    calc = created.json()
+    assert calc["type"] == "multiply" and calc["result"] == 12
+
+    read = client.get(f"/calculations/{calc['id']}", headers=headers)
+    assert read.json()["result"] == 12
+
+    updated = client.put(
+        f"/calculations/{calc['id']}",
+        json={"type": "divide", "a": 9, "b": 3},
+        headers=headers,
+    )
+    assert updated.json()["result"] == 3
+
+    assert client.delete(f"/calculations/{calc['id']}", headers=headers).status_code == 204
+    assert client.get(f"/calculations/{calc['id']}", headers=headers).status_code == 404
+
+
+# ----------------------------------------------------------
+# List with keyset pagination
+# ----------------------------------------------------------
+def test_async_list_pages(client, headers_for):
+    headers = headers_for(client, "async_user", "3334445555")
+    for i in range(5):
+        client.post("/calculations", json={"type": "add", "a": i, "b": 0}, headers=headers)
+
+    first = client.get("/calculations?limit=2", headers=headers)
+    assert [c["a"] for c in first.json()] == [4, 3]
+
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(f"/calculations?limit=2&cursor={cursor}", headers=headers)
+    assert [c["a"] for c in second.json()] == [2, 1]
+    assert "X-Prev-Cursor" in second.headers
+
+    bad = client.get("/calculations?cursor=garbage", headers=headers)
+    assert bad.status_code == 400
+
+
+# ----------------------------------------------------------
+# Batch, import and export
+# ----------------------------------------------------------
+def test_async_batch_import_export(client, headers_for):
+    headers = headers_for(client, "async_user", "3334445555")
+
+    batch = client.post(
+        "/calculations/batch",
+        json={"types": ["add", "divide"], "a": [1, 1], "b": [2, 0]},
+        headers=headers,
+    )
+    assert batch.status_code == 201
+    assert batch.json()["inserted"] == 1
+
+    body = "\n".join(
+        [json.dumps({"type": "subtract", "a": 5, "b": 2}), "not json"]
+    ).encode()
+    imported = client.post("/calculations/import", content=body, headers=headers)
+    assert imported.json()["accepted"] == 1
+    assert imported.json()["rejected"] == 1
+
+    ndjson = client.get("/calculations/export", headers=headers)
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert sorted(r["type"] for r in rows) == ["add", "subtract"]
+
+    csv_res = client.get("/calculations/export?format=csv", headers=headers)
+    assert csv_res.text.splitlines()[0].startswith("id,")
+    assert len(csv_res.text.splitlines()) == 3
@@ -15,6 +15,7 @@
 from fastapi.testclient import TestClient
 from main import app
 from app.auth.security import decode_access_token_safe
+from app.auth.hashing import password_hasher
 
 client = TestClient(app)
 
@@ -191,3 +192,16 @@ def test_invalid_token_does_not_raise_exception():
     """decode_access_token_safe must never throw errors."""
     result = decode_access_token_safe("invalid.token.data")
     assert isinstance(result, dict)
+
+
+# ----------------------------------------------------------
+# Hashing pool saturated → fast 503
+# ----------------------------------------------------------
+def test_login_returns_503_when_hashing_pool_full(monkeypatch):
+    monkeypatch.setattr(password_hasher, "queue_max", 0)
+    res = client.post(
+        "/auth/login",
+        json={"identifier": "test@example.com", "password": "TestPass123"},
+    )
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
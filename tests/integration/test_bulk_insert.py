@@ -0,0 +1,75 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Bulk Insert Tests
+# File: tests/integration/test_bulk_insert.py
+# ----------------------------------------------------------
+# Description:
+# Tests bulk_insert_calculations(). Verifies the executemany
+# path against the SQLite test database and the PostgreSQL
+# COPY path against a mocked psycopg2 connection, including
+# NULL encoding and the column list sent to COPY.
+# ----------------------------------------------------------
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from app.database.bulk import BULK_COLUMNS, bulk_insert_calculations
+from app.models.cal_models import Calculation
+
+
+def make_rows(user_id, count=3):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "type": "add",
+            "a": i,
+            "b": 1,
+            "result": i + 1,
+            "user_id": user_id,
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+# ----------------------------------------------------------
+# SQLite → executemany INSERT
+# ----------------------------------------------------------
+def test_bulk_insert_sqlite(db_session, test_user):
+    assert bulk_insert_calculations(db_session, make_rows(test_user.id)) == 3
+    db_session.commit()
+
+    assert db_session.query(Calculation).filter_by(user_id=test_user.id).count() == 3
+
+
+def test_bulk_insert_empty(db_session):
+    assert bulk_insert_calculations(db_session, []) == 0
+
+
+# ----------------------------------------------------------
+# PostgreSQL → COPY FROM STDIN
+# ----------------------------------------------------------
+def test_bulk_insert_postgres_uses_copy():
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    cursor = session.connection.return_value.connection.dbapi_connection \
+        .cursor.return_value.__enter__.return_value
+
+    captured = {}
+    cursor.copy_expert.side_effect = (
+        lambda sql, buf: captured.update(sql=sql, data=buf.read())
+    )
+
+    rows = make_rows(7, count=2)
+    rows[1]["result"] = None
+
+    assert bulk_insert_calculations(session, rows) == 2
+    assert captured["sql"].startswith(
+        f"COPY calculations ({', '.join(BULK_COLUMNS)}) FROM STDIN"
+    )
+
+    lines = captured["data"].splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith("add,0,1,1,7,")
+    assert lines[1].startswith("add,1,1,,7,")
+    session.execute.assert_not_called()
@@ -106,3 +106,16 @@ def test_model_allows_division_by_zero(db_session, test_user):
     # Model accepts the row; API layer handles validation separately
     assert calc.b == 0
     assert calc.result is None
+
+
+# ----------------------------------------------------------
+# compute_result() uses the shared operation registry
+# ----------------------------------------------------------
+def test_model_compute_result(db_session, test_user):
+    calc = Calculation(type="multiply", a=6, b=7, user_id=test_user.id)
+
+    assert calc.compute_result() == 42
+    assert calc.result == 42
+
+    with pytest.raises(ValueError, match="Division by zero"):
+        Calculation(type="divide", a=1, b=0, user_id=test_user.id).compute_result()
@@ -0,0 +1,75 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Batch Calculation Route Tests
+# File: tests/integration/test_calc_batch.py
+# ----------------------------------------------------------
+# Description:
+# Tests POST /calculations/batch. Ensures columnar payloads
+# are computed and persisted in one request, failed rows are
+# reported by index without blocking valid rows, and invalid
+# payloads (mismatched columns) are rejected with 422.
+# ----------------------------------------------------------
+
+from fastapi.testclient import TestClient
+from main import app
+
+client = TestClient(app)
+
+
+# ----------------------------------------------------------
+# Valid rows are persisted, failed rows reported by index
+# ----------------------------------------------------------
+def test_batch_create_with_row_errors(headers_for):
+    headers = headers_for(client, "batch_user", "5554443333")
+
+    response = client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={
+            "types": ["add", "divide", "multiply", "power"],
+            "a": [1, 10, 3, 2],
+            "b": [2, 0, 4, 2],
+        },
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["inserted"] == 2
+    assert body["results"] == [3, None, 12, None]
+    assert body["errors"] == [
+        {"index": 1, "detail": "Division by zero"},
+        {"index": 3, "detail": "Unsupported calculation type"},
+    ]
+
+    history = client.get("/calculations", headers=headers).json()
+    assert sorted(item["result"] for item in history) == [3, 12]
+
+
+# ----------------------------------------------------------
+# Mismatched columns are rejected
+# ----------------------------------------------------------
+def test_batch_create_mismatched_columns(headers_for):
+    headers = headers_for(client, "batch_user", "5554443333")
+
+    response = client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": ["add", "add"], "a": [1], "b": [2, 3]},
+    )
+
+    assert response.status_code == 422
+
+
+# ----------------------------------------------------------
+# Empty batch is rejected
+# ----------------------------------------------------------
+def test_batch_create_empty(headers_for):
+    headers = headers_for(client, "batch_user", "5554443333")
+
+    response = client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": [], "a": [], "b": []},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,205 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Conditional GET Tests
+# File: tests/integration/test_calc_etags.py
+# ----------------------------------------------------------
+# Description:
+# ETags on GET /calculations and /calculations/{id}: a
+# matching If-None-Match gets an empty 304 without the
+# history being queried, every write path (create, batch,
+# import, update, delete, group commit) moves the validator,
+# tags differ per page / filter and per user, and the async
+# router behaves the same.
+# ----------------------------------------------------------
+
+from contextlib import contextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.database.async_dbase import dispose_async_engine
+from app.database.dbase import get_shared_engine
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from app.services.conditional import etag_matches
+from main import app
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+
+@contextmanager
+def history_reads(engine):
+    """Collect SELECTs against the calculations table."""
+    seen = []
+
+    def record(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM calculations" in statement:
+            seen.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def revalidate(client, url, headers, etag, **params):
+    return client.get(url, params=params, headers={**headers, "If-None-Match": etag})
+
+
+# ----------------------------------------------------------
+# Sync router
+# ----------------------------------------------------------
+def test_unchanged_history_is_304_without_query(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "etag_list", "7770001111")
+    client.post("/calculations", json={"type": "add", "a": 1, "b": 2}, headers=headers)
+
+    first = client.get("/calculations", headers=headers)
+    etag = first.headers["etag"]
+    assert etag.startswith('"h') and first.headers["cache-control"] == "private, no-cache"
+
+    with history_reads(get_shared_engine()) as seen:
+        client.get("/calculations", headers=headers)
+    assert seen  # the listener sees a normal history read
+
+    with history_reads(get_shared_engine()) as seen:
+        again = revalidate(client, "/calculations", headers, etag)
+    assert again.status_code == 304
+    assert again.content == b"" and again.headers["etag"] == etag
+    assert seen == []
+
+    # Weak form and lists of validators match too
+    assert revalidate(client, "/calculations", headers, f'"x", W/{etag}').status_code == 304
+
+
+def test_every_write_moves_the_validator(monkeypatch, headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "etag_writes", "7770002222")
+    calc_id = client.post(
+        "/calculations", json={"type": "add", "a": 1, "b": 2}, headers=headers
+    ).json()["id"]
+
+    def write_create():
+        client.post("/calculations", json={"type": "add", "a": 5, "b": 5}, headers=headers)
+
+    def write_batch():
+        client.post("/calculations/batch", headers=headers,
+                    json={"types": ["multiply"], "a": [2], "b": [3]})
+
+    def write_import():
+        client.post("/calculations/import?format=csv", headers=headers,
+                    content=b"type,a,b\nsubtract,9,1\n")
+
+    def write_update():
+        client.put(f"/calculations/{calc_id}", json={"type": "divide", "a": 8, "b": 2},
+                   headers=headers)
+
+    def write_group_commit():
+        monkeypatch.setattr(settings, "WRITE_GROUP_COMMIT", True)
+        client.post("/calculations", json={"type": "add", "a": 7, "b": 7}, headers=headers)
+        monkeypatch.setattr(settings, "WRITE_GROUP_COMMIT", False)
+
+    def write_delete():
+        client.delete(f"/calculations/{calc_id}", headers=headers)
+
+    etag = client.get("/calculations", headers=headers).headers["etag"]
+    for write in (write_create, write_batch, write_import, write_update,
+                  write_group_commit, write_delete):
+        write()
+        fresh = revalidate(client, "/calculations", headers, etag)
+        assert fresh.status_code == 200, write.__name__
+        assert fresh.headers["etag"] != etag
+        etag = fresh.headers["etag"]
+
+
+def test_failed_writes_keep_the_validator(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "etag_noop", "7770003333")
+    etag = client.get("/calculations", headers=headers).headers["etag"]
+
+    client.delete("/calculations/999999", headers=headers)
+    client.put("/calculations/999999", json={"type": "add", "a": 1, "b": 1}, headers=headers)
+
+    assert revalidate(client, "/calculations", headers, etag).status_code == 304
+
+
+def test_tags_are_per_page_filter_and_user(headers_for):
+    client = TestClient(app)
+    owner = headers_for(client, "etag_owner", "7770004444")
+    other = headers_for(client, "etag_other", "7770005555")
+    for a in range(3):
+        client.post("/calculations", json={"type": "add", "a": a, "b": 1}, headers=owner)
+
+    full = client.get("/calculations", headers=owner).headers["etag"]
+    small = client.get("/calculations", params={"limit": 1}, headers=owner).headers["etag"]
+    typed = client.get("/calculations", params={"type": "add"}, headers=owner).headers["etag"]
+    assert len({full, small, typed}) == 3
+
+    assert revalidate(client, "/calculations", owner, small, limit=1).status_code == 304
+    assert revalidate(client, "/calculations", owner, small).status_code == 200
+    assert revalidate(client, "/calculations", other, full).status_code == 200
+
+
+def test_read_calculation_etag(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "etag_read", "7770006666")
+    calc_id = client.post(
+        "/calculations", json={"type": "add", "a": 1, "b": 2}, headers=headers
+    ).json()["id"]
+
+    first = client.get(f"/calculations/{calc_id}", headers=headers)
+    etag = first.headers["etag"]
+    assert first.json()["result"] == 3 and etag.startswith('"c')
+
+    with history_reads(get_shared_engine()) as seen:
+        assert revalidate(client, f"/calculations/{calc_id}", headers, etag).status_code == 304
+    assert seen == []
+    assert revalidate(client, f"/calculations/{calc_id}", headers, "*").status_code == 304
+
+    client.put(f"/calculations/{calc_id}", json={"type": "add", "a": 2, "b": 2}, headers=headers)
+    changed = revalidate(client, f"/calculations/{calc_id}", headers, etag)
+    assert changed.status_code == 200 and changed.json()["result"] == 4
+
+    client.delete(f"/calculations/{calc_id}", headers=headers)
+    gone = revalidate(client, f"/calculations/{calc_id}", headers, changed.headers["etag"])
+    assert gone.status_code == 404
+
+
+def test_etag_matches_header_forms():
+    def request(value=None):
+        headers = [(b"if-none-match", value.encode())] if value is not None else []
+        return Request({"type": "http", "headers": headers})
+
+    assert not etag_matches(request(), '"a"')
+    assert not etag_matches(request(""), '"a"')
+    assert not etag_matches(request('"b", W/"c"'), '"a"')
+    assert etag_matches(request(' "b" , "a"'), '"a"')
+
+
+# ----------------------------------------------------------
+# Async router
+# ----------------------------------------------------------
+def test_async_router_conditional_get(headers_for):
+    with TestClient(async_app) as client:
+        headers = headers_for(client, "etag_async", "7770007777")
+        calc_id = client.post(
+            "/calculations", json={"type": "add", "a": 1, "b": 1}, headers=headers
+        ).json()["id"]
+
+        listed = client.get("/calculations", headers=headers)
+        read = client.get(f"/calculations/{calc_id}", headers=headers)
+        list_tag, read_tag = listed.headers["etag"], read.headers["etag"]
+
+        assert revalidate(client, "/calculations", headers, list_tag).status_code == 304
+        assert revalidate(client, f"/calculations/{calc_id}", headers, read_tag).status_code == 304
+
+        client.post("/calculations", json={"type": "add", "a": 2, "b": 2}, headers=headers)
+        assert revalidate(client, "/calculations", headers, list_tag).status_code == 200
+        assert revalidate(client, f"/calculations/{calc_id}", headers, read_tag).status_code == 200
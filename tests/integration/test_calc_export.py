@@ -0,0 +1,86 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: History Export Tests
+# File: tests/integration/test_calc_export.py
+# ----------------------------------------------------------
+# Description:
+# Tests GET /calculations/export. Verifies NDJSON and CSV
+# output (content type, attachment header, one record per
+# row, newest first), the header-only CSV for empty history,
+# and that unknown formats are rejected.
+# ----------------------------------------------------------
+
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+from main import app
+from app.services import history_export
+
+client = TestClient(app)
+
+
+# ----------------------------------------------------------
+# Helper: seed calculations
+# ----------------------------------------------------------
+def seed(headers, count):
+    client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": ["multiply"] * count, "a": list(range(count)), "b": [2] * count},
+    )
+
+
+# ----------------------------------------------------------
+# NDJSON export streams every row across partitions
+# ----------------------------------------------------------
+def test_export_ndjson(monkeypatch, headers_for):
+    headers = headers_for(client, "export_user", "3332221111")
+    seed(headers, 5)
+
+    # Force several server-side cursor partitions
+    monkeypatch.setattr(history_export, "EXPORT_CHUNK_ROWS", 2)
+
+    response = client.get("/calculations/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "calculations.ndjson" in response.headers["content-disposition"]
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["result"] for row in rows] == [8, 6, 4, 2, 0]
+    assert set(rows[0]) == set(history_export.EXPORT_COLUMNS)
+
+
+# ----------------------------------------------------------
+# CSV export includes a header row
+# ----------------------------------------------------------
+def test_export_csv(headers_for):
+    headers = headers_for(client, "export_user", "3332221111")
+    seed(headers, 3)
+
+    response = client.get("/calculations/export?format=csv", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 3
+    assert rows[0]["type"] == "multiply"
+    assert float(rows[0]["result"]) == 4
+
+
+def test_export_csv_empty_history(headers_for):
+    headers = headers_for(client, "export_user", "3332221111")
+
+    response = client.get("/calculations/export?format=csv", headers=headers)
+    assert response.text.strip() == ",".join(history_export.EXPORT_COLUMNS)
+
+
+# ----------------------------------------------------------
+# Unknown format
+# ----------------------------------------------------------
+def test_export_unknown_format(headers_for):
+    headers = headers_for(client, "export_user", "3332221111")
+
+    response = client.get("/calculations/export?format=xml", headers=headers)
+    assert response.status_code == 422
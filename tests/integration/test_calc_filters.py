@@ -0,0 +1,192 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: History Filter Tests
+# File: tests/integration/test_calc_filters.py
+# ----------------------------------------------------------
+# Description:
+# Tests the GET /calculations filters (type, created_at
+# range, result range, operand equality) alone, combined,
+# and across keyset pages, on the sync and async routers.
+# Query-plan tests check that each filter combination is an
+# index search rather than a table scan: always on SQLite,
+# and on PostgreSQL when POSTGRES_TEST_URL is set.
+# ----------------------------------------------------------
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+
+from app.database.async_dbase import dispose_async_engine
+from app.database.dbase import Base, get_session_factory, get_shared_engine
+from app.database.history_filters import history_conditions
+from app.database.pagination import apply_keyset
+from app.models.cal_models import Calculation
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from main import app
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+T0 = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+ROWS = [
+    # (type, a, b, result, day offset)
+    ("add", 1, 2, 3, 0),
+    ("add", 10, 5, 15, 1),
+    ("subtract", 10, 5, 5, 2),
+    ("multiply", 3, 4, 12, 3),
+    ("divide", 8, 2, 4, 4),
+    ("add", 1, 2, 3, 5),
+    ("multiply", 2, 4, 8, 6),
+]
+
+# Filter combinations → indexes that may serve them on SQLite
+OPERANDS = ("ix_calculations_user_a_created_id", "ix_calculations_user_b_created_id")
+PLAN_CASES = [
+    ({"op_type": "add"}, ("ix_calculations_user_type_created_id",)),
+    ({"op_type": "add", "start": T0, "end": T0 + timedelta(days=3)},
+     ("ix_calculations_user_type_created_id",)),
+    ({"start": T0, "end": T0 + timedelta(days=3)}, ("ix_calculations_user_created_id",)),
+    ({"result_min": 4, "result_max": 12}, ("ix_calculations_user_result",)),
+    ({"op_type": "add", "result_min": 10}, ("ix_calculations_user_result",
+                                            "ix_calculations_user_type_created_id")),
+    ({"a": 10}, ("ix_calculations_user_a_created_id",)),
+    ({"b": 5}, ("ix_calculations_user_b_created_id",)),
+    ({"a": 10, "b": 5}, OPERANDS),
+    ({"op_type": "add", "a": 1}, OPERANDS + ("ix_calculations_user_type_created_id",)),
+]
+
+
+def seed(user_id: int):
+    with get_session_factory()() as session:
+        session.execute(
+            Calculation.__table__.insert(),
+            [
+                {"type": t, "a": a, "b": b, "result": r, "user_id": user_id,
+                 "created_at": T0 + timedelta(days=day)}
+                for t, a, b, r, day in ROWS
+            ],
+        )
+        session.commit()
+
+
+def results(client, headers, **params):
+    response = client.get("/calculations", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return [row["result"] for row in response.json()]
+
+
+# ----------------------------------------------------------
+# Filtering through the API
+# ----------------------------------------------------------
+def test_each_filter_alone(headers_for):
+    client = TestClient(app)
+    headers, user_id = headers_for(client, "filter_one", "8880001111", with_id=True)
+    seed(user_id)
+
+    assert results(client, headers, type="add") == [3, 15, 3]
+    assert results(client, headers, type=" ADD ") == [3, 15, 3]
+    assert results(client, headers, **{
+        "from": (T0 + timedelta(days=2)).isoformat(),
+        "to": (T0 + timedelta(days=4)).isoformat(),
+    }) == [12, 5]
+    assert results(client, headers, result_min=5, result_max=12) == [8, 12, 5]
+    assert results(client, headers, a=10) == [5, 15]
+    assert results(client, headers, b=2) == [3, 4, 3]
+
+
+def test_filters_combine_and_page(headers_for):
+    client = TestClient(app)
+    headers, user_id = headers_for(client, "filter_many", "8880001112", with_id=True)
+    seed(user_id)
+
+    assert results(client, headers, type="add", a=1, b=2) == [3, 3]
+    assert results(client, headers, type="add", result_min=10) == [15]
+    since = {"from": (T0 + timedelta(days=1)).isoformat()}
+    assert results(client, headers, type="add", **since) == [3, 15]
+
+    first = client.get("/calculations", params={"type": "add", "limit": 2}, headers=headers)
+    assert [r["result"] for r in first.json()] == [3, 15]
+    second = client.get(
+        "/calculations",
+        params={"type": "add", "limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [r["result"] for r in second.json()] == [3]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_invalid_filters_are_rejected(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "filter_bad", "8880001113")
+
+    assert client.get("/calculations?type=modulo", headers=headers).status_code == 400
+    assert client.get(
+        "/calculations?result_min=5&result_max=1", headers=headers
+    ).status_code == 400
+    assert client.get(
+        "/calculations?from=2024-05-02T00:00:00Z&to=2024-05-01T00:00:00Z", headers=headers
+    ).status_code == 400
+    assert client.get("/calculations?a=abc", headers=headers).status_code == 422
+
+
+def test_async_router_filters(headers_for):
+    sync_client = TestClient(app)
+    headers, user_id = headers_for(sync_client, "filter_async", "8880001114", with_id=True)
+    seed(user_id)
+
+    with TestClient(async_app) as client:
+        assert results(client, headers, type="add", b=2) == [3, 3]
+        assert results(client, headers, result_max=4) == [3, 4, 3]
+        assert client.get("/calculations?type=modulo", headers=headers).status_code == 400
+
+
+# ----------------------------------------------------------
+# Query plans
+# ----------------------------------------------------------
+def page_statement(**filters):
+    stmt = select(Calculation).where(Calculation.user_id == 1, *history_conditions(**filters))
+    return apply_keyset(stmt, Calculation.created_at, Calculation.id, None, 50)[0]
+
+
+def sqlite_plan(stmt) -> str:
+    engine = get_shared_engine()
+    sql = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+        return " | ".join(str(r[-1]) for r in rows)
+
+
+@pytest.mark.parametrize("filters,indexes", PLAN_CASES)
+def test_sqlite_filters_search_an_index(filters, indexes):
+    plan = sqlite_plan(page_statement(**filters))
+
+    assert any(f"SEARCH calculations USING INDEX {ix}" in plan for ix in indexes), plan
+    assert "SCAN calculations" not in plan
+
+
+@pytest.mark.skipif(
+    not os.getenv("POSTGRES_TEST_URL"), reason="POSTGRES_TEST_URL not set"
+)
+@pytest.mark.parametrize("filters,indexes", PLAN_CASES)
+def test_postgres_filters_use_an_index(filters, indexes):  # pragma: no cover - needs a server
+    engine = create_engine(os.environ["POSTGRES_TEST_URL"])
+    try:
+        Base.metadata.create_all(engine)
+        stmt = page_statement(**filters)
+        sql = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+        with engine.connect() as conn:
+            # Tiny test tables would otherwise always be seq-scanned
+            conn.exec_driver_sql("SET enable_seqscan = off")
+            plan = " ".join(r[0] for r in conn.exec_driver_sql(f"EXPLAIN {sql}"))
+        assert "Seq Scan on calculations" not in plan
+        assert any(ix in plan for ix in indexes), plan
+    finally:
+        engine.dispose()
@@ -0,0 +1,144 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Streaming Import Tests
+# File: tests/integration/test_calc_import.py
+# ----------------------------------------------------------
+# Description:
+# Tests POST /calculations/import for NDJSON and CSV uploads.
+# Verifies chunked bodies are parsed incrementally, accepted
+# rows are written across several bulk-insert chunks,
+# rejected rows are reported with line numbers, a leading
+# UTF-8 BOM is ignored, and an exported history can be
+# re-imported unchanged.
+# ----------------------------------------------------------
+
+import json
+
+from fastapi.testclient import TestClient
+from main import app
+from app.services import history_import
+
+client = TestClient(app)
+
+
+# ----------------------------------------------------------
+# Helper: chunked request body
+# ----------------------------------------------------------
+def chunked(payload: bytes, size: int = 7):
+    """Yield the body in small pieces that split lines mid-way."""
+    for i in range(0, len(payload), size):
+        yield payload[i:i + size]
+
+
+# ----------------------------------------------------------
+# NDJSON upload with mixed valid / invalid rows
+# ----------------------------------------------------------
+def test_import_ndjson_summary(monkeypatch, headers_for):
+    headers = headers_for(client, "import_user", "2221110000")
+    monkeypatch.setattr(history_import, "IMPORT_CHUNK_ROWS", 2)
+
+    lines = [
+        json.dumps({"type": "add", "a": 1, "b": 2}),
+        json.dumps({"type": "divide", "a": 1, "b": 0}),
+        "",
+        "{not json",
+        json.dumps({"type": "multiply", "a": 3, "b": 4}),
+        json.dumps({"type": "subtract", "a": 9, "b": "x"}),
+        json.dumps({"type": "divide", "a": 8, "b": 2,
+                    "created_at": "2020-01-01T12:00:00+02:00"}),
+        json.dumps(["add", 1, 2]),
+        json.dumps({"type": "power", "a": 2, "b": 2}),
+    ]
+    body = ("\n".join(lines)).encode()
+
+    response = client.post(
+        "/calculations/import", headers=headers, content=chunked(body)
+    )
+    assert response.status_code == 200
+
+    summary = response.json()
+    assert summary["accepted"] == 3
+    assert summary["rejected"] == 5
+    assert summary["errors_truncated"] is False
+    assert [e["line"] for e in summary["errors"]] == [2, 4, 6, 8, 9]
+    assert summary["errors"][0]["detail"] == "Division by zero"
+    assert summary["errors"][1]["detail"] == "Invalid JSON"
+
+    history = client.get("/calculations", headers=headers).json()
+    assert sorted(row["result"] for row in history) == [3, 4, 12]
+    assert history[-1]["created_at"].startswith("2020-01-01T10:00:00")
+
+
+# ----------------------------------------------------------
+# CSV upload, including error truncation
+# ----------------------------------------------------------
+def test_import_csv(monkeypatch, headers_for):
+    headers = headers_for(client, "import_user", "2221110000")
+    monkeypatch.setattr(history_import, "IMPORT_MAX_ERRORS", 1)
+
+    body = (
+        "Type,A,B\r\n"
+        "add,1,1\r\n"
+        "multiply,2,5\r\n"
+        "add,,1\r\n"
+        "divide,4,bad-date-free\r\n"
+    ).encode()
+
+    response = client.post(
+        "/calculations/import?format=csv", headers=headers, content=body
+    )
+    summary = response.json()
+
+    assert summary["accepted"] == 2
+    assert summary["rejected"] == 2
+    assert summary["errors"] == [{"line": 4, "detail": "Missing field 'a'"}]
+    assert summary["errors_truncated"] is True
+
+
+# ----------------------------------------------------------
+# CSV saved with a byte order mark (Excel, Windows tools)
+# ----------------------------------------------------------
+def test_import_csv_with_bom(headers_for):
+    headers = headers_for(client, "import_user", "2221110000")
+    body = b"\xef\xbb\xbf" + b"type,a,b\r\nadd,1,1\r\nmultiply,2,5\r\n"
+
+    # The BOM itself is split across the first two chunks
+    response = client.post(
+        "/calculations/import?format=csv", headers=headers, content=chunked(body, size=2)
+    )
+    summary = response.json()
+
+    assert summary["accepted"] == 2
+    assert summary["rejected"] == 0
+
+
+# ----------------------------------------------------------
+# Export → import round trip
+# ----------------------------------------------------------
+def test_export_csv_reimports(headers_for):
+    headers = headers_for(client, "import_user", "2221110000")
+    client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": ["add", "divide"], "a": [2, 9], "b": [3, 3]},
+    )
+
+    exported = client.get("/calculations/export?format=csv", headers=headers).content
+    response = client.post(
+        "/calculations/import?format=csv", headers=headers, content=exported
+    )
+
+    assert response.json()["accepted"] == 2
+    assert len(client.get("/calculations", headers=headers).json()) == 4
+
+
+# ----------------------------------------------------------
+# Invalid timestamp is rejected per row
+# ----------------------------------------------------------
+def test_import_invalid_timestamp(headers_for):
+    headers = headers_for(client, "import_user", "2221110000")
+
+    body = json.dumps({"type": "add", "a": 1, "b": 1, "created_at": "yesterday"})
+    response = client.post("/calculations/import", headers=headers, content=body)
+
+    assert response.json()["errors"][0]["detail"].startswith("Field 'created_at'")
@@ -0,0 +1,176 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: History Pagination Tests
+# File: tests/integration/test_calc_pagination.py
+# ----------------------------------------------------------
+# Description:
+# Tests keyset pagination on GET /calculations. Walks forward
+# and backward through pages using the opaque cursors in the
+# X-Next-Cursor / X-Prev-Cursor headers, checks that pages
+# never overlap (also over rows stored with second-precision
+# CURRENT_TIMESTAMP text before the upgrade), and verifies page-size limits, rejection
+# of malformed cursors, identical pages from the orjson
+# and stdlib encoders, and that the dashboard's history is
+# not cut to the first page.
+# ----------------------------------------------------------
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from main import app
+from app.core.config import settings
+from app.database.dbase import engine
+from app.database.migrations import v0007_calculation_timestamp_precision
+from app.services import fast_json
+
+client = TestClient(app)
+
+
+# ----------------------------------------------------------
+# Fixture: a user with seeded calculations
+# ----------------------------------------------------------
+@pytest.fixture
+def seeded_headers(headers_for):
+    """seeded_headers(count) → headers of a user with count rows."""
+    def seed(count=5):
+        headers = headers_for(client, "page_user", "4443332222")
+        if count:
+            client.post(
+                "/calculations/batch",
+                headers=headers,
+                json={
+                    "types": ["add"] * count,
+                    "a": list(range(count)),
+                    "b": [0] * count,
+                },
+            )
+        return headers
+
+    return seed
+
+
+# ----------------------------------------------------------
+# Forward and backward traversal
+# ----------------------------------------------------------
+def test_keyset_pages_forward_and_back(seeded_headers):
+    headers = seeded_headers(5)
+
+    first = client.get("/calculations?limit=2", headers=headers)
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    assert "X-Prev-Cursor" not in first.headers
+
+    second = client.get(
+        f"/calculations?limit=2&cursor={first.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+    third = client.get(
+        f"/calculations?limit=2&cursor={second.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+    assert len(third.json()) == 1
+    assert "X-Next-Cursor" not in third.headers
+
+    # Pages cover every row exactly once, newest first
+    ids = [row["id"] for page in (first, second, third) for row in page.json()]
+    assert len(set(ids)) == 5
+    assert [row["result"] for page in (first, second, third) for row in page.json()] == [
+        4, 3, 2, 1, 0,
+    ]
+
+    back = client.get(
+        f"/calculations?limit=2&cursor={second.headers['X-Prev-Cursor']}",
+        headers=headers,
+    )
+    assert [row["id"] for row in back.json()] == [row["id"] for row in first.json()]
+    assert "X-Prev-Cursor" not in back.headers
+
+
+# ----------------------------------------------------------
+# Rows stored before the upgrade (CURRENT_TIMESTAMP text)
+# ----------------------------------------------------------
+def test_rows_with_second_precision_timestamps_page_through(seeded_headers):
+    headers = seeded_headers(0)
+    with engine.begin() as conn:
+        user_id = conn.execute(
+            text("SELECT id FROM users WHERE username = 'page_user'")
+        ).scalar()
+        for value in range(5):
+            conn.execute(
+                text("INSERT INTO calculations (type, a, b, result, user_id, created_at) "
+                     "VALUES ('add', :v, 0, :v, :u, CURRENT_TIMESTAMP)"),
+                {"v": value, "u": user_id},
+            )
+        v0007_calculation_timestamp_precision.upgrade(conn)
+
+    pages, cursor = [], None
+    while len(pages) < 5:  # bounded: a repeating cursor must not loop
+        query = "/calculations?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        res = client.get(query, headers=headers)
+        pages.append(res)
+        cursor = res.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    ids = [row["id"] for page in pages for row in page.json()]
+    assert len(pages) == 3
+    assert sorted(ids, reverse=True) == ids and len(set(ids)) == 5
+
+    back = client.get(
+        f"/calculations?limit=2&cursor={pages[2].headers['X-Prev-Cursor']}", headers=headers
+    )
+    assert back.json() == pages[1].json()
+
+
+# ----------------------------------------------------------
+# Server-side page size limits
+# ----------------------------------------------------------
+def test_page_size_default_and_max(monkeypatch, seeded_headers):
+    headers = seeded_headers(4)
+
+    monkeypatch.setattr(settings, "CALC_PAGE_SIZE_DEFAULT", 3)
+    monkeypatch.setattr(settings, "CALC_PAGE_SIZE_MAX", 2)
+
+    assert len(client.get("/calculations", headers=headers).json()) == 3
+    assert len(client.get("/calculations?limit=50", headers=headers).json()) == 2
+
+
+# ----------------------------------------------------------
+# Malformed cursor
+# ----------------------------------------------------------
+def test_invalid_cursor_rejected(seeded_headers):
+    headers = seeded_headers(1)
+
+    response = client.get("/calculations?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+# ----------------------------------------------------------
+# Pre-encoded pages (fast JSON path and stdlib fallback)
+# ----------------------------------------------------------
+def test_pages_are_identical_with_stdlib_encoder(monkeypatch, seeded_headers):
+    headers = seeded_headers(3)
+
+    fast = client.get("/calculations?limit=2", headers=headers)
+    assert fast.headers["content-type"] == "application/json"
+
+    monkeypatch.setattr(fast_json, "orjson", None)
+    fallback = client.get("/calculations?limit=2", headers=headers)
+
+    assert fallback.json() == fast.json()
+    assert fallback.headers["X-Next-Cursor"] == fast.headers["X-Next-Cursor"]
+
+
+# ----------------------------------------------------------
+# Dashboard shows the whole history, not the first page
+# ----------------------------------------------------------
+def test_dashboard_history_is_not_cut_to_one_page(monkeypatch, seeded_headers):
+    monkeypatch.setattr(settings, "CALC_PAGE_SIZE_DEFAULT", 3)
+    headers = seeded_headers(5)
+    assert len(client.get("/calculations", headers=headers).json()) == 3
+
+    # The endpoint the dashboard table loads from
+    rows = client.get("/calculations/rows", headers=headers)
+    assert rows.status_code == 200
+    assert rows.text.count("<tr ") == 5
@@ -0,0 +1,128 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Single-Statement Write Tests
+# File: tests/integration/test_calc_returning.py
+# ----------------------------------------------------------
+# Description:
+# Locks in every SQL statement of each write transaction:
+# one against the calculations table per create / update /
+# delete request (INSERT / UPDATE / DELETE ... RETURNING, no
+# SELECT or refresh; updates return the old values for the
+# stats rollup too), followed by the rollup statements (which
+# also carry the history version; the users row is never
+# written), including the 404 paths and someone else's row,
+# for both the sync and async routers.
+# ----------------------------------------------------------
+
+import re
+from contextlib import contextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database.async_dbase import dispose_async_engine, get_async_writer_engine
+from app.database.dbase import get_writer_engine
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from main import app
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+
+WRITE = re.compile(r"\b(INSERT INTO|UPDATE|DELETE FROM)\s+(\w+)")
+
+
+def describe(statement: str) -> str:
+    """'UPDATE calculations', 'INSERT calculation_stats', 'SELECT', ..."""
+    match = WRITE.search(statement)
+    if match is None:
+        return statement.split()[0].upper()
+    return f"{match.group(1).split()[0]} {match.group(2)}"
+
+
+@contextmanager
+def write_statements(engine):
+    """Collect every statement engine runs (transaction BEGINs aside)."""
+    seen = []
+
+    def record(conn, cursor, statement, params, context, executemany):
+        if not statement.startswith("BEGIN"):
+            seen.append(describe(statement))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def exercise_writes(client, engine, headers_for):
+    owner = headers_for(client, "owner", "4445550001")
+    other = headers_for(client, "other", "4445550002")
+
+    with write_statements(engine) as seen:
+        created = client.post(
+            "/calculations", json={"type": "add", "a": 2, "b": 3}, headers=owner
+        )
+    assert created.status_code == 201
+    body = created.json()
+    assert body["result"] == 5 and body["created_at"] and body["id"]
+    assert seen == ["INSERT calculations", "INSERT calculation_stats"]
+
+    calc_id = body["id"]
+    with write_statements(engine) as seen:
+        updated = client.put(
+            f"/calculations/{calc_id}",
+            json={"type": "multiply", "a": 4, "b": 5},
+            headers=owner,
+        )
+    assert updated.json()["result"] == 20
+    assert updated.json()["created_at"] == body["created_at"]
+    assert seen == [
+        "UPDATE calculations",       # old values come back with the new row
+        "UPDATE calculation_stats",  # take the old row out ...
+        "UPDATE calculation_stats",  # ... and empty its "add" rollup
+        "INSERT calculation_stats",  # fold the new row in
+    ]
+
+    with write_statements(engine) as seen:
+        assert client.put(
+            f"/calculations/{calc_id}",
+            json={"type": "add", "a": 1, "b": 1},
+            headers=other,
+        ).status_code == 404
+        assert client.delete(f"/calculations/{calc_id}", headers=other).status_code == 404
+    assert seen == ["UPDATE calculations", "DELETE calculations"]
+
+    with write_statements(engine) as seen:
+        assert client.delete(f"/calculations/{calc_id}", headers=owner).status_code == 204
+        assert client.delete(f"/calculations/{calc_id}", headers=owner).status_code == 404
+    assert seen == [
+        "DELETE calculations",
+        "UPDATE calculation_stats",
+        "UPDATE calculation_stats",
+        "DELETE calculations",
+    ]
+
+    assert client.get(f"/calculations/{calc_id}", headers=owner).status_code == 404
+
+
+def test_sync_writes_are_single_statements(headers_for):
+    exercise_writes(TestClient(app), get_writer_engine(), headers_for)
+
+
+def test_async_writes_are_single_statements(headers_for):
+    with TestClient(async_app) as client:
+        exercise_writes(client, get_async_writer_engine().sync_engine, headers_for)
+
+
+def test_update_missing_row_is_404(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "lonely", "4445550003")
+    res = client.put("/calculations/999", json={"type": "add", "a": 1, "b": 1}, headers=headers)
+    assert res.status_code == 404
+    assert res.json()["detail"] == "Calculation not found"
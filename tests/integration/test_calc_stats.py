@@ -0,0 +1,237 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation Stats Rollup Tests
+# File: tests/integration/test_calc_stats.py
+# ----------------------------------------------------------
+# Description:
+# Drives every write path (create, batch, import, update,
+# delete, group commit, async router) and checks after each
+# step that calculation_stats matches a GROUP BY over the
+# calculations table. Also covers GET /calculations/stats,
+# min / max recomputation when an extreme row leaves, the
+# rollup row emptied (not dropped) at zero, versions that
+# only ever grow, and the rebuild CLI.
+# ----------------------------------------------------------
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.database import calc_stats
+from app.database.async_dbase import dispose_async_engine
+from app.database.calc_versions import current_version
+from app.database.dbase import get_session_factory
+from app.models.cal_models import Calculation, CalculationStats
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from main import app
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+
+def rollup() -> dict:
+    """Non-empty calculation_stats as {(user_id, type): (count, sum, min, max, last_at)}."""
+    s = CalculationStats
+    with get_session_factory()() as session:
+        rows = session.execute(
+            select(s.user_id, s.type, s.calc_count, s.result_sum,
+                   s.result_min, s.result_max, s.last_at)
+            .where(s.calc_count > 0)
+        ).all()
+    return {(r[0], r[1]): tuple(r[2:]) for r in rows}
+
+
+def scanned() -> dict:
+    """The same shape, computed from the calculations table."""
+    c = Calculation
+    with get_session_factory()() as session:
+        rows = session.execute(
+            select(c.user_id, c.type, func.count(), func.coalesce(func.sum(c.result), 0.0),
+                   func.min(c.result), func.max(c.result), func.max(c.created_at))
+            .group_by(c.user_id, c.type)
+        ).all()
+    return {(r[0], r[1]): tuple(r[2:]) for r in rows}
+
+
+def assert_in_step():
+    actual, expected = rollup(), scanned()
+    assert actual.keys() == expected.keys()
+    for key, (count, total, low, high, last_at) in expected.items():
+        assert actual[key] == (count, pytest.approx(total), low, high, last_at)
+
+
+# ----------------------------------------------------------
+# Sync write paths
+# ----------------------------------------------------------
+def test_every_write_path_keeps_rollup_in_step(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "stats_sync", "5556660001")
+
+    ids = [
+        client.post("/calculations", json=body, headers=headers).json()["id"]
+        for body in (
+            {"type": "add", "a": 1, "b": 2},
+            {"type": "add", "a": 10, "b": 5},
+            {"type": "multiply", "a": 3, "b": 4},
+        )
+    ]
+    assert_in_step()
+
+    client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": ["add", "divide", "power"], "a": [7, 9, 2], "b": [1, 3, 3]},
+    )
+    assert_in_step()
+
+    body = "\n".join([
+        json.dumps({"type": "subtract", "a": 1, "b": 8}),
+        json.dumps({"type": "add", "a": 0, "b": 0, "created_at": "2020-01-01T00:00:00Z"}),
+    ]).encode()
+    assert client.post("/calculations/import", headers=headers, content=body).json()["accepted"] == 2
+    assert_in_step()
+
+    # Type change moves the row between rollups; the emptied one
+    # is kept (reset) so its version survives
+    client.put(f"/calculations/{ids[2]}", json={"type": "add", "a": 50, "b": 50}, headers=headers)
+    assert_in_step()
+    assert "multiply" not in {t for _, t in rollup()}
+    with get_session_factory()() as session:
+        emptied = session.execute(
+            select(CalculationStats).where(CalculationStats.type == "multiply")
+        ).scalar_one()
+        assert (emptied.calc_count, emptied.result_sum, emptied.result_min,
+                emptied.result_max, emptied.last_at) == (0, 0.0, None, None, None)
+        assert emptied.version == 2  # inserted, then removed
+
+    # Removing the current max forces a recompute
+    client.delete(f"/calculations/{ids[2]}", headers=headers)
+    client.delete(f"/calculations/{ids[0]}", headers=headers)
+    assert_in_step()
+
+    stats = client.get("/calculations/stats", headers=headers).json()
+    history = client.get("/calculations", params={"limit": 100}, headers=headers).json()
+    assert stats["count"] == len(history)
+    assert stats["sum"] == pytest.approx(sum(r["result"] for r in history))
+    assert stats["min"] == min(r["result"] for r in history)
+    assert stats["max"] == max(r["result"] for r in history)
+    assert stats["by_type"]["add"]["count"] == sum(r["type"] == "add" for r in history)
+
+
+def test_stats_are_per_user_and_empty_by_default(headers_for):
+    client = TestClient(app)
+    owner = headers_for(client, "stats_owner", "5556660002")
+    other = headers_for(client, "stats_other", "5556660003")
+
+    client.post("/calculations", json={"type": "add", "a": 1, "b": 1}, headers=owner)
+
+    assert client.get("/calculations/stats", headers=other).json() == {
+        "count": 0, "sum": 0.0, "min": None, "max": None, "last_at": None, "by_type": {},
+    }
+    assert client.get("/calculations/stats", headers=owner).json()["count"] == 1
+
+
+def test_failed_update_and_delete_leave_rollup_alone(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "stats_missing", "5556660004")
+    client.post("/calculations", json={"type": "add", "a": 1, "b": 1}, headers=headers)
+    before = rollup()
+
+    assert client.put("/calculations/999", json={"type": "add", "a": 1, "b": 1},
+                      headers=headers).status_code == 404
+    assert client.delete("/calculations/999", headers=headers).status_code == 404
+    assert rollup() == before
+
+
+# ----------------------------------------------------------
+# Group commit and async router
+# ----------------------------------------------------------
+def test_group_commit_path_updates_rollup(monkeypatch, headers_for):
+    monkeypatch.setattr(settings, "WRITE_GROUP_COMMIT", True)
+    client = TestClient(app)
+    headers = headers_for(client, "stats_group", "5556660005")
+
+    for a in range(5):
+        client.post("/calculations", json={"type": "multiply", "a": a, "b": 2}, headers=headers)
+
+    assert_in_step()
+    assert client.get("/calculations/stats", headers=headers).json()["max"] == 8
+
+
+def test_async_router_keeps_rollup_in_step(headers_for):
+    with TestClient(async_app) as client:
+        headers = headers_for(client, "stats_async", "5556660006")
+        ids = [
+            client.post("/calculations", json={"type": "add", "a": a, "b": 1},
+                        headers=headers).json()["id"]
+            for a in range(3)
+        ]
+        client.post("/calculations/batch", headers=headers,
+                    json={"types": ["divide"], "a": [9], "b": [3]})
+        client.post("/calculations/import?format=csv", headers=headers,
+                    content=b"type,a,b\nsubtract,5,9\n")
+        client.put(f"/calculations/{ids[0]}", json={"type": "divide", "a": 8, "b": 2},
+                   headers=headers)
+        client.delete(f"/calculations/{ids[2]}", headers=headers)
+        assert_in_step()
+
+        stats = client.get("/calculations/stats", headers=headers).json()
+        assert stats["count"] == 4
+        assert stats["by_type"]["divide"]["count"] == 2
+
+
+# ----------------------------------------------------------
+# Rebuild
+# ----------------------------------------------------------
+def test_rebuild_cli_restores_drifted_rollup(capsys, headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "stats_rebuild", "5556660007")
+    client.post("/calculations", json={"type": "add", "a": 2, "b": 2}, headers=headers)
+
+    with get_session_factory()() as session:
+        session.query(CalculationStats).update({"calc_count": 99})
+        session.commit()
+
+    assert calc_stats.main(["rebuild", "--user", "1"]) == 0
+    assert "for user 1" in capsys.readouterr().out
+    assert_in_step()
+
+    assert calc_stats.main(["rebuild"]) == 0
+    assert_in_step()
+    assert calc_stats.main([]) == 2
+
+
+def test_versions_only_grow(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "stats_versions", "5556660008")
+
+    def version():
+        with get_session_factory()() as session:
+            return current_version(session, 1)
+
+    seen = [version()]
+    calc_id = client.post("/calculations", json={"type": "add", "a": 1, "b": 1},
+                          headers=headers).json()["id"]
+    seen.append(version())
+    client.delete(f"/calculations/{calc_id}", headers=headers)
+    seen.append(version())
+    client.post("/calculations", json={"type": "add", "a": 1, "b": 1}, headers=headers)
+    seen.append(version())
+
+    # A row written behind the rollup's back: rebuild inserts its
+    # rollup and bumps the existing one
+    with get_session_factory()() as session:
+        session.add(Calculation(type="divide", a=1, b=1, result=1, user_id=1))
+        session.commit()
+    assert calc_stats.main(["rebuild", "--user", "1"]) == 0
+    seen.append(version())
+    assert_in_step()
+
+    assert seen == sorted(seen) and len(set(seen)) == len(seen)
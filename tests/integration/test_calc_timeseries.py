@@ -0,0 +1,173 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Calculation Time Series Tests
+# File: tests/integration/test_calc_timeseries.py
+# ----------------------------------------------------------
+# Description:
+# Tests GET /calculations/timeseries: per-bucket aggregates,
+# the [from, to) range and its defaults, automatic widening
+# of buckets on long ranges, per-user isolation, validation
+# errors, the async router, and that SQLite answers the
+# query from the (user_id, created_at, id) index.
+# ----------------------------------------------------------
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.database.async_dbase import dispose_async_engine
+from app.database.dbase import get_session_factory, get_shared_engine
+from app.database.timeseries import bucket_width, timeseries_select
+from app.models.cal_models import Calculation
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from main import app
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+T0 = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def seed(user_id: int, offsets_and_results):
+    """Insert rows at T0 + offset (seconds) with the given results."""
+    with get_session_factory()() as session:
+        session.execute(
+            Calculation.__table__.insert(),
+            [
+                {"type": "add", "a": r, "b": 0, "result": r, "user_id": user_id,
+                 "created_at": T0 + timedelta(seconds=offset)}
+                for offset, r in offsets_and_results
+            ],
+        )
+        session.commit()
+
+
+def series(client, headers, **params):
+    return client.get("/calculations/timeseries", params=params, headers=headers)
+
+
+# ----------------------------------------------------------
+# Aggregation and range
+# ----------------------------------------------------------
+def test_minute_buckets_aggregate_in_sql(headers_for):
+    client = TestClient(app)
+    headers, user_id = headers_for(client, "series_min", "7770001111", with_id=True)
+    seed(user_id, [(0, 1), (30, 3), (59, 5), (60, 10), (185, 7)])
+
+    body = series(client, headers, bucket="minute", **{
+        "from": T0.isoformat(), "to": (T0 + timedelta(minutes=10)).isoformat(),
+    }).json()
+
+    assert body["bucket"] == "minute" and body["bucket_seconds"] == 60
+    points = body["points"]
+    assert [p["start"][:19] for p in points] == [
+        "2024-03-01T12:00:00", "2024-03-01T12:01:00", "2024-03-01T12:03:00",
+    ]
+    assert points[0] == {
+        "start": points[0]["start"], "count": 3, "sum": 9.0, "avg": 3.0, "min": 1.0, "max": 5.0,
+    }
+    assert [p["count"] for p in points[1:]] == [1, 1]
+
+
+def test_range_is_half_open_and_defaults_to_full_history(headers_for):
+    client = TestClient(app)
+    headers, user_id = headers_for(client, "series_range", "7770001112", with_id=True)
+    seed(user_id, [(0, 1), (3600, 2), (7200, 3)])
+
+    window = series(client, headers, bucket="hour", **{
+        "from": T0.isoformat(), "to": (T0 + timedelta(hours=2)).isoformat(),
+    }).json()
+    assert [p["count"] for p in window["points"]] == [1, 1]
+
+    everything = series(client, headers, bucket="day").json()
+    assert everything["start"].startswith("2024-03-01T12:00:00")
+    assert sum(p["count"] for p in everything["points"]) == 3
+
+
+def test_long_ranges_are_downsampled(monkeypatch, headers_for):
+    monkeypatch.setattr(settings, "TIMESERIES_MAX_POINTS", 10)
+    client = TestClient(app)
+    headers, user_id = headers_for(client, "series_wide", "7770001113", with_id=True)
+    # One row every 10 minutes for two days
+    seed(user_id, [(i * 600, i) for i in range(288)])
+
+    body = series(client, headers, bucket="minute").json()
+    assert len(body["points"]) <= 10
+    assert body["bucket_seconds"] % 60 == 0 and body["bucket_seconds"] > 60
+    assert sum(p["count"] for p in body["points"]) == 288
+    assert max(p["max"] for p in body["points"]) == 287
+
+
+def test_series_is_per_user_and_empty_history_is_empty(headers_for):
+    client = TestClient(app)
+    owner, owner_id = headers_for(client, "series_owner", "7770001114", with_id=True)
+    other = headers_for(client, "series_other", "7770001115")
+    seed(owner_id, [(0, 1)])
+
+    assert series(client, other, bucket="day").json()["points"] == []
+    assert len(series(client, owner, bucket="day").json()["points"]) == 1
+
+
+def test_invalid_requests_are_rejected(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "series_bad", "7770001116")
+
+    assert series(client, headers, bucket="week").status_code == 422
+    backwards = series(client, headers, **{
+        "from": T0.isoformat(), "to": (T0 - timedelta(days=1)).isoformat(),
+    })
+    assert backwards.status_code == 400
+
+
+def test_async_router_matches_sync(headers_for):
+    sync_client = TestClient(app)
+    headers, user_id = headers_for(sync_client, "series_async", "7770001117", with_id=True)
+    seed(user_id, [(0, 2), (90, 4), (4000, 6)])
+    to = {"to": T0.replace(hour=14).isoformat()}
+    expected = series(sync_client, headers, bucket="minute", **to)
+
+    with TestClient(async_app) as client:
+        actual = series(client, headers, bucket="minute", **to)
+
+    assert actual.status_code == 200
+    assert actual.json() == expected.json()
+
+
+# ----------------------------------------------------------
+# Bucket sizing and query plan
+# ----------------------------------------------------------
+@pytest.mark.parametrize("bucket", ["minute", "hour", "day"])
+@pytest.mark.parametrize("days", [0, 1, 30, 3650])
+def test_bucket_width_bounds_point_count(bucket, days):
+    end = T0 + timedelta(days=days, seconds=17)
+    width = bucket_width(bucket, T0, end, 200)
+
+    assert width % {"minute": 60, "hour": 3600, "day": 86400}[bucket] == 0
+    buckets = int(end.timestamp() // width) - int(T0.timestamp() // width) + 1
+    assert buckets <= 200
+
+
+def test_sqlite_plan_uses_history_index():
+    stmt = timeseries_select("sqlite", 1, T0, T0 + timedelta(days=1), 3600)
+    compiled = stmt.compile(get_shared_engine(), compile_kwargs={"literal_binds": True})
+
+    with get_shared_engine().connect() as conn:
+        plan = " ".join(
+            str(row[-1]) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+        )
+    assert "ix_calculations_user_created_id" in plan
+
+
+def test_postgres_buckets_use_epoch_extract():
+    stmt = timeseries_select("postgresql", 1, T0, T0 + timedelta(days=1), 3600)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "floor(EXTRACT(epoch FROM calculations.created_at))" in sql
+    assert "GROUP BY" in sql
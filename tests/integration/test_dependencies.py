@@ -124,11 +124,11 @@ def test_authenticate_user_not_found(mock_db):
 def test_get_current_user_valid_token(mock_db, fake_user):
     token = dependencies.create_access_token({"sub": str(fake_user.id)})
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = fake_user
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    # get_current_user reads one Core row in USER_COLUMNS order
+    mock_db.execute.return_value.first.return_value = (
+        fake_user.id, fake_user.username, "Test", "User",
+        fake_user.email, None, True, 0,
+    )
 
     result = dependencies.get_current_user(token=token, db=mock_db)
     assert result.username == fake_user.username
@@ -147,11 +147,7 @@ def test_get_current_user_missing_sub(mock_db):
 def test_get_current_user_not_found(mock_db):
     token = dependencies.create_access_token({"sub": "999"})
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = None
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    mock_db.execute.return_value.first.return_value = None
 
     with pytest.raises(HTTPException) as exc:
         dependencies.get_current_user(token=token, db=mock_db)
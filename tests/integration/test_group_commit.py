@@ -0,0 +1,277 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Group-Commit Writer Tests
+# File: tests/integration/test_group_commit.py
+# ----------------------------------------------------------
+# Description:
+# Verifies that GroupCommitWriter folds concurrent inserts
+# into shared transactions, respects the batch size, hands
+# each caller its own row, falls back / rejects when the
+# queue is full, fails only the bad row of a batch, drains
+# on stop() without leaving any caller waiting, and
+# that POST /calculations uses it when WRITE_GROUP_COMMIT is
+# on (sync and async routers).
+# ----------------------------------------------------------
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.database.async_dbase import dispose_async_engine
+from app.database.dbase import get_session_factory, get_shared_engine
+from app.models.cal_models import Calculation
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from app.services import group_commit
+from app.services.group_commit import GroupCommitWriter
+from main import app
+
+
+def row_for(user_id: int, a: float) -> dict:
+    return {"type": "add", "a": a, "b": 1, "result": a + 1, "user_id": user_id}
+
+
+def make_writer(**overrides) -> GroupCommitWriter:
+    options = dict(
+        session_factory=get_session_factory(),
+        max_rows=100,
+        max_delay=0.05,
+        queue_max=1000,
+    )
+    options.update(overrides)
+    return GroupCommitWriter(**options)
+
+
+@pytest.fixture
+def commits():
+    """Count COMMITs on the shared engine."""
+    seen = []
+
+    def record(conn):
+        seen.append(1)
+
+    engine = get_shared_engine()
+    event.listen(engine, "commit", record)
+    yield seen
+    event.remove(engine, "commit", record)
+
+
+# ----------------------------------------------------------
+# Writer behaviour
+# ----------------------------------------------------------
+def test_concurrent_submits_share_commits(test_user, db_session, commits):
+    writer = make_writer()
+    futures = [writer.submit(row_for(test_user.id, i)) for i in range(20)]
+    results = [f.result(timeout=5) for f in futures]
+    writer.stop()
+
+    # Each caller gets its own row back, in submission order
+    assert [r.a for r in results] == [float(i) for i in range(20)]
+    assert len({r.id for r in results}) == 20
+    assert all(r.created_at is not None for r in results)
+    assert db_session.query(Calculation).count() == 20
+
+    stats = writer.stats()
+    assert stats["rows"] == 20
+    assert stats["batches"] == len(commits) < 20
+
+
+def test_batches_split_at_max_rows(test_user):
+    writer = make_writer(max_rows=4)
+    futures = [writer.submit(row_for(test_user.id, i)) for i in range(10)]
+    for f in futures:
+        f.result(timeout=5)
+    writer.stop()
+
+    stats = writer.stats()
+    assert stats["largest_batch"] <= 4
+    assert stats["batches"] >= 3
+
+
+def test_zero_delay_flushes_when_queue_drains(test_user):
+    writer = make_writer(max_delay=0)
+    assert writer.submit(row_for(test_user.id, 1)).result(timeout=5).result == 2
+    writer.stop()
+
+
+def test_full_queue_falls_back(test_user):
+    gate = threading.Event()
+    factory = get_session_factory()
+
+    def slow_factory():
+        gate.wait(5)
+        return factory()
+
+    writer = make_writer(session_factory=slow_factory, queue_max=1, max_delay=0)
+    first = writer.submit(row_for(test_user.id, 1))
+    # flusher holds `first`; fill the single queue slot
+    while writer.stats()["queue_depth"]:
+        time.sleep(0.001)
+    second = writer.submit(row_for(test_user.id, 2))
+    assert writer.submit(row_for(test_user.id, 3)) is None
+    assert writer.stats()["fallbacks"] == 1
+
+    gate.set()
+    assert first.result(timeout=5) and second.result(timeout=5)
+    writer.stop()
+
+
+def test_full_queue_rejects_without_fallback(test_user):
+    gate = threading.Event()
+    factory = get_session_factory()
+
+    def slow_factory():
+        gate.wait(5)
+        return factory()
+
+    writer = make_writer(
+        session_factory=slow_factory, queue_max=1, max_delay=0, fallback=False
+    )
+    writer.submit(row_for(test_user.id, 1))
+    while writer.stats()["queue_depth"]:
+        time.sleep(0.001)
+    writer.submit(row_for(test_user.id, 2))
+
+    with pytest.raises(HTTPException) as exc:
+        writer.submit(row_for(test_user.id, 3))
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == "1"
+
+    gate.set()
+    writer.stop()
+
+
+def test_failure_reaches_every_caller(test_user):
+    def broken_factory():
+        raise RuntimeError("database down")
+
+    writer = make_writer(session_factory=broken_factory)
+    futures = [writer.submit(row_for(test_user.id, i)) for i in range(3)]
+    for f in futures:
+        with pytest.raises(RuntimeError):
+            f.result(timeout=5)
+    writer.stop()
+    assert writer.stats()["failures"] >= 1
+
+
+def test_bad_row_fails_only_its_own_request(test_user, db_session):
+    writer = make_writer(max_delay=0.2)
+    rows = [row_for(test_user.id, i) for i in range(6)]
+    rows[4]["type"] = None  # NOT NULL violation
+    futures = [writer.submit(row) for row in rows]
+
+    with pytest.raises(Exception):
+        futures[4].result(timeout=5)
+    good = [f.result(timeout=5) for i, f in enumerate(futures) if i != 4]
+    writer.stop()
+
+    assert [r.a for r in good] == [0.0, 1.0, 2.0, 3.0, 5.0]
+    assert db_session.query(Calculation).count() == 5
+    assert writer.stats()["failures"] == 1
+
+
+def test_stop_flushes_queued_rows(test_user, db_session):
+    writer = make_writer(max_delay=10)
+    futures = [writer.submit(row_for(test_user.id, i)) for i in range(5)]
+    writer.stop()
+
+    assert all(f.done() for f in futures)
+    assert db_session.query(Calculation).count() == 5
+    writer.stop()  # idempotent
+
+
+def test_submit_after_stop_never_hangs(test_user):
+    writer = make_writer()
+    writer.stop()
+    assert writer.submit(row_for(test_user.id, 1)) is None  # commit directly
+
+    strict = make_writer(fallback=False)
+    strict.stop()
+    with pytest.raises(HTTPException) as exc:
+        strict.submit(row_for(test_user.id, 1))
+    assert exc.value.status_code == 503
+
+
+def test_stop_resolves_rows_left_in_queue(test_user):
+    writer = make_writer()
+    left = Future()
+    writer._queue.put((row_for(test_user.id, 1), left))  # no flusher running
+    writer.stop()
+
+    with pytest.raises(HTTPException) as exc:
+        left.result(timeout=1)
+    assert exc.value.status_code == 503
+
+
+# ----------------------------------------------------------
+# Routes
+# ----------------------------------------------------------
+def create_concurrently(client, headers, count: int = 8):
+    def create(i):
+        return client.post(
+            "/calculations", json={"type": "multiply", "a": i, "b": 2}, headers=headers
+        )
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(create, range(count)))
+
+
+def test_sync_route_uses_group_writer(monkeypatch, headers_for):
+    monkeypatch.setattr(settings, "WRITE_GROUP_COMMIT", True)
+    client = TestClient(app)
+    headers = headers_for(client, "groupsync", "5556660001")
+
+    responses = create_concurrently(client, headers)
+    assert all(r.status_code == 201 for r in responses)
+    assert sorted(r.json()["result"] for r in responses) == [i * 2 for i in range(8)]
+
+    stats = client.get("/health/group-commit").json()
+    assert stats["enabled"] is True
+    assert stats["rows"] == 8
+    assert stats["batches"] <= 8
+
+    listed = client.get("/calculations", headers=headers).json()
+    assert len(listed) == 8
+
+
+def test_async_route_uses_group_writer(monkeypatch, headers_for):
+    monkeypatch.setattr(settings, "WRITE_GROUP_COMMIT", True)
+    async_app = FastAPI()
+    async_app.include_router(auth_async_router)
+    async_app.include_router(calc_async_router)
+    async_app.add_event_handler("shutdown", dispose_async_engine)
+
+    with TestClient(async_app) as client:
+        headers = headers_for(client, "groupasync", "5556660002")
+        created = client.post(
+            "/calculations", json={"type": "subtract", "a": 9, "b": 4}, headers=headers
+        )
+        assert created.status_code == 201
+        assert created.json()["result"] == 5 and created.json()["id"]
+
+    assert group_commit.get_group_writer().stats()["rows"] == 1
+
+
+def test_route_falls_back_when_queue_full(monkeypatch, headers_for):
+    monkeypatch.setattr(settings, "WRITE_GROUP_COMMIT", True)
+    monkeypatch.setattr(GroupCommitWriter, "submit", lambda self, row: None)
+    client = TestClient(app)
+    headers = headers_for(client, "groupfull", "5556660003")
+
+    created = client.post(
+        "/calculations", json={"type": "divide", "a": 9, "b": 3}, headers=headers
+    )
+    assert created.status_code == 201
+    assert created.json()["result"] == 3
+
+
+def test_stats_endpoint_when_disabled():
+    stats = TestClient(app).get("/health/group-commit").json()
+    assert stats["enabled"] is False
+    assert stats["queue_depth"] == 0
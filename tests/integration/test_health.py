@@ -7,11 +7,23 @@
 # Verifies the /health endpoint responds correctly and that
 # the router is mounted and functional without requiring any
 # authentication or database connection. Ensures predictable
-# JSON output and correct HTTP status codes using TestClient.
+# JSON output and correct HTTP status codes using TestClient,
+# and that the diagnostics endpoints stay hidden unless
+# HEALTH_DETAILS is on.
 # ----------------------------------------------------------
 
+import pytest
 from fastapi.testclient import TestClient
 from main import app
+from app.core.config import settings
+
+DETAILS = (
+    "/health/pool",
+    "/health/hashing",
+    "/health/principal-cache",
+    "/health/group-commit",
+    "/health/sqlite",
+)
 
 
 def test_health_endpoint():
@@ -22,3 +34,26 @@ def test_health_endpoint():
 
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_health_hashing_endpoint():
+    """/health/hashing reports bcrypt pool queue and latency."""
+    client = TestClient(app)
+
+    response = client.get("/health/hashing")
+
+    assert response.status_code == 200
+    assert {"queue_depth", "rejected", "shared", "verify"} <= set(response.json())
+
+
+@pytest.mark.parametrize("path", DETAILS)
+def test_health_details_are_hidden_unless_enabled(path, monkeypatch):
+    """Diagnostics 404 with HEALTH_DETAILS off; /health stays public."""
+    client = TestClient(app)
+    monkeypatch.setattr(settings, "HEALTH_DETAILS", False)
+
+    assert client.get(path).status_code == 404
+    assert client.get("/health").status_code == 200
+
+    monkeypatch.setattr(settings, "HEALTH_DETAILS", True)
+    assert client.get(path).status_code == 200
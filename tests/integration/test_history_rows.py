@@ -0,0 +1,134 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Streamed History Rows Tests
+# File: tests/integration/test_history_rows.py
+# ----------------------------------------------------------
+# Description:
+# Tests GET /calculations/rows and app/services/
+# history_fragments.py: escaped <tr> markup matching the
+# dashboard table, one chunk per cursor partition, the full
+# history newest first, per-user isolation, ETag / 304 with
+# a validator distinct from the JSON list, and the async
+# router.
+# ----------------------------------------------------------
+
+import re
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.database.async_dbase import dispose_async_engine
+from app.routers import calc
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from app.services.history_fragments import encode_fragments, rows_fragment
+from main import app
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+ROW_IDS = re.compile(r'<tr data-id="(\d+)">')
+
+
+def seed(client, headers, count):
+    client.post(
+        "/calculations/batch",
+        headers=headers,
+        json={"types": ["multiply"] * count, "a": list(range(count)), "b": [2] * count},
+    )
+
+
+# ----------------------------------------------------------
+# Markup
+# ----------------------------------------------------------
+def test_fragment_markup():
+    rows = [
+        (7, "add", 1.0, 2.0, 3.0, 1, datetime(2024, 5, 6, 7, 8, 9)),
+        (8, "<b>", 0.5, 1e20, None, 1, None),
+    ]
+    html = rows_fragment(rows).decode()
+
+    assert html.startswith('<tr data-id="7"><td>add</td><td>1</td><td>2</td><td>3</td>')
+    assert '<time datetime="2024-05-06T07:08:09">2024-05-06</time>' in html
+    assert '<button class="delete-btn btn-small" data-id="7">Delete</button>' in html
+    assert "&lt;b&gt;" in html and "<b>" not in html
+    assert "<td>0.5</td><td>1e+20</td><td></td><td>N/A</td>" in html
+    assert html.count("</tr>\n") == 2
+    assert rows_fragment([]) == b""
+
+
+def test_one_chunk_per_partition():
+    row = (1, "add", 1.0, 1.0, 2.0, 1, None)
+    chunks = list(encode_fragments([[row, row], [row]]))
+    assert [c.count(b"<tr") for c in chunks] == [2, 1]
+
+
+# ----------------------------------------------------------
+# Sync router
+# ----------------------------------------------------------
+def test_streams_full_history_newest_first(monkeypatch, headers_for):
+    monkeypatch.setattr(calc, "FRAGMENT_CHUNK_ROWS", 100)
+    client = TestClient(app)
+    headers = headers_for(client, "rows_owner", "9990001111")
+    other = headers_for(client, "rows_other", "9990002222")
+    seed(client, headers, 250)
+    seed(client, other, 3)
+
+    res = client.get("/calculations/rows", headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "text/html; charset=utf-8"
+
+    ids = [int(i) for i in ROW_IDS.findall(res.text)]
+    assert len(ids) == 250  # not limited to one JSON page
+    assert ids == sorted(ids, reverse=True)
+
+    listed = client.get("/calculations", params={"limit": 500}, headers=headers).json()
+    assert ids == [r["id"] for r in listed]
+
+
+def test_rows_revalidate_with_their_own_etag(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "rows_etag", "9990003333")
+    seed(client, headers, 2)
+
+    first = client.get("/calculations/rows", headers=headers)
+    etag = first.headers["etag"]
+    assert etag.startswith('"r') or etag.startswith('W/"r')
+    assert etag != client.get("/calculations", headers=headers).headers["etag"]
+
+    again = client.get("/calculations/rows", headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+
+    seed(client, headers, 1)
+    fresh = client.get("/calculations/rows", headers={**headers, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert len(ROW_IDS.findall(fresh.text)) == 3
+
+
+def test_empty_history_and_auth(headers_for):
+    client = TestClient(app)
+    headers = headers_for(client, "rows_empty", "9990004444")
+
+    res = client.get("/calculations/rows", headers=headers)
+    assert res.status_code == 200 and res.text == ""
+    assert client.get("/calculations/rows").status_code == 401
+
+
+# ----------------------------------------------------------
+# Async router
+# ----------------------------------------------------------
+def test_async_router_streams_rows(headers_for):
+    with TestClient(async_app) as client:
+        headers = headers_for(client, "rows_async", "9990005555")
+        seed(client, headers, 5)
+
+        res = client.get("/calculations/rows", headers=headers)
+        ids = [int(i) for i in ROW_IDS.findall(res.text)]
+        assert len(ids) == 5 and ids == sorted(ids, reverse=True)
+
+        etag = res.headers["etag"]
+        again = client.get("/calculations/rows", headers={**headers, "If-None-Match": etag})
+        assert again.status_code == 304
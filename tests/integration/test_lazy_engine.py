@@ -0,0 +1,73 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Lazy Engine Initialization Tests
+# File: tests/integration/test_lazy_engine.py
+# ----------------------------------------------------------
+# Description:
+# Verifies that importing the application does not create a
+# database engine, that the shared engine / session factory
+# are created once on first use (also under concurrent first
+# use), and that dispose() releases them so the next use
+# starts fresh.
+# ----------------------------------------------------------
+
+import subprocess
+import sys
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.database import dbase
+
+
+def test_importing_app_creates_no_engine():
+    code = (
+        "import main\n"
+        "from app.database import dbase\n"
+        "assert dbase._engine is None and dbase._session_factory is None\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_shared_engine_created_once_under_concurrency():
+    dbase.dispose()
+    seen = []
+    barrier = threading.Barrier(8)
+
+    def first_use():
+        barrier.wait()
+        seen.append(dbase.get_shared_engine())
+
+    threads = [threading.Thread(target=first_use) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(e) for e in seen}) == 1
+    assert dbase.engine is seen[0]
+
+
+def test_lazy_attributes_and_dispose():
+    session = dbase.SessionLocal()
+    assert isinstance(session, Session)
+    assert session.get_bind() is dbase.engine
+    session.close()
+
+    before = dbase.get_shared_engine()
+    dbase.dispose()
+    assert dbase._engine is None
+
+    after = dbase.get_session_factory().kw["bind"]
+    assert after is not before
+    assert after is dbase.get_shared_engine()
+
+
+def test_unknown_attribute_raises():
+    try:
+        dbase.not_a_thing
+    except AttributeError as exc:
+        assert "not_a_thing" in str(exc)
+    else:
+        raise AssertionError("expected AttributeError")
@@ -0,0 +1,301 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Schema Migration Tests
+# File: tests/integration/test_migrations.py
+# ----------------------------------------------------------
+# Description:
+# Runs the migration runner against throwaway SQLite files:
+# fresh and legacy (old create_all) databases, the fast path
+# that skips create_all, concurrent workers, rollback on a
+# failing step, and startup wiring. The PostgreSQL lock and
+# CREATE INDEX CONCURRENTLY paths are checked against a fake
+# connection, and against a real server when
+# POSTGRES_TEST_URL is set.
+# ----------------------------------------------------------
+
+import os
+import threading
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+import main
+from app.core.config import settings
+from app.database import migrate as runner
+from app.database.dbase import Base
+from app.database.migrations import MIGRATIONS, v0003_calculation_indexes
+from app.database.migrations.ops import create_index
+
+LEGACY_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY, first_name VARCHAR(50) NOT NULL,
+    last_name VARCHAR(50) NOT NULL, username VARCHAR(50) NOT NULL UNIQUE,
+    email VARCHAR(100) NOT NULL UNIQUE, mobile VARCHAR(15),
+    is_active BOOLEAN NOT NULL, password_hash VARCHAR(255) NOT NULL,
+    created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL
+);
+CREATE TABLE calculations (
+    id INTEGER PRIMARY KEY, type VARCHAR NOT NULL, a FLOAT NOT NULL,
+    b FLOAT NOT NULL, result FLOAT, created_at DATETIME NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users(id)
+);
+INSERT INTO users VALUES (1, 'Old', 'User', 'old', 'old@ex.com', NULL, 1, 'x',
+                          '2024-01-01', '2024-01-01');
+INSERT INTO calculations VALUES (1, 'add', 1, 2, 3, '2024-01-02 10:00:00', 1);
+INSERT INTO calculations VALUES (2, 'add', 2, 2, 4, '2024-01-03 10:00:00', 1);
+"""
+
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/migrate.db", connect_args={"check_same_thread": False}
+    )
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine, table):
+    return {ix["name"] for ix in inspect(engine).get_indexes(table)}
+
+
+# ----------------------------------------------------------
+# SQLite runs
+# ----------------------------------------------------------
+def test_fresh_database_is_built_and_recorded(fresh_engine):
+    assert runner.migrate(fresh_engine) == [1, 2, 3, 4, 5, 6, 7]
+
+    assert {"users", "calculations", "schema_version"} <= set(
+        inspect(fresh_engine).get_table_names()
+    )
+    assert "ix_calculations_user_created_id" in index_names(fresh_engine, "calculations")
+    assert runner.schema_status(fresh_engine) == {"current": 7, "latest": 7, "pending": []}
+
+
+def test_current_schema_skips_create_all(fresh_engine, monkeypatch):
+    runner.migrate(fresh_engine)
+
+    def boom(*args, **kwargs):
+        raise AssertionError("create_all must not run")
+
+    monkeypatch.setattr(Base.metadata, "create_all", boom)
+    monkeypatch.setattr(runner, "migration_lock", boom)
+    assert runner.migrate(fresh_engine) == []
+
+
+def test_legacy_database_is_upgraded(fresh_engine):
+    raw = fresh_engine.raw_connection()
+    raw.executescript(LEGACY_SCHEMA)
+    raw.close()
+
+    assert runner.migrate(fresh_engine) == [1, 2, 3, 4, 5, 6, 7]
+
+    with fresh_engine.connect() as conn:
+        assert conn.execute(text("SELECT token_version FROM users")).scalar() == 0
+        stats = conn.execute(
+            text("SELECT calc_count, result_sum, result_min, result_max, version "
+                 "FROM calculation_stats")
+        ).all()
+        stamps = conn.execute(text("SELECT created_at FROM calculations ORDER BY id")).scalars()
+        assert list(stamps) == ["2024-01-02 10:00:00.000000", "2024-01-03 10:00:00.000000"]
+    assert [tuple(r) for r in stats] == [(2, 7.0, 3.0, 4.0, 0)]
+    assert "ix_calculations_user_created_id" in index_names(fresh_engine, "calculations")
+
+
+def test_stats_version_is_added_to_an_existing_rollup(fresh_engine):
+    runner.migrate(fresh_engine)
+    # Roll the schema back to what migration 5 left behind
+    with fresh_engine.begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE calculation_stats DROP COLUMN version")
+        conn.exec_driver_sql("DELETE FROM schema_version WHERE version >= 6")
+
+    assert runner.migrate(fresh_engine) == [6, 7]
+    columns = inspect(fresh_engine).get_columns("calculation_stats")
+    assert "version" in {c["name"] for c in columns}
+
+
+def test_concurrent_workers_migrate_once(fresh_engine):
+    results = []
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        results.append(runner.migrate(fresh_engine, timeout=30))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(v for applied in results for v in applied) == [1, 2, 3, 4, 5, 6, 7]
+    with fresh_engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM schema_version")).scalar() == 7
+
+
+def test_failed_step_rolls_back_everything(fresh_engine, monkeypatch):
+    def fail(conn):
+        raise RuntimeError("index build failed")
+
+    monkeypatch.setattr(v0003_calculation_indexes, "upgrade", fail)
+
+    with pytest.raises(RuntimeError):
+        runner.migrate(fresh_engine)
+
+    with fresh_engine.connect() as conn:
+        assert runner.current_version(conn) == 0
+    assert "users" not in inspect(fresh_engine).get_table_names()
+
+
+def test_versions_must_be_consecutive(monkeypatch):
+    monkeypatch.setattr(runner, "MIGRATIONS", [MIGRATIONS[1], MIGRATIONS[0]])
+    with pytest.raises(runner.MigrationError):
+        runner.migrate()
+
+
+def test_cli_status_and_upgrade(capsys):
+    assert runner.main(["--status"]) == 0
+    assert "latest" in capsys.readouterr().out
+
+    assert runner.main([]) == 0
+    runner.main([])
+    assert "up to date" in capsys.readouterr().out
+
+
+# ----------------------------------------------------------
+# PostgreSQL paths (fake connection)
+# ----------------------------------------------------------
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+    def first(self):
+        return (1,) if self.value else None
+
+
+class FakePgConnection:
+    class dialect:
+        name = "postgresql"
+
+    def __init__(self, lock_free=True, invalid_index=False):
+        self.sql = []
+        self.lock_free = lock_free
+        self.invalid_index = invalid_index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execution_options(self, **kw):
+        self.sql.append(f"options {kw}")
+        return self
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.sql.append(sql)
+        if "pg_try_advisory_lock" in sql:
+            return FakeResult(self.lock_free)
+        return FakeResult(self.invalid_index)
+
+    def exec_driver_sql(self, sql):
+        self.sql.append(sql)
+
+
+class FakePgEngine:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def connect(self):
+        return self.conn
+
+    def begin(self):
+        self.conn.sql.append("BEGIN")
+        return self.conn
+
+
+def test_postgres_index_is_built_concurrently():
+    conn = FakePgConnection(invalid_index=True)
+    create_index(conn, "ix_demo", "demo", "a, b DESC")
+
+    assert "DROP INDEX CONCURRENTLY IF EXISTS ix_demo" in conn.sql
+    assert conn.sql[-1] == "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_demo ON demo (a, b DESC)"
+
+
+def test_postgres_advisory_lock_is_released():
+    conn = FakePgConnection()
+    with runner.migration_lock(FakePgEngine(conn), timeout=1) as locked:
+        assert locked is conn
+
+    assert any("pg_try_advisory_lock" in s for s in conn.sql)
+    assert "pg_advisory_unlock" in conn.sql[-1]
+
+
+def test_postgres_lock_timeout():
+    engine = FakePgEngine(FakePgConnection(lock_free=False))
+    with pytest.raises(runner.MigrationError):
+        with runner.migration_lock(engine, timeout=0):
+            pass
+
+
+def test_postgres_steps_use_transaction_or_autocommit(monkeypatch):
+    conn = FakePgConnection()
+    engine = FakePgEngine(conn)
+    monkeypatch.setattr(runner, "_record", lambda c, m: c.sql.append(f"record {m.VERSION}"))
+
+    class AddColumn:
+        VERSION = 2
+        TRANSACTIONAL = True
+
+        @staticmethod
+        def upgrade(c):
+            c.exec_driver_sql("ALTER TABLE demo ADD COLUMN x INTEGER")
+
+    runner._apply(engine, conn, AddColumn)
+    assert conn.sql == ["BEGIN", "ALTER TABLE demo ADD COLUMN x INTEGER", "record 2"]
+
+    conn.sql.clear()
+    runner._apply(engine, conn, v0003_calculation_indexes)  # CONCURRENTLY
+    assert "AUTOCOMMIT" in conn.sql[0]
+    assert any("CONCURRENTLY" in s for s in conn.sql)
+    assert conn.sql[-1] == "record 3"
+
+
+@pytest.mark.skipif(
+    not os.getenv("POSTGRES_TEST_URL"), reason="POSTGRES_TEST_URL not set"
+)
+def test_postgres_migrate_end_to_end():  # pragma: no cover - needs a server
+    engine = create_engine(os.environ["POSTGRES_TEST_URL"])
+    try:
+        runner.migrate(engine)
+        assert runner.migrate(engine) == []
+        assert runner.schema_status(engine)["pending"] == []
+    finally:
+        engine.dispose()
+
+
+# ----------------------------------------------------------
+# Startup wiring
+# ----------------------------------------------------------
+def test_startup_runs_migrations(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "migrate", lambda: calls.append(1) or [1])
+    main.on_startup()
+    assert calls == [1]
+
+    monkeypatch.setattr(settings, "DB_MIGRATE_ON_STARTUP", False)
+    main.on_startup()
+    assert calls == [1]
+
+
+def test_startup_logs_migration_errors(monkeypatch, caplog):
+    def fail():
+        raise runner.MigrationError("locked")
+
+    monkeypatch.setattr(main, "migrate", fail)
+    main.on_startup()
+    assert "Database migration error" in caplog.text
@@ -0,0 +1,121 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Connection Pool Tests
+# File: tests/integration/test_pool.py
+# ----------------------------------------------------------
+# Description:
+# Verifies pool selection per URL (StaticPool for in-memory
+# SQLite, sized queue pools otherwise, pre-ping/recycle only
+# for server databases) and that the pool counters record
+# checkouts, overflow, wait timeouts and invalidations, and
+# survive engine.dispose().
+# ----------------------------------------------------------
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.database import pool as pool_module
+from app.database.pool import (
+    MeteredAsyncQueuePool,
+    MeteredQueuePool,
+    attach_pool_metrics,
+    pool_options,
+)
+from main import app
+
+
+@pytest.fixture
+def metered_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/pool.db",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    metrics = attach_pool_metrics(engine, "test")
+    yield engine, metrics
+    engine.dispose()
+    pool_module.POOL_METRICS.pop("test", None)
+
+
+# ----------------------------------------------------------
+# pool_options()
+# ----------------------------------------------------------
+def test_pool_options_memory_sqlite():
+    assert pool_options("sqlite://") == {"poolclass": StaticPool}
+    assert pool_options("sqlite:///:memory:") == {"poolclass": StaticPool}
+
+
+def test_pool_options_file_sqlite():
+    options = pool_options("sqlite:///./x.db")
+    assert options["poolclass"] is MeteredQueuePool
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert "pool_pre_ping" not in options
+
+
+def test_pool_options_postgres(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    options = pool_options("postgresql+asyncpg://u:p@h/db", is_async=True)
+    assert options["poolclass"] is MeteredAsyncQueuePool
+    assert options["pool_size"] == 3
+    assert options["pool_pre_ping"] is settings.DB_POOL_PRE_PING
+    assert options["pool_recycle"] == settings.DB_POOL_RECYCLE
+
+
+# ----------------------------------------------------------
+# Counters
+# ----------------------------------------------------------
+def test_metrics_checkout_overflow_and_timeout(metered_engine):
+    engine, metrics = metered_engine
+
+    first = engine.connect()
+    second = engine.connect()  # uses the one overflow slot
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    snap = metrics.snapshot()
+    assert snap["checkouts"] == 2
+    assert snap["connects"] == 2
+    assert snap["peak_overflow"] == 1
+    assert snap["checked_out"] == 2
+    assert snap["timeouts"] == 1
+    assert snap["wait_ms_max"] >= 50
+
+    first.close()
+    second.close()
+    snap = metrics.snapshot()
+    assert snap["checkins"] == 2
+    assert snap["checked_out"] == 0
+
+
+def test_metrics_invalidation_and_dispose(metered_engine):
+    engine, metrics = metered_engine
+
+    with engine.connect() as conn:
+        conn.invalidate()
+    assert metrics.snapshot()["invalidations"] == 1
+
+    engine.dispose()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert engine.pool.metrics is metrics
+    assert metrics.snapshot()["checkouts"] == 2
+
+    metrics.reset()
+    assert metrics.snapshot()["checkouts"] == 0
+
+
+def test_health_pool_endpoint():
+    client = TestClient(app)
+    client.get("/health")
+
+    res = client.get("/health/pool")
+    assert res.status_code == 200
+    assert "sync" in res.json()
+    assert {"checkouts", "timeouts", "wait_ms_avg"} <= set(res.json()["sync"])
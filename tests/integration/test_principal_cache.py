@@ -0,0 +1,136 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Principal Cache Tests
+# File: tests/integration/test_principal_cache.py
+# ----------------------------------------------------------
+# Description:
+# Verifies the token → user cache behind get_current_user:
+# repeat requests skip decode and lookup, entries expire with
+# the token, the LRU cap evicts oldest entries, ORM updates
+# and deletes invalidate a user's entries, and the counters
+# are exposed at /health/principal-cache.
+# ----------------------------------------------------------
+
+import time
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from app.auth import dependencies
+from app.auth.principal_cache import PrincipalCache, principal_cache
+from app.models.user_model import User
+from main import app
+
+client = TestClient(app)
+
+
+def make_user(user_id: int) -> User:
+    return User(
+        id=user_id,
+        first_name="F",
+        last_name="L",
+        username=f"u{user_id}",
+        email=f"u{user_id}@ex.com",
+        password_hash="x",
+        is_active=True,
+    )
+
+
+# ----------------------------------------------------------
+# Repeat requests skip decode + lookup
+# ----------------------------------------------------------
+def test_repeat_request_served_from_cache(monkeypatch, headers_for):
+    headers = headers_for(client, "cache_user", "5556667777")
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    hits_before = principal_cache.stats()["hits"]
+
+    def fail(*_):
+        raise AssertionError("token decoded on a cache hit")
+
+    monkeypatch.setattr(dependencies, "verify_access_token", fail)
+    res = client.get("/auth/me", headers=headers)
+    assert res.status_code == 200
+    assert res.json()["username"] == "cache_user"
+
+    stats = client.get("/health/principal-cache").json()
+    assert stats["hits"] == hits_before + 1
+    assert stats["size"] == 1
+
+
+def test_calculation_routes_use_cached_principal(headers_for):
+    headers = headers_for(client, "cache_user", "5556667777")
+    for i in range(3):
+        res = client.post("/calculations", json={"type": "add", "a": i, "b": 1}, headers=headers)
+        assert res.status_code == 201
+    assert len(client.get("/calculations", headers=headers).json()) == 3
+    assert principal_cache.stats()["hits"] >= 3
+
+
+# ----------------------------------------------------------
+# Expiry, LRU, disabled cache
+# ----------------------------------------------------------
+def test_entry_expires_with_token():
+    cache = PrincipalCache(max_entries=10, ttl=300)
+    cache.put("tok", make_user(1), exp=time.time() - 1)
+    assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_evicts_least_recently_used():
+    cache = PrincipalCache(max_entries=2, ttl=300)
+    cache.put("a", make_user(1), exp=None)
+    cache.put("b", make_user(2), exp=None)
+    assert cache.get("a").id == 1  # "b" is now least recently used
+    cache.put("c", make_user(3), exp=None)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_hits_return_independent_transient_users():
+    cache = PrincipalCache(max_entries=10, ttl=300)
+    cache.put("tok", make_user(7), exp=None)
+    cache.put("tok", make_user(7), exp=None)  # re-put replaces
+
+    first, second = cache.get("tok"), cache.get("tok")
+    assert first is not second
+    assert first.username == second.username == "u7"
+    assert cache.stats()["size"] == 1
+
+
+def test_disabled_cache_and_non_orm_users():
+    cache = PrincipalCache(max_entries=10, ttl=300, enabled=False)
+    cache.put("tok", make_user(1), exp=None)
+    assert cache.get("tok") is None
+
+    cache = PrincipalCache(max_entries=10, ttl=300)
+    cache.put("tok", MagicMock(id=1), exp=None)
+    assert cache.stats()["size"] == 0
+
+
+# ----------------------------------------------------------
+# ORM changes invalidate
+# ----------------------------------------------------------
+def test_user_update_and_delete_invalidate(db_session, test_user):
+    invalidations_before = principal_cache.stats()["invalidations"]
+    principal_cache.put("t1", test_user, exp=None)
+    principal_cache.put("t2", test_user, exp=None)
+
+    test_user.first_name = "Changed"
+    db_session.commit()
+    assert principal_cache.get("t1") is None
+    assert principal_cache.get("t2") is None
+    assert principal_cache.stats()["invalidations"] == invalidations_before + 2
+
+    principal_cache.put("t1", test_user, exp=None)
+    db_session.delete(test_user)
+    db_session.commit()
+    assert principal_cache.get("t1") is None
+
+
+def test_rolled_back_update_forgets_pending(db_session, test_user):
+    test_user.first_name = "Changed"
+    db_session.flush()
+    db_session.rollback()
+    assert "changed_user_ids" not in db_session.info
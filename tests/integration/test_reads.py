@@ -0,0 +1,134 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Read-Only Query Repository Tests
+# File: tests/integration/test_reads.py
+# ----------------------------------------------------------
+# Description:
+# Tests app/database/reads.py: calculation and user lookups
+# return __slots__ rows (no ORM instances in the session),
+# respect ownership, leave the password hash out, have async
+# counterparts, and back GET /calculations/{id}, /auth/me and
+# principal-cache hits.
+# ----------------------------------------------------------
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.principal_cache import PrincipalCache
+from app.database.async_dbase import dispose_async_engine, get_async_session_factory
+from app.database.reads import (
+    CalculationRow,
+    UserRow,
+    afetch_calculation,
+    afetch_user,
+    fetch_calculation,
+    fetch_user,
+)
+from app.models.cal_models import Calculation
+from main import app
+
+
+@pytest.fixture
+def calc(db_session, test_user):
+    row = Calculation(type="multiply", a=3, b=4, result=12, user_id=test_user.id)
+    db_session.add(row)
+    db_session.commit()
+    return row
+
+
+# ----------------------------------------------------------
+# Sync lookups
+# ----------------------------------------------------------
+def test_fetch_calculation_returns_slots_row(db_session, calc, test_user):
+    calc_id, user_id = calc.id, test_user.id
+    db_session.expunge_all()
+
+    row = fetch_calculation(db_session, calc_id, user_id)
+
+    assert isinstance(row, CalculationRow)
+    assert (row.type, row.a, row.b, row.result) == ("multiply", 3, 4, 12)
+    assert not hasattr(row, "__dict__")
+    assert len(db_session.identity_map) == 0
+    assert "CalculationRow(id=" in repr(row)
+
+    assert fetch_calculation(db_session, calc_id, user_id + 1) is None
+
+
+def test_fetch_user_omits_password_hash(db_session, test_user):
+    user_id, username = test_user.id, test_user.username
+    db_session.expunge_all()
+
+    user = fetch_user(db_session, user_id)
+
+    assert isinstance(user, UserRow)
+    assert user.username == username and user.token_version == 0
+    assert not hasattr(user, "password_hash")
+    assert len(db_session.identity_map) == 0
+    assert "UserRow(id=" in repr(user)
+    assert fetch_user(db_session, 999_999) is None
+
+
+# ----------------------------------------------------------
+# Async lookups
+# ----------------------------------------------------------
+def test_async_fetches_match_sync(db_session, calc, test_user):
+    async def run():
+        try:
+            async with get_async_session_factory()() as session:
+                return (
+                    await afetch_calculation(session, calc.id, test_user.id),
+                    await afetch_calculation(session, calc.id, test_user.id + 1),
+                    await afetch_user(session, test_user.id),
+                    await afetch_user(session, 999_999),
+                )
+        finally:
+            await dispose_async_engine()
+
+    row, missing_row, user, missing_user = asyncio.run(run())
+    assert row.id == calc.id and row.result == 12
+    assert user.email == test_user.email
+    assert missing_row is None and missing_user is None
+
+
+# ----------------------------------------------------------
+# Routes and principal cache
+# ----------------------------------------------------------
+def test_routes_serialize_rows():
+    client = TestClient(app)
+    client.post(
+        "/auth/register",
+        json={
+            "first_name": "Read",
+            "last_name": "Path",
+            "username": "read_path",
+            "email": "read@ex.com",
+            "mobile": "6660001111",
+            "password": "Pass123A",
+            "confirm_password": "Pass123A",
+        },
+    )
+    token = client.post(
+        "/auth/login", json={"identifier": "read_path", "password": "Pass123A"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    me = client.get("/auth/me", headers=headers).json()
+    assert me["username"] == "read_path" and "password_hash" not in me
+
+    created = client.post(
+        "/calculations", json={"type": "add", "a": 1, "b": 2}, headers=headers
+    ).json()
+    fetched = client.get(f"/calculations/{created['id']}", headers=headers).json()
+    assert fetched == created
+
+
+def test_principal_cache_hits_are_user_rows(test_user):
+    cache = PrincipalCache(max_entries=10, ttl=300)
+    cache.put("orm", test_user, exp=None)
+    cache.put("row", cache.get("orm"), exp=None)
+
+    hit = cache.get("row")
+    assert isinstance(hit, UserRow)
+    assert hit.username == test_user.username
@@ -0,0 +1,294 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: SQLite Performance Profile Tests
+# File: tests/integration/test_sqlite_tuning.py
+# ----------------------------------------------------------
+# Description:
+# Verifies the SQLite pragma profile on pooled connections,
+# the single-connection BEGIN IMMEDIATE writer engine (writes
+# queue, reads stay concurrent), its async counterpart, the
+# WAL checkpointer and the /health/sqlite report.
+# ----------------------------------------------------------
+
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from app.core.config import settings
+from app.database import async_dbase, dbase
+from app.database.sqlite_tuning import (
+    WalCheckpointer,
+    is_sqlite_file,
+    sqlite_pragmas,
+    sqlite_tuned,
+)
+from main import app
+
+
+def pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+# ----------------------------------------------------------
+# Pragma profile
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./test.db", True),
+        ("sqlite+aiosqlite:///./test.db", True),
+        ("sqlite://", False),
+        ("sqlite:///:memory:", False),
+        ("postgresql://u:p@db/app", False),
+    ],
+)
+def test_is_sqlite_file(url, expected):
+    assert is_sqlite_file(url) is expected
+
+
+def test_tuning_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_TUNING", False)
+    assert sqlite_tuned("sqlite:///./test.db") is False
+
+
+def test_pragmas_applied_to_shared_and_writer_engines():
+    for engine in (dbase.get_shared_engine(), dbase.get_writer_engine()):
+        assert pragma(engine, "journal_mode") == "wal"
+        assert pragma(engine, "synchronous") == 1  # NORMAL
+        assert pragma(engine, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert pragma(engine, "cache_size") == settings.SQLITE_CACHE_SIZE
+        assert pragma(engine, "temp_store") == 2  # MEMORY
+
+    assert [name for name, _ in sqlite_pragmas()][0] == "busy_timeout"
+
+
+# ----------------------------------------------------------
+# Writer lane
+# ----------------------------------------------------------
+def test_writer_engine_is_single_connection_begin_immediate():
+    writer = dbase.get_writer_engine()
+    assert writer is not dbase.get_shared_engine()
+    assert writer.pool.size() == 1
+    assert writer.pool._max_overflow == 0
+    assert dbase.get_write_session_factory().kw["bind"] is writer
+
+    seen = []
+
+    def record(conn, cursor, statement, *args):
+        seen.append(statement)
+
+    event.listen(writer, "before_cursor_execute", record)
+    try:
+        with dbase.get_write_session_factory()() as session:
+            session.execute(text("SELECT 1"))
+    finally:
+        event.remove(writer, "before_cursor_execute", record)
+
+    assert seen[0] == "BEGIN IMMEDIATE"
+
+
+def test_reads_continue_while_write_is_open(test_user):
+    writer_session = dbase.get_write_session_factory()()
+    reader_session = dbase.get_session_factory()()
+    try:
+        writer_session.execute(
+            text("UPDATE users SET first_name = 'Changed' WHERE id = :id"),
+            {"id": test_user.id},
+        )
+        # WAL: the reader sees the last committed state, unblocked
+        name = reader_session.execute(
+            text("SELECT first_name FROM users WHERE id = :id"), {"id": test_user.id}
+        ).scalar()
+        assert name == test_user.first_name
+    finally:
+        writer_session.rollback()
+        writer_session.close()
+        reader_session.close()
+
+
+def test_concurrent_writers_queue_instead_of_locking(test_user):
+    errors = []
+
+    def write(n):
+        try:
+            for i in range(10):
+                with dbase.get_write_session_factory()() as session:
+                    session.execute(
+                        text(
+                            "INSERT INTO calculations (type, a, b, result, user_id, created_at) "
+                            "VALUES ('add', :a, 1, :r, :u, CURRENT_TIMESTAMP)"
+                        ),
+                        {"a": n * 10 + i, "r": n * 10 + i + 1, "u": test_user.id},
+                    )
+                    session.commit()
+        except Exception as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    with dbase.get_session_factory()() as session:
+        assert session.execute(text("SELECT COUNT(*) FROM calculations")).scalar() == 60
+
+
+def test_single_writer_off_uses_shared_engine(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_SINGLE_WRITER", False)
+    assert dbase.get_writer_engine() is dbase.get_shared_engine()
+    assert dbase.get_write_session_factory() is dbase.get_session_factory()
+
+
+def test_get_write_db_closes_session():
+    gen = dbase.get_write_db()
+    session = next(gen)
+    assert session.get_bind() is dbase.get_writer_engine()
+    with pytest.raises(StopIteration):
+        next(gen)
+
+
+def test_async_writer_engine_begins_immediate():
+    async def scenario():
+        writer = async_dbase.get_async_writer_engine()
+        assert writer is not async_dbase.get_async_engine()
+        assert async_dbase.get_async_write_session_factory().kw["bind"] is writer
+
+        seen = []
+
+        def record(conn, cursor, statement, *args):
+            seen.append(statement)
+
+        event.listen(writer.sync_engine, "before_cursor_execute", record)
+        try:
+            async for session in async_dbase.get_async_write_db():
+                await session.execute(text("SELECT 1"))
+        finally:
+            event.remove(writer.sync_engine, "before_cursor_execute", record)
+            await async_dbase.dispose_async_engine()
+        return seen
+
+    assert asyncio.run(scenario())[0] == "BEGIN IMMEDIATE"
+
+
+def test_async_read_then_write_is_serialized(test_user):
+    # Read-modify-write: the SELECT must already hold the write
+    # lock, or concurrent transactions lose each other's updates
+    async def bump():
+        async with async_dbase.get_async_write_session_factory()() as session:
+            for _ in range(5):
+                version = (await session.execute(
+                    text("SELECT token_version FROM users WHERE id = :id"), {"id": test_user.id}
+                )).scalar()
+                await asyncio.sleep(0.001)
+                await session.execute(
+                    text("UPDATE users SET token_version = :v WHERE id = :id"),
+                    {"v": version + 1, "id": test_user.id},
+                )
+                await session.commit()
+
+    async def scenario():
+        try:
+            await asyncio.gather(*(bump() for _ in range(6)))
+        finally:
+            await async_dbase.dispose_async_engine()
+
+    before = test_user.token_version or 0
+    asyncio.run(scenario())
+    with dbase.get_session_factory()() as session:
+        after = session.execute(
+            text("SELECT token_version FROM users WHERE id = :id"), {"id": test_user.id}
+        ).scalar()
+    assert after == before + 30
+
+
+def test_async_single_writer_off_uses_shared_engine(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_SINGLE_WRITER", False)
+
+    async def scenario():
+        try:
+            assert async_dbase.get_async_writer_engine() is async_dbase.get_async_engine()
+            assert (
+                async_dbase.get_async_write_session_factory()
+                is async_dbase.get_async_session_factory()
+            )
+        finally:
+            await async_dbase.dispose_async_engine()
+
+    asyncio.run(scenario())
+
+
+# ----------------------------------------------------------
+# WAL checkpoints
+# ----------------------------------------------------------
+def test_checkpoint_reports_frames(test_user):
+    checkpointer = WalCheckpointer(dbase.get_shared_engine(), interval=0)
+    result = checkpointer.checkpoint()
+
+    assert result["busy"] is False
+    assert result["wal_frames"] >= result["checkpointed_frames"] >= 0
+    assert checkpointer.stats()["runs"] == 1
+    assert checkpointer.stats()["last"] == result
+
+
+def test_checkpointer_thread_runs_and_stops():
+    checkpointer = WalCheckpointer(dbase.get_shared_engine(), interval=0.01, mode="truncate")
+    checkpointer.start()
+    try:
+        for _ in range(500):
+            if checkpointer.stats()["runs"]:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        checkpointer.stop()
+
+    assert checkpointer.stats()["runs"] >= 1
+    assert checkpointer.mode == "TRUNCATE"
+
+
+def test_checkpointer_counts_errors():
+    class BrokenEngine:
+        def raw_connection(self):
+            raise RuntimeError("gone")
+
+    checkpointer = WalCheckpointer(BrokenEngine(), interval=0.01)
+    checkpointer.start()
+    try:
+        for _ in range(500):
+            if checkpointer.stats()["errors"]:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        checkpointer.stop()
+
+    assert checkpointer.stats()["errors"] >= 1
+
+
+def test_invalid_checkpoint_mode():
+    with pytest.raises(ValueError):
+        WalCheckpointer(None, interval=1, mode="sometimes")
+
+
+def test_dispose_restarts_checkpointer():
+    dbase.dispose()
+    engine = dbase.get_shared_engine()
+
+    status = TestClient(app).get("/health/sqlite").json()
+    assert status["tuned"] is True
+    assert status["pragmas"]["journal_mode"] == "wal"
+    assert status["checkpoint"]["interval"] == settings.SQLITE_CHECKPOINT_INTERVAL
+    assert dbase.get_shared_engine() is engine
+
+
+def test_health_sqlite_on_other_backends(monkeypatch):
+    class FakeEngine:
+        class dialect:
+            name = "postgresql"
+
+    monkeypatch.setattr("app.routers.health.get_shared_engine", lambda: FakeEngine)
+    assert TestClient(app).get("/health/sqlite").json() == {"tuned": False}
@@ -0,0 +1,178 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Stateless Auth Mode Tests
+# File: tests/integration/test_stateless_auth.py
+# ----------------------------------------------------------
+# Description:
+# Verifies the claims-only principal used by calculation
+# routes when STATELESS_AUTH is enabled: tokens carry the
+# required claims, requests skip the user lookup, revocation
+# through token_version works (explicit revoke and user
+# deactivation) in both sync and async stacks, and tokens
+# without claims fall back to the database path.
+# ----------------------------------------------------------
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth import dependencies
+from app.auth.principal import Principal, TokenVersionCache, token_versions
+from app.auth.security import create_access_token, decode_access_token
+from app.core.config import settings
+from app.database.async_dbase import dispose_async_engine
+from app.models.user_model import User
+from app.routers.auth_async import router as auth_async_router
+from app.routers.calc_async import router as calc_async_router
+from main import app
+
+client = TestClient(app)
+
+async_app = FastAPI()
+async_app.include_router(auth_async_router)
+async_app.include_router(calc_async_router)
+async_app.add_event_handler("shutdown", dispose_async_engine)
+
+
+@pytest.fixture
+def stateless(monkeypatch):
+    monkeypatch.setattr(settings, "STATELESS_AUTH", True)
+
+
+def login(c) -> str:
+    c.post(
+        "/auth/register",
+        json={
+            "first_name": "State",
+            "last_name": "Less",
+            "username": "stateless",
+            "email": "stateless@ex.com",
+            "mobile": "1212121212",
+            "password": "Pass123A",
+            "confirm_password": "Pass123A",
+        },
+    )
+    return c.post(
+        "/auth/login",
+        json={"identifier": "stateless", "password": "Pass123A"},
+    ).json()["access_token"]
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+# ----------------------------------------------------------
+# Claims
+# ----------------------------------------------------------
+def test_login_token_carries_claims():
+    payload = decode_access_token(login(client))
+    assert payload["username"] == "stateless"
+    assert payload["active"] is True
+    assert payload["ver"] == 0
+    assert int(payload["sub"]) > 0
+
+
+# ----------------------------------------------------------
+# Stateless requests skip the user lookup
+# ----------------------------------------------------------
+def test_calc_routes_use_claims_only(stateless, monkeypatch):
+    headers = bearer(login(client))
+
+    def fail(*_, **__):
+        raise AssertionError("user looked up in stateless mode")
+
+    monkeypatch.setattr(dependencies, "get_current_user", fail)
+
+    res = client.post("/calculations", json={"type": "add", "a": 1, "b": 2}, headers=headers)
+    assert res.status_code == 201
+    assert len(client.get("/calculations", headers=headers).json()) == 1
+    assert token_versions.lookup(res.json()["user_id"]) == 0
+
+
+def test_token_without_claims_falls_back(stateless):
+    login(client)
+    legacy = create_access_token({"sub": "1"})
+    assert client.get("/calculations", headers=bearer(legacy)).status_code == 200
+
+
+# ----------------------------------------------------------
+# Revocation
+# ----------------------------------------------------------
+def test_revoke_rejects_older_tokens(stateless):
+    old = login(client)
+    assert client.post("/auth/revoke", headers=bearer(old)).status_code == 200
+
+    res = client.get("/calculations", headers=bearer(old))
+    assert res.status_code == 401
+    assert res.json()["detail"] == "Token has been revoked"
+
+    # Database mode rejects it as well
+    settings.STATELESS_AUTH = False
+    assert client.get("/auth/me", headers=bearer(old)).status_code == 401
+    settings.STATELESS_AUTH = True
+
+    new = client.post(
+        "/auth/login", json={"identifier": "stateless", "password": "Pass123A"}
+    ).json()["access_token"]
+    assert client.get("/calculations", headers=bearer(new)).status_code == 200
+
+
+def test_deactivation_revokes(stateless, db_session):
+    token = login(client)
+    assert client.get("/calculations", headers=bearer(token)).status_code == 200
+
+    user = db_session.query(User).filter_by(username="stateless").one()
+    user.is_active = False
+    db_session.commit()
+    assert user.token_version == 1
+
+    assert client.get("/calculations", headers=bearer(token)).status_code == 401
+
+
+def test_inactive_claim_and_missing_user(stateless):
+    login(client)
+    inactive = create_access_token({"sub": "1", "username": "x", "active": False, "ver": 0})
+    res = client.get("/calculations", headers=bearer(inactive))
+    assert res.json()["detail"] == "Inactive user"
+
+    ghost = create_access_token({"sub": "999", "username": "x", "active": True, "ver": 0})
+    res = client.get("/calculations", headers=bearer(ghost))
+    assert res.json()["detail"] == "User not found"
+
+
+# ----------------------------------------------------------
+# Async stack
+# ----------------------------------------------------------
+def test_async_stateless_flow(stateless):
+    with TestClient(async_app) as c:
+        token = login(c)
+        res = c.post("/calculations", json={"type": "add", "a": 1, "b": 2}, headers=bearer(token))
+        assert res.status_code == 201
+
+        assert c.post("/auth/revoke", headers=bearer(token)).status_code == 200
+        assert c.get("/calculations", headers=bearer(token)).status_code == 401
+
+        settings.STATELESS_AUTH = False
+        assert c.get("/auth/me", headers=bearer(token)).status_code == 401
+        settings.STATELESS_AUTH = True
+
+        legacy = create_access_token({"sub": "1"})
+        assert c.get("/calculations", headers=bearer(legacy)).status_code == 200
+
+
+# ----------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------
+def test_version_cache_expiry_and_principal_repr():
+    cache = TokenVersionCache(ttl=0)
+    cache.store(1, 3)
+    assert cache.lookup(1) is None
+
+    cache = TokenVersionCache(ttl=60)
+    cache.store(1, 3)
+    assert cache.lookup(1) == 3
+    cache.forget(1)
+    assert cache.lookup(1) is None
+
+    assert repr(Principal(1, "bob", True, 0)) == "Principal(id=1, username='bob')"
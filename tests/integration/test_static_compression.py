@@ -0,0 +1,188 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Precompressed Static Files Tests
+# File: tests/integration/test_static_compression.py
+# ----------------------------------------------------------
+# Description:
+# precompress_static() writes fresh .gz / .br siblings,
+# skips up-to-date ones and publishes whole files even with
+# several workers at once; PrecompressedStaticFiles serves the
+# sibling the client accepts with the original Content-Type
+# and ignores stale ones; the application compresses large
+# history responses and still answers If-None-Match with 304.
+# ----------------------------------------------------------
+
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services import compression, static_files
+from app.services.static_files import PrecompressedStaticFiles, precompress_static
+from main import app
+
+CSS = b"body { color: #123456; }\n" * 100
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_bytes(CSS)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" + b"\x00" * 2000)
+    (tmp_path / "tiny.js").write_bytes(b"let a;")
+    return tmp_path
+
+
+def static_client(directory):
+    mini = FastAPI()
+    mini.mount("/static", PrecompressedStaticFiles(directory=str(directory)), name="static")
+    return TestClient(mini)
+
+
+# ----------------------------------------------------------
+# Build step
+# ----------------------------------------------------------
+def test_precompress_writes_siblings_once(static_dir):
+    written = precompress_static(str(static_dir), min_size=100)
+
+    css = str(static_dir / "css" / "site.css")
+    assert css + ".gz" in written
+    assert gzip.decompress((static_dir / "css" / "site.css.gz").read_bytes()) == CSS
+    assert not (static_dir / "logo.png.gz").exists()  # not compressible
+    assert not (static_dir / "tiny.js.gz").exists()  # under min_size
+    if compression.brotli is not None:
+        assert compression.brotli.decompress((static_dir / "css" / "site.css.br").read_bytes()) == CSS
+
+    assert precompress_static(str(static_dir), min_size=100) == []
+
+    # Editing the source makes its siblings stale again
+    stat = os.stat(css)
+    os.utime(css, (stat.st_atime, stat.st_mtime + 10))
+    assert css + ".gz" in precompress_static(str(static_dir), min_size=100)
+
+
+def test_concurrent_workers_publish_whole_files(static_dir):
+    # Several workers precompressing the same tree at startup
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: precompress_static(str(static_dir)), range(8)))
+
+    assert gzip.decompress((static_dir / "css" / "site.css.gz").read_bytes()) == CSS
+    assert oct(os.stat(static_dir / "css" / "site.css.gz").st_mode & 0o777) == "0o644"
+    assert not list(static_dir.rglob("*.tmp"))
+
+
+def test_failed_write_leaves_no_temp_file(static_dir, monkeypatch):
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(static_files.os, "replace", boom)
+    with pytest.raises(OSError):
+        precompress_static(str(static_dir))
+    assert not list(static_dir.rglob("*.tmp"))
+    assert not (static_dir / "css" / "site.css.gz").exists()
+
+
+def test_cli(static_dir, capsys):
+    assert static_files.main(["precompress", str(static_dir)]) == 0
+    assert "Precompressed" in capsys.readouterr().out
+    assert static_files.main([]) == 2
+
+
+# ----------------------------------------------------------
+# Serving
+# ----------------------------------------------------------
+def test_serves_gzip_sibling_with_original_type(static_dir, monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    precompress_static(str(static_dir))
+    client = static_client(static_dir)
+
+    res = client.get("/static/css/site.css", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["content-type"].startswith("text/css")
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert res.content == CSS
+    assert int(res.headers["content-length"]) < len(CSS)
+
+    again = client.get(
+        "/static/css/site.css",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": res.headers["etag"]},
+    )
+    assert again.status_code == 304
+
+
+def test_serves_brotli_when_accepted(static_dir):
+    if compression.brotli is None:  # pragma: no cover
+        pytest.skip("brotli not installed")
+    precompress_static(str(static_dir))
+
+    res = static_client(static_dir).get(
+        "/static/css/site.css", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert res.headers["content-encoding"] == "br"
+    assert res.content == CSS
+
+
+def test_plain_file_without_acceptable_or_fresh_sibling(static_dir):
+    precompress_static(str(static_dir))
+    client = static_client(static_dir)
+
+    plain = client.get("/static/css/site.css", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert plain.content == CSS
+
+    # A sibling older than its source is never served
+    css = static_dir / "css" / "site.css"
+    stat = os.stat(css)
+    os.utime(css, (stat.st_atime, stat.st_mtime + 10))
+    stale = client.get("/static/css/site.css", headers={"Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in stale.headers
+
+    png = client.get("/static/logo.png", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in png.headers and "vary" not in png.headers
+
+
+# ----------------------------------------------------------
+# Application wiring
+# ----------------------------------------------------------
+def test_app_compresses_history_and_keeps_304():
+    with TestClient(app) as client:
+        client.post(
+            "/auth/register",
+            json={
+                "first_name": "Gzip",
+                "last_name": "User",
+                "username": "gzip_user",
+                "email": "gzip@ex.com",
+                "mobile": "8880001111",
+                "password": "Pass123A",
+                "confirm_password": "Pass123A",
+            },
+        )
+        token = client.post(
+            "/auth/login", json={"identifier": "gzip_user", "password": "Pass123A"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"}
+        client.post(
+            "/calculations/batch",
+            headers=headers,
+            json={"types": ["add"] * 40, "a": list(range(40)), "b": [1] * 40},
+        )
+
+        res = client.get("/calculations", headers=headers)
+        assert res.headers["content-encoding"] == "gzip"
+        assert len(res.json()) == 40
+        assert res.headers["etag"].startswith('W/"h')
+
+        again = client.get(
+            "/calculations", headers={**headers, "If-None-Match": res.headers["etag"]}
+        )
+        assert again.status_code == 304
+
+        css = client.get("/static/css/style.css", headers={"Accept-Encoding": "gzip"})
+        assert css.headers["content-encoding"] == "gzip"
+        assert css.headers["content-type"].startswith("text/css")
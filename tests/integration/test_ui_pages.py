@@ -0,0 +1,183 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Prerendered UI Page Tests
+# File: tests/integration/test_ui_pages.py
+# ----------------------------------------------------------
+# Description:
+# Every UI route (including /logout) serves its page from
+# app/services/page_cache.py: rendered once, revalidated with
+# ETag or Last-Modified, compressed once per encoding, and
+# in watch mode re-rendered only after a source file changed.
+# ----------------------------------------------------------
+
+import time
+from email.utils import formatdate
+
+import pytest
+from fastapi.templating import Jinja2Templates
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.routers import ui
+from app.services import compression
+from app.services.page_cache import PageCache
+from main import app
+
+ROUTES = {
+    "/": "Calculations App",
+    "/login": "login",
+    "/register": "register",
+    "/dashboard": "Calculations Dashboard",
+    "/logout": "logged out successfully",
+}
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    (tmp_path / "base.html").write_text("<main>{% block content %}{% endblock %}</main>")
+    (tmp_path / "page.html").write_text(
+        '{% extends "base.html" %}{% block content %}v1 ' + "x" * 2000 + "{% endblock %}"
+    )
+    return tmp_path
+
+
+def request_for(headers=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw})
+
+
+# ----------------------------------------------------------
+# Routes
+# ----------------------------------------------------------
+@pytest.mark.parametrize("path,text", ROUTES.items())
+def test_every_page_renders_and_revalidates(path, text):
+    client = TestClient(app)
+    res = client.get(path, headers={"Accept-Encoding": "identity"})
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/html")
+    assert text.lower() in res.text.lower()
+    assert res.headers["etag"].startswith('"p')
+    assert res.headers["cache-control"] == "no-cache"
+
+    again = client.get(path, headers={"Accept-Encoding": "identity",
+                                      "If-None-Match": res.headers["etag"]})
+    assert again.status_code == 304 and again.content == b""
+
+    since = client.get(path, headers={"Accept-Encoding": "identity",
+                                      "If-Modified-Since": res.headers["last-modified"]})
+    assert since.status_code == 304
+
+
+def test_pages_are_rendered_once(monkeypatch):
+    cache = PageCache(ui.templates)
+    monkeypatch.setattr(ui, "pages", cache)
+    calls = []
+    original = cache.render
+    monkeypatch.setattr(cache, "render", lambda name: calls.append(name) or original(name))
+
+    client = TestClient(app)
+    for _ in range(3):
+        client.get("/login")
+    assert calls == ["login.html"]
+
+    cache.warm(["login.html", "index.html"])
+    assert calls == ["login.html", "index.html"]
+
+
+# ----------------------------------------------------------
+# PageCache
+# ----------------------------------------------------------
+def test_conditional_headers(template_dir):
+    cache = PageCache(Jinja2Templates(directory=str(template_dir)))
+    page = cache.page("page.html")
+    assert b"v1" in page.body
+
+    plain = {"Accept-Encoding": "identity"}
+    assert cache.response("page.html", request_for({**plain, "If-None-Match": '"other"'})).status_code == 200
+    # If-None-Match wins over If-Modified-Since
+    assert cache.response("page.html", request_for({
+        **plain, "If-None-Match": '"other"', "If-Modified-Since": page.last_modified,
+    })).status_code == 200
+
+    older = formatdate(page.mtime - 60, usegmt=True)
+    assert cache.response("page.html", request_for({**plain, "If-Modified-Since": older})).status_code == 200
+    assert cache.response("page.html", request_for({**plain, "If-Modified-Since": "junk"})).status_code == 200
+
+
+def test_encoded_variants_are_cached(template_dir, monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    cache = PageCache(Jinja2Templates(directory=str(template_dir)))
+
+    first = cache.response("page.html", request_for({"Accept-Encoding": "gzip"}))
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].startswith('W/"p')
+    assert len(first.body) < len(cache.page("page.html").body)
+
+    second = cache.response("page.html", request_for({"Accept-Encoding": "gzip"}))
+    assert second.body is first.body  # compressed once
+
+    etag = first.headers["etag"]
+    assert cache.response(
+        "page.html", request_for({"Accept-Encoding": "gzip", "If-None-Match": etag})
+    ).status_code == 304
+
+
+def test_brotli_variant(template_dir):
+    if compression.brotli is None:  # pragma: no cover
+        pytest.skip("brotli not installed")
+    cache = PageCache(Jinja2Templates(directory=str(template_dir)))
+    res = cache.response("page.html", request_for({"Accept-Encoding": "br"}))
+    assert compression.brotli.decompress(res.body) == cache.page("page.html").body
+
+
+def watched_cache(template_dir, **kwargs):
+    kwargs.setdefault("check_interval", 0)
+    return PageCache(Jinja2Templates(directory=str(template_dir)), watch=True, **kwargs)
+
+
+def test_watch_mode_picks_up_template_edits(template_dir):
+    frozen = PageCache(Jinja2Templates(directory=str(template_dir)))
+    watched = watched_cache(template_dir)
+    frozen.page("page.html")
+    before = watched.page("page.html")
+
+    time.sleep(0.01)
+    (template_dir / "page.html").write_text(
+        '{% extends "base.html" %}{% block content %}v2{% endblock %}'
+    )
+    after = watched.page("page.html")
+
+    assert b"v2" in after.body and after.etag != before.etag
+    assert b"v1" in frozen.page("page.html").body
+
+
+def test_watch_mode_reuses_unchanged_pages(template_dir, monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    watched = watched_cache(template_dir)
+    calls = []
+    original = watched.render
+    monkeypatch.setattr(watched, "render", lambda name: calls.append(name) or original(name))
+
+    gz = request_for({"Accept-Encoding": "gzip"})
+    first = watched.response("page.html", gz)
+    second = watched.response("page.html", gz)
+    assert calls == ["page.html"]
+    assert second.body is first.body  # compressed variant kept
+
+    # A new file in a watched directory counts as a change too
+    (template_dir / "partial.html").write_text("new")
+    watched.response("page.html", gz)
+    assert calls == ["page.html", "page.html"]
+
+
+def test_watch_checks_are_throttled(template_dir, tmp_path_factory):
+    assets = tmp_path_factory.mktemp("assets")
+    watched = watched_cache(template_dir, watch_dirs=(str(assets),), check_interval=3600)
+    before = watched.page("page.html")
+
+    (assets / "app.js").write_text("edit")
+    assert watched.page("page.html") is before  # not rechecked yet
+
+    watched.check_interval = 0
+    assert watched.page("page.html") is not before
@@ -0,0 +1,53 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Batch Calculation Engine Tests
+# File: tests/unit/test_batch_operations.py
+# ----------------------------------------------------------
+# Description:
+# Unit tests for the columnar compute_batch() engine. Verifies
+# per-row results for every operation type, index-aligned
+# error reporting for unsupported types and division by zero,
+# and rejection of mismatched column lengths.
+# ----------------------------------------------------------
+
+import pytest
+from app.operations.batch import compute_batch
+
+
+# ----------------------------------------------------------
+# Mixed batch computes every supported operation
+# ----------------------------------------------------------
+def test_compute_batch_mixed_types():
+    results, errors = compute_batch(
+        ["add", "subtract", "multiply", "divide", " ADD "],
+        [5, 10, 3, 20, 1],
+        [3, 4, 7, 5, 2],
+    )
+
+    assert results == [8, 6, 21, 4.0, 3]
+    assert errors == []
+
+
+# ----------------------------------------------------------
+# Row-level errors are reported by index
+# ----------------------------------------------------------
+def test_compute_batch_reports_row_errors():
+    results, errors = compute_batch(
+        ["divide", "power", "divide", "add"],
+        [10, 2, 9, 1],
+        [0, 3, 3, 1],
+    )
+
+    assert results == [None, None, 3.0, 2]
+    assert errors == [
+        (0, "Division by zero"),
+        (1, "Unsupported calculation type"),
+    ]
+
+
+# ----------------------------------------------------------
+# Columns must be the same length
+# ----------------------------------------------------------
+def test_compute_batch_length_mismatch():
+    with pytest.raises(ValueError, match="same length"):
+        compute_batch(["add"], [1, 2], [3])
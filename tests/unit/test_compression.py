@@ -0,0 +1,232 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Response Compression Tests
+# File: tests/unit/test_compression.py
+# ----------------------------------------------------------
+# Description:
+# Unit tests for app/services/compression.py: Accept-Encoding
+# negotiation, the size threshold and type allowlist, already
+# encoded and bodyless responses passing through, ETags
+# weakened on compressed variants, and streaming bodies that
+# decompress chunk by chunk as they arrive (gzip and brotli).
+# ----------------------------------------------------------
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.services import compression
+from app.services.compression import CompressionMiddleware, negotiate, parse_types
+
+BIG = b'{"rows":[' + b",".join(b'{"id":%d,"type":"add"}' % i for i in range(200)) + b"]}"
+CHUNKS = [b"line %d\n" % i * 20 for i in range(5)]
+
+
+async def big_json(request):
+    return Response(BIG, media_type="application/json", headers={"ETag": '"v1"'})
+
+
+async def small_json(request):
+    return Response(b'{"ok":true}', media_type="application/json")
+
+
+async def big_png(request):
+    return Response(BIG, media_type="image/png")
+
+
+async def encoded(request):
+    return Response(gzip.compress(BIG), media_type="application/json",
+                    headers={"Content-Encoding": "gzip"})
+
+
+async def not_modified(request):
+    return Response(status_code=304, headers={"ETag": '"v1"'})
+
+
+async def stream(request):
+    async def body():
+        for chunk in CHUNKS:
+            yield chunk
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+def make_app():
+    app = Starlette(routes=[
+        Route("/big", big_json),
+        Route("/small", small_json),
+        Route("/png", big_png),
+        Route("/encoded", encoded),
+        Route("/304", not_modified),
+        Route("/stream", stream),
+    ])
+    return CompressionMiddleware(
+        app,
+        minimum_size=500,
+        content_types=parse_types("application/json, application/x-ndjson"),
+    )
+
+
+def raw_get(app, path, accept_encoding):
+    """Run one request through the ASGI app and collect sent messages."""
+    messages = []
+    requested = []
+
+    async def receive():
+        if requested:  # StreamingResponse waits here for a disconnect
+            await asyncio.Event().wait()
+        requested.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "scheme": "http", "http_version": "1.1",
+        "server": ("test", 80), "client": ("test", 1),
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+# ----------------------------------------------------------
+# Negotiation
+# ----------------------------------------------------------
+def test_negotiate_respects_q_values_and_wildcards():
+    both = ("br", "gzip")
+    assert negotiate("gzip, deflate, br", both) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", both) == "gzip"
+    assert negotiate("br;q=0, gzip", both) == "gzip"
+    assert negotiate("*", both) == "br"
+    assert negotiate("*;q=0.1, gzip;q=0", both) == "br"
+    assert negotiate("identity", both) is None
+    assert negotiate("gzip;q=bad", both) is None
+    assert negotiate("", both) is None
+    assert negotiate("br", ("gzip",)) is None
+    assert parse_types(" text/css ,,Application/JSON") == {"text/css", "application/json"}
+
+
+# ----------------------------------------------------------
+# Whole responses
+# ----------------------------------------------------------
+def test_large_allowlisted_body_is_gzipped():
+    client = TestClient(make_app())
+    res = client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert res.headers["etag"] == 'W/"v1"'
+    assert res.content == BIG  # decoded by the client
+    assert int(res.headers["content-length"]) < len(BIG)
+
+
+def test_brotli_preferred_when_installed():
+    if compression.brotli is None:  # pragma: no cover - brotli not installed
+        pytest.skip("brotli not installed")
+    messages = raw_get(make_app(), "/big", "gzip, br")
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"br"
+    assert compression.brotli.decompress(messages[1]["body"]) == BIG
+
+
+def test_gzip_only_without_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert compression.available_encodings() == ("gzip",)
+
+    messages = raw_get(make_app(), "/big", "br, gzip")
+    assert dict(messages[0]["headers"])[b"content-encoding"] == b"gzip"
+    assert raw_get(make_app(), "/big", "br")[1]["body"] == BIG
+
+
+@pytest.mark.parametrize("path", ["/small", "/png", "/encoded", "/304"])
+def test_passthrough_cases(path):
+    messages = raw_get(make_app(), path, "gzip")
+    headers = dict(messages[0]["headers"])
+
+    assert headers.get(b"content-encoding") in (None, b"gzip")
+    if path != "/encoded":
+        assert b"content-encoding" not in headers
+    if path == "/304":
+        assert headers[b"etag"] == b'"v1"'
+
+
+def test_non_http_scopes_pass_through():
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    asyncio.run(CompressionMiddleware(inner)({"type": "lifespan"}, None, None))
+    assert seen == ["lifespan"]
+
+
+# ----------------------------------------------------------
+# Streaming responses
+# ----------------------------------------------------------
+def test_stream_chunks_decompress_incrementally():
+    messages = raw_get(make_app(), "/stream", "gzip")
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+
+    inflate = zlib.decompressobj(31)
+    bodies = [m for m in messages[1:] if m.get("body")]
+    for chunk, message in zip(CHUNKS, bodies):
+        # Each flushed chunk is readable before the next one arrives
+        assert inflate.decompress(message["body"]) == chunk
+    assert gzip.decompress(b"".join(m["body"] for m in messages[1:])) == b"".join(CHUNKS)
+    assert messages[-1]["more_body"] is False
+
+
+def test_brotli_stream_decompresses_incrementally():
+    if compression.brotli is None:  # pragma: no cover
+        pytest.skip("brotli not installed")
+    messages = raw_get(make_app(), "/stream", "br")
+
+    decoder = compression.brotli.Decompressor()
+    bodies = [m for m in messages[1:] if m.get("body")]
+    for chunk, message in zip(CHUNKS, bodies):
+        assert decoder.process(message["body"]) == chunk
+
+
+def test_plain_text_not_in_allowlist_stays_plain():
+    app = CompressionMiddleware(
+        Starlette(routes=[Route("/", lambda r: PlainTextResponse("x" * 2000))]),
+        content_types={"application/json"},
+    )
+    res = TestClient(app).get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+
+
+def test_raw_bodies_without_or_with_misleading_length():
+    async def raw_app(scope, receive, send):
+        headers = [(b"content-type", b"application/json")]
+        if scope["path"] == "/chunked":
+            # Declares a length but streams anyway
+            headers.append((b"content-length", str(len(BIG)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if scope["path"] == "/chunked":
+            await send({"type": "http.response.body", "body": BIG[:100], "more_body": True})
+            await send({"type": "http.response.body", "body": BIG[100:]})
+        else:
+            await send({"type": "http.response.body", "body": b"{}"})
+
+    app = CompressionMiddleware(raw_app, minimum_size=500,
+                                content_types={"application/json"})
+
+    small = raw_get(app, "/small", "gzip")
+    assert b"content-encoding" not in dict(small[0]["headers"]) and small[1]["body"] == b"{}"
+
+    chunked = raw_get(app, "/chunked", "gzip")
+    headers = dict(chunked[0]["headers"])
+    assert b"content-length" not in headers
+    assert gzip.decompress(b"".join(m["body"] for m in chunked[1:])) == BIG
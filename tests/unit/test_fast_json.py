@@ -0,0 +1,75 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Fast JSON Encoding Tests
+# File: tests/unit/test_fast_json.py
+# ----------------------------------------------------------
+# Description:
+# Unit tests for app/services/fast_json.py: both the orjson
+# and the stdlib paths produce exactly what CalculationRead
+# would (naive and aware timestamps, whole and fractional
+# floats), as a JSON array, as NDJSON, and as a response.
+# ----------------------------------------------------------
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schemas.cal_schemas import CalculationRead
+from app.services import fast_json
+from app.services.fast_json import CALC_COLUMNS
+
+ROWS = [
+    (1, "add", 1.0, 2.0, 3.0, 7, datetime(2024, 1, 2, 3, 4, 5, 123456)),
+    (2, "divide", 1.0, 3.0, 1 / 3, 7, datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+    (3, "multiply", -2.5, 1e20, -2.5e20, 7, datetime(2024, 6, 1)),
+]
+
+
+def pydantic_json(rows):
+    """What the response_model path used to emit."""
+    return [
+        CalculationRead.model_validate(dict(zip(CALC_COLUMNS, r))).model_dump(mode="json")
+        for r in rows
+    ]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:  # pragma: no cover - orjson not installed
+        pytest.skip("orjson not installed")
+    assert fast_json.encoder_name() == request.param
+    return request.param
+
+
+def test_array_matches_response_model(encoder):
+    encoded = fast_json.dumps_calculations(ROWS)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == pydantic_json(ROWS)
+    assert fast_json.dumps_calculations([]) == b"[]"
+
+
+def test_ndjson_lines_match_response_model(encoder):
+    lines = fast_json.ndjson_calculations(ROWS).decode().splitlines()
+
+    assert [json.loads(line) for line in lines] == pydantic_json(ROWS)
+    assert fast_json.ndjson_calculations([]) == b""
+
+
+def test_both_encoders_emit_identical_values(monkeypatch):
+    if fast_json.orjson is None:  # pragma: no cover
+        pytest.skip("orjson not installed")
+    fast = json.loads(fast_json.dumps_calculations(ROWS))
+    monkeypatch.setattr(fast_json, "orjson", None)
+    assert json.loads(fast_json.dumps_calculations(ROWS)) == fast
+
+
+def test_response_carries_bytes_and_headers(encoder):
+    response = fast_json.calculations_response(ROWS[:1], {"X-Next-Cursor": "abc"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["x-next-cursor"] == "abc"
+    assert json.loads(response.body)[0]["created_at"] == "2024-01-02T03:04:05.123456"
@@ -0,0 +1,67 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Operation Registry Tests
+# File: tests/unit/test_operation_registry.py
+# ----------------------------------------------------------
+# Description:
+# Unit tests for the shared operation registry. Verifies name
+# resolution (exact, padded/mixed case, synonyms), rejection
+# of unsupported names, and that every arithmetic path in the
+# project dispatches to the same preresolved callables.
+# ----------------------------------------------------------
+
+import pytest
+
+from app.operations import registry
+from app.factory.calculation_factory import CalculationFactory
+from app.schemas.cal_schemas import CalculationCreate
+
+
+# ----------------------------------------------------------
+# Name resolution
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("add", "add"),
+        ("  Divide ", "divide"),
+        ("MULTIPLY", "multiply"),
+    ],
+)
+def test_resolve_canonical(raw, expected):
+    assert registry.resolve(raw) == expected
+
+
+def test_resolve_aliases_only_when_requested():
+    assert registry.resolve("minus", aliases=True) == "subtract"
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        registry.resolve("minus")
+
+
+@pytest.mark.parametrize("invalid", ["", "power", None])
+def test_resolve_unsupported(invalid):
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        registry.resolve(invalid)
+
+
+# ----------------------------------------------------------
+# Dispatch
+# ----------------------------------------------------------
+def test_compute_and_get_operation():
+    assert registry.compute("subtract", 10, 4) == 6
+    assert registry.get_operation("times", aliases=True)(3, 5) == 15
+
+
+def test_divide_by_zero():
+    with pytest.raises(ValueError, match="Division by zero"):
+        registry.compute("divide", 1, 0)
+
+
+def test_all_paths_share_registry_callables():
+    """Factory and schema must use the same callables."""
+    for name, func in registry.OPERATIONS.items():
+        assert CalculationFactory.create(name).compute is func
+
+    schema = CalculationCreate(type="Divide", a=9, b=3)
+    assert schema.type == "divide"
+    assert schema.result == 3
@@ -0,0 +1,140 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Assignment 13: Password Hashing Pool Tests
+# File: tests/unit/test_password_hasher.py
+# ----------------------------------------------------------
+# Description:
+# Unit tests for PasswordHasher: bcrypt round trip through a
+# real worker process, fast 503 rejection when the queue is
+# full, single-flight sharing of identical verifications,
+# recovery from a broken pool, and the metrics snapshot.
+# ----------------------------------------------------------
+
+import asyncio
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.auth import hashing
+from app.auth.hashing import HashingUnavailable, PasswordHasher
+
+
+@pytest.fixture
+def thread_hasher():
+    hasher = PasswordHasher(workers=0, queue_max=2)
+    yield hasher
+    hasher.shutdown()
+
+
+# ----------------------------------------------------------
+# Real process pool round trip
+# ----------------------------------------------------------
+def test_process_pool_round_trip():
+    hasher = PasswordHasher(workers=1, queue_max=4)
+    try:
+        hashed = hasher.hash("Secret123")
+        assert hasher.verify("Secret123", hashed)
+        assert not hasher.verify("wrong", hashed)
+        assert asyncio.run(hasher.verify_async("Secret123", hashed))
+    finally:
+        hasher.shutdown()
+
+    metrics = hasher.metrics()
+    assert metrics["submitted"] == 4
+    assert metrics["queue_depth"] == 0
+    assert metrics["hash"]["count"] == 1
+    assert metrics["verify"]["count"] == 3
+    assert metrics["verify"]["max_ms"] > 0
+
+
+# ----------------------------------------------------------
+# Bounded queue
+# ----------------------------------------------------------
+def test_full_queue_rejects_with_503(thread_hasher):
+    gate = threading.Event()
+    first = thread_hasher._submit("hash", gate.wait)
+    second = thread_hasher._submit("hash", gate.wait)
+
+    with pytest.raises(HashingUnavailable) as exc:
+        thread_hasher._submit("hash", gate.wait)
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == "1"
+
+    gate.set()
+    first.result()
+    second.result()
+
+    metrics = thread_hasher.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["peak_queue_depth"] == 2
+    assert metrics["queue_depth"] == 0
+
+
+# ----------------------------------------------------------
+# Single-flight verification
+# ----------------------------------------------------------
+def test_concurrent_identical_verifications_share_one_job(thread_hasher, monkeypatch):
+    calls = []
+
+    def slow_verify(raw, hashed):
+        calls.append(raw)
+        time.sleep(0.2)
+        return raw == "ok"
+
+    monkeypatch.setattr(hashing, "verify_password", slow_verify)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(thread_hasher.verify("ok", "h")))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [True] * 5
+    assert len(calls) == 1
+    assert thread_hasher.metrics()["shared"] == 4
+
+    # Different candidate passwords are never shared
+    assert thread_hasher.verify("nope", "h") is False
+    assert len(calls) == 2
+
+
+def test_async_hash(thread_hasher, monkeypatch):
+    monkeypatch.setattr(hashing, "hash_password", lambda pw: f"hashed:{pw}")
+    assert asyncio.run(thread_hasher.hash_async("pw")) == "hashed:pw"
+
+
+# ----------------------------------------------------------
+# Broken pool recovery
+# ----------------------------------------------------------
+class _BrokenExecutor:
+    def submit(self, fn, *args):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+def test_broken_pool_is_replaced(thread_hasher):
+    thread_hasher._executor = _BrokenExecutor()
+
+    with pytest.raises(HashingUnavailable):
+        thread_hasher.hash("pw")
+    assert thread_hasher._executor is None
+
+
+def test_broken_pool_while_waiting(thread_hasher):
+    def die():
+        raise BrokenProcessPool("worker died")
+
+    with pytest.raises(HashingUnavailable):
+        thread_hasher._result(thread_hasher._submit("hash", die))
+
+    with pytest.raises(HashingUnavailable):
+        asyncio.run(thread_hasher._aresult(thread_hasher._submit("hash", die)))
+    assert thread_hasher._executor is None